@@ -1,6 +1,10 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from backtesting.first_passage import FirstPassageIndex
+from backtesting.ledger import OUTCOME_CODES, TradeLedger, curve_metrics, summarize_trades
+from core.types import Action, ConsensusBatch, index_timestamps
 
 class BacktestEngine:
     """
@@ -9,48 +13,327 @@ class BacktestEngine:
     look-ahead bias by resolving trades based on subsequent OHLCV data.
     """
 
-    def __init__(self, initial_capital: float = 1000.0, risk_per_trade: float = 0.02):
+    # "array": contiguous NumPy-backed core (default, fast)
+    # "rows": reference iloc-based core, kept to validate the array core against
+    MODES = ("array", "rows")
+
+    def __init__(
+        self,
+        initial_capital: float = 1000.0,
+        risk_per_trade: float = 0.02,
+        mode: str = "array",
+        record_trades: bool = True,
+    ):
         """
         Args:
             initial_capital (float): Starting capital for the backtest.
             risk_per_trade (float): Fraction of capital to risk per trade (e.g., 0.02 for 2%).
+            mode (str): Simulation core to use, one of MODES (default 'array').
+            record_trades (bool): Build the 'trades' list of dicts. When False, trades are only
+                                  returned as the columnar 'ledger' (cheaper for sweeps).
+
+        Raises:
+            ValueError: If the mode is unknown.
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Fatal error: Unknown engine mode '{mode}'. Expected one of {self.MODES}.")
         self.initial_capital = initial_capital
         self.risk_per_trade = risk_per_trade
+        self.mode = mode
+        self.record_trades = record_trades
 
-    def run(self, processed_df: pd.DataFrame, signals: List[dict], ticker: str, config: dict = None) -> Dict[str, Any]:
+    def run(
+        self,
+        processed_df: pd.DataFrame,
+        signals: Union[List[dict], ConsensusBatch],
+        ticker: str,
+        config: dict = None,
+    ) -> Dict[str, Any]:
         """
         Executes the backtest simulation.
 
         Args:
             processed_df (pd.DataFrame): Market data containing OHLCV and technical features.
-            signals (List[dict]): List of consensus signals from the orchestrator.
+            signals (Union[List[dict], ConsensusBatch]): Consensus signals from the orchestrator,
+                either as get_consensus() dicts or as the columnar output of get_consensus_batch().
             ticker (str): The asset being tested.
             config (dict, optional): Market configuration mapping (ATR multiplier, cooldown, etc.).
 
         Returns:
-            dict: Performance metrics and detailed trade history.
+            dict: Performance metrics and detailed trade history ('trades' dicts and the
+                  columnar 'ledger'), plus the per-candle mark-to-market 'equity_curve' and
+                  its 'sharpe', 'sortino', 'calmar', 'exposure' and 'max_drawdown_mtm'.
         """
         if config is None:
             config = {}
-            
+
+        if len(signals) == 0:
+            return self._empty_result(ticker, processed_df.index)
+
+        if self.mode == "rows":
+            if isinstance(signals, ConsensusBatch):
+                signals = signals.to_records()
+            return self._run_rows(processed_df, signals, ticker, config)
+
+        aligned = self.align_signals(processed_df, signals)
+        if aligned is None:
+            return self._empty_result(ticker, processed_df.index)
+
+        row_actions, row_confidences, start_idx = aligned
+        return self._run_arrays(processed_df, row_actions, row_confidences, start_idx, ticker, config)
+
+    @staticmethod
+    def align_signals(
+        processed_df: pd.DataFrame, signals: Union[List[dict], ConsensusBatch]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Scatters signals (a ConsensusBatch or get_consensus() dicts) onto the candle positions of processed_df.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray, int]]: Per-candle actions (0 when no signal),
+            per-candle confidences and the position of the first signal,
+            or None if the first signal is not in the data.
+        """
+        if isinstance(signals, ConsensusBatch):
+            return BacktestEngine._align_batch(processed_df, signals)
+        return BacktestEngine._align_records(processed_df, signals)
+
+    @staticmethod
+    def _align_batch(processed_df: pd.DataFrame, batch: ConsensusBatch) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Scatters a ConsensusBatch onto the candle positions of processed_df.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray, int]]: Per-candle actions (0 when no signal),
+            per-candle confidences and the position of the first signal,
+            or None if the first signal is not in the data.
+        """
+        positions = BacktestEngine._locate(processed_df.index, batch.timestamps(), batch.index)
+        return BacktestEngine._scatter(len(processed_df), positions, batch.actions, batch.confidences)
+
+    @staticmethod
+    def _align_records(processed_df: pd.DataFrame, signals: List[dict]) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Same as _align_batch() for get_consensus() dicts.
+
+        Signals are located by their int64 'Timestamp' (epoch nanoseconds) when present,
+        otherwise by parsing their 'Datetime' (or 'Date') labels once for the whole list.
+        """
+        labels = [s.get("Datetime", s.get("Date")) for s in signals]
+        keys = None
+        if all("Timestamp" in s for s in signals):
+            keys = np.fromiter((s["Timestamp"] for s in signals), dtype=np.int64, count=len(signals))
+        elif isinstance(processed_df.index, pd.DatetimeIndex):
+            try:
+                keys = index_timestamps(pd.DatetimeIndex(pd.to_datetime(labels, format="ISO8601")))
+            except (TypeError, ValueError):
+                keys = None
+
+        positions = BacktestEngine._locate(processed_df.index, keys, pd.Index(labels))
+        actions = np.array([Action[s["Signal"]].value for s in signals], dtype=np.int8)
+        confidences = np.array([s.get("Confiance", 0.0) for s in signals], dtype=np.float64)
+        return BacktestEngine._scatter(len(processed_df), positions, actions, confidences)
+
+    @staticmethod
+    def _locate(index: pd.Index, keys: Optional[np.ndarray], labels: pd.Index) -> np.ndarray:
+        """
+        Finds the candle position of every signal (-1 when the candle is missing).
+
+        Datetime candles are matched on int64 epoch nanoseconds with a binary search
+        over the (chronological) index. Other indexes fall back to a label lookup.
+        """
+        if index.equals(labels):
+            # Signals computed on the very same candles (get_consensus_batch on processed_df)
+            return np.arange(len(index))
+
+        candle_keys = index_timestamps(index)
+        if candle_keys is None or keys is None:
+            if not isinstance(index, pd.DatetimeIndex) and labels.inferred_type == "string":
+                # Signals only carry the label as text (e.g. integer or period indexes)
+                return index.astype(str).get_indexer(labels)
+            return index.get_indexer(labels)
+
+        if not index.is_monotonic_increasing:
+            return pd.Index(candle_keys).get_indexer(keys)
+
+        positions = np.searchsorted(candle_keys, keys)
+        clipped = np.minimum(positions, len(candle_keys) - 1)
+        found = (positions < len(candle_keys)) & (candle_keys[clipped] == keys)
+        return np.where(found, positions, -1)
+
+    @staticmethod
+    def _scatter(
+        n: int,
+        positions: np.ndarray,
+        actions: np.ndarray,
+        confidences: np.ndarray,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Lays signals out as per-candle action/confidence lists (WAIT / 0.0 where none).
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray, int]]: Per-candle int8 actions, float64 confidences and
+            the position of the first signal, or None if the first signal is not in the data.
+        """
+        if n == 0 or len(positions) == 0 or positions[0] < 0:
+            return None
+
+        found = positions >= 0
+        row_actions = np.zeros(n, dtype=np.int8)
+        row_confidences = np.zeros(n, dtype=np.float64)
+        row_actions[positions[found]] = actions[found]
+        row_confidences[positions[found]] = confidences[found]
+        return row_actions, row_confidences, int(positions[0])
+
+    def _run_arrays(
+        self,
+        processed_df: pd.DataFrame,
+        row_actions: np.ndarray,
+        row_confidences: np.ndarray,
+        start_idx: int,
+        ticker: str,
+        config: dict,
+    ) -> Dict[str, Any]:
+        """
+        Array-backed simulation core, event-driven.
+
+        Runs the exact same state machine as `_run_rows`, but only visits the
+        candles where something can happen:
+        - while flat, it jumps from one tradable signal to the next, ticking the
+          cooldown down by the number of candles skipped;
+        - while in a position, FirstPassageIndex jumps straight to the candle
+          where SL or TP is crossed.
+        The cost therefore scales with the number of signals and trades rather
+        than with the number of candles. Trades are collected as TradeLedger rows;
+        candle dates are only formatted if trade dicts are requested.
+        """
         atr_sl_multiplier = config.get("atr_sl_multiplier", 1.5)
         rr_ratio = config.get("rr_ratio", 2.0)
         min_confidence = config.get("min_confidence", 0.50)
         cooldown_candles = config.get("cooldown_candles", 6)
         cooldown_override = config.get("cooldown_override_confidence", 0.70)
-        
+
+        n = len(processed_df)
+        highs = processed_df["high"].to_numpy(dtype=np.float64)
+        lows = processed_df["low"].to_numpy(dtype=np.float64)
+        closes = processed_df["close"].to_numpy(dtype=np.float64)
+        if "ATR_14" in processed_df.columns:
+            atrs = processed_df["ATR_14"].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            atrs = np.full(n, np.nan)
+        index = processed_df.index
+        passage = FirstPassageIndex(lows, highs)
+
+        # Candles holding a signal that passes the static filters (direction, confidence, ATR).
+        # A NaN confidence or ATR fails its comparison, as in the scalar checks of _run_rows().
+        tradable = (row_actions != 0) & (row_confidences >= min_confidence) & (atrs > 0)
+        tradable[:start_idx] = False
+        signal_positions = np.flatnonzero(tradable).tolist()
+        next_signal = 0
+
         capital = self.initial_capital
         peak_capital = capital
         max_drawdown = 0.0
-        
-        trades = []
-        is_in_position = False
-        current_trade = None
-        
-        if not signals:
-            return self._empty_result(ticker)
-            
+
+        ledger_rows = []
+        active_cooldown = 0
+
+        # Candle i is always a flat candle here (cooldown tick, then signal check)
+        i = start_idx
+        while i < n:
+            if active_cooldown > 0:
+                active_cooldown -= 1
+
+            pending = False
+            confidence = float(row_confidences[i])
+            if tradable[i] and not (active_cooldown > 0 and confidence < cooldown_override):
+                action = int(row_actions[i])
+                entry = float(closes[i])
+                atr = float(atrs[i])
+                if action == Action.BUY.value:
+                    sl = entry - (atr * atr_sl_multiplier)
+                    tp = entry + (atr * atr_sl_multiplier * rr_ratio)
+                    risk_per_unit = entry - sl
+                else:
+                    sl = entry + (atr * atr_sl_multiplier)
+                    tp = entry - (atr * atr_sl_multiplier * rr_ratio)
+                    risk_per_unit = sl - entry
+
+                if risk_per_unit > 0:
+                    money_at_risk = capital * self.risk_per_trade
+                    position_size = money_at_risk / risk_per_unit
+                    pending = True
+
+            if not pending:
+                # Skip to the next tradable signal; every skipped candle ticks the cooldown
+                while next_signal < len(signal_positions) and signal_positions[next_signal] <= i:
+                    next_signal += 1
+                if next_signal == len(signal_positions):
+                    break
+                target = signal_positions[next_signal]
+                active_cooldown = max(active_cooldown - (target - i - 1), 0)
+                i = target
+                continue
+
+            # The entry executes at the start of the next candle (discarded on the last one)
+            if i + 1 >= n:
+                break
+            is_buy = action == Action.BUY.value
+            if is_buy:
+                exit_idx = passage.first_cross(i + 1, sl, tp)
+            else:
+                exit_idx = passage.first_cross(i + 1, tp, sl)
+
+            if exit_idx >= n:
+                # Handle open positions at the end of the simulation
+                exit_price = float(closes[-1])
+                pnl = (exit_price - entry if is_buy else entry - exit_price) * position_size
+                capital += pnl
+                ledger_rows.append((i, n - 1, action, entry, sl, tp, position_size, confidence,
+                                    exit_price, pnl, OUTCOME_CODES['OPEN']))
+                break
+
+            # Pessimistic execution: SL wins if both are triggered in the same candle
+            sl_hit = lows[exit_idx] <= sl if is_buy else highs[exit_idx] >= sl
+            if sl_hit:
+                exit_price = sl
+                outcome = 'LOSS'
+            else:
+                exit_price = tp
+                outcome = 'WIN'
+
+            if is_buy:
+                pnl = (exit_price - entry) * position_size
+            else:
+                pnl = (entry - exit_price) * position_size
+
+            capital += pnl
+            if capital > peak_capital:
+                peak_capital = capital
+
+            dd = (peak_capital - capital) / peak_capital
+            if dd > max_drawdown:
+                max_drawdown = dd
+
+            ledger_rows.append((i, exit_idx, action, entry, sl, tp, position_size, confidence,
+                                exit_price, pnl, OUTCOME_CODES[outcome]))
+
+            if outcome == 'LOSS':
+                active_cooldown = cooldown_candles
+
+            # The exit candle is flat again: it ticks the cooldown and may hold a new signal
+            i = exit_idx
+
+        ledger = TradeLedger.from_rows(ledger_rows, index, ticker)
+        return self._finalize(processed_df, ledger, capital, max_drawdown, start_idx)
+
+    def _run_rows(self, processed_df: pd.DataFrame, signals: List[dict], ticker: str, config: dict) -> Dict[str, Any]:
+        """
+        Reference row-by-row simulation core.
+
+        Walks the DataFrame with `iloc` one candle at a time. Kept as the
+        readable reference implementation the array core is validated against.
+        """
         # Map signals by Datetime for O(1) chronological lookup during iteration
         signal_map = {s.get("Datetime", s["Date"]): s for s in signals}
         first_signal_key = signals[0].get("Datetime", signals[0]["Date"])
@@ -61,12 +344,28 @@ class BacktestEngine:
         # Determine the df index where simulation begins
         start_indices = np.where(df_dates == first_signal_key)[0]
         if len(start_indices) == 0:
-            return self._empty_result(ticker)
+            return self._empty_result(ticker, processed_df.index)
             
         start_idx = start_indices[0]
+
+        atr_sl_multiplier = config.get("atr_sl_multiplier", 1.5)
+        rr_ratio = config.get("rr_ratio", 2.0)
+        min_confidence = config.get("min_confidence", 0.50)
+        cooldown_candles = config.get("cooldown_candles", 6)
+        cooldown_override = config.get("cooldown_override_confidence", 0.70)
+        
+        capital = self.initial_capital
+        peak_capital = capital
+        max_drawdown = 0.0
+        
+        trades = []
+        is_in_position = False
+        current_trade = None
         
         pending_entry = None
         active_cooldown = 0
+        # (signal position, exit position) of every trade, for the ledger
+        positions = []
         for i in range(start_idx, len(processed_df)):
             row = processed_df.iloc[i]
             date_str = df_dates.iloc[i]
@@ -74,6 +373,7 @@ class BacktestEngine:
             # a. Activate pending_entry if exists (= enter position at start of this candle)
             if pending_entry is not None and not is_in_position:
                 current_trade = pending_entry
+                current_entry_idx = pending_entry_idx
                 is_in_position = True
                 pending_entry = None
 
@@ -123,6 +423,7 @@ class BacktestEngine:
                     current_trade['pnl'] = pnl
                     current_trade['outcome'] = outcome
                     trades.append(current_trade)
+                    positions.append((current_entry_idx, i))
                     is_in_position = False
                     
                     if outcome == 'LOSS':
@@ -169,6 +470,7 @@ class BacktestEngine:
                             money_at_risk = capital * self.risk_per_trade
                             position_size = money_at_risk / risk_per_unit
                             
+                            pending_entry_idx = i
                             pending_entry = {
                                 'ticker': ticker,
                                 'entry_date': date_str,
@@ -183,45 +485,78 @@ class BacktestEngine:
         # Handle open positions at the end of the simulation
         if is_in_position and current_trade is not None:
             exit_price = float(processed_df.iloc[-1]['close'])
-            outcome = 'OPEN'
-            
-            if current_trade['direction'] == 'BUY':
-                pnl = (exit_price - current_trade['entry']) * current_trade['position_size']
-            else:
-                pnl = (current_trade['entry'] - exit_price) * current_trade['position_size']
-                
-            capital += pnl
-            current_trade['exit_date'] = str(df_dates.iloc[-1])
-            current_trade['exit_price'] = exit_price
-            current_trade['pnl'] = pnl
-            current_trade['outcome'] = outcome
-            trades.append(current_trade)
-
-        nb_trades = len(trades)
-        resolved_trades = [t for t in trades if t['outcome'] != 'OPEN']
-        nb_resolved = len(resolved_trades)
-        wins = [t for t in resolved_trades if t['outcome'] == 'WIN']
-        win_rate = len(wins) / nb_resolved if nb_resolved > 0 else 0.0
-        
-        gross_profit = sum(t['pnl'] for t in resolved_trades if t['pnl'] > 0)
-        gross_loss = abs(sum(t['pnl'] for t in resolved_trades if t['pnl'] < 0))
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else (float('inf') if gross_profit > 0 else 0.0)
-        
-        total_return = (capital - self.initial_capital) / self.initial_capital
-        
-        return {
-            'ticker': ticker,
-            'initial_capital': self.initial_capital,
-            'capital_final': capital,
-            'total_return': total_return,
-            'win_rate': win_rate,
-            'max_drawdown': max_drawdown,
-            'profit_factor': profit_factor,
-            'nb_trades': nb_trades,
-            'trades': trades
-        }
-        
-    def _empty_result(self, ticker: str) -> dict:
+            capital = self._close_open_trade(current_trade, exit_price, str(df_dates.iloc[-1]), capital, trades)
+            positions.append((current_entry_idx, len(processed_df) - 1))
+
+        ledger = TradeLedger.from_rows(
+            [
+                (entry_idx, exit_idx, Action[t['direction']].value, t['entry'], t['sl'], t['tp'],
+                 t['position_size'], t['confidence'], t['exit_price'], t['pnl'], OUTCOME_CODES[t['outcome']])
+                for t, (entry_idx, exit_idx) in zip(trades, positions)
+            ],
+            processed_df.index,
+            ticker,
+        )
+        return self._finalize(processed_df, ledger, capital, max_drawdown, start_idx, trades)
+
+    @staticmethod
+    def _close_open_trade(trade: dict, exit_price: float, exit_date: str, capital: float, trades: List[dict]) -> float:
+        """
+        Marks a still-open position to the last close and appends it as an 'OPEN' trade.
+
+        Returns:
+            float: The capital after booking the unrealized PnL.
+        """
+        if trade['direction'] == 'BUY':
+            pnl = (exit_price - trade['entry']) * trade['position_size']
+        else:
+            pnl = (trade['entry'] - exit_price) * trade['position_size']
+
+        trade['exit_date'] = exit_date
+        trade['exit_price'] = exit_price
+        trade['pnl'] = pnl
+        trade['outcome'] = 'OPEN'
+        trades.append(trade)
+        return capital + pnl
+
+    def _finalize(
+        self,
+        processed_df: pd.DataFrame,
+        ledger: TradeLedger,
+        capital: float,
+        max_drawdown: float,
+        start_idx: int,
+        trades: Optional[List[dict]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the result dictionary of a simulation core from its TradeLedger.
+
+        Adds the ledger, the per-candle mark-to-market equity curve (from the first
+        signal onwards) and the metrics computed from it. The trade dicts are built
+        from the ledger unless the engine was created with record_trades=False.
+        """
+        if not self.record_trades:
+            trades = []
+        elif trades is None:
+            trades = ledger.to_records()
+
+        closes = processed_df["close"].to_numpy(dtype=np.float64)
+        equity = pd.Series(
+            ledger.mark_to_market(closes, self.initial_capital)[start_idx:],
+            index=processed_df.index[start_idx:],
+            name="equity",
+        )
+        held_candles = int(np.sum(ledger["exit_idx"] - ledger["entry_idx"]))
+        exposure = held_candles / len(equity) if len(equity) else 0.0
+
+        result = summarize_trades(ledger.ticker, trades, self.initial_capital, capital, max_drawdown, ledger)
+        result.update(curve_metrics(equity, exposure))
+        result['ledger'] = ledger
+        result['equity_curve'] = equity
+        return result
+
+    def _empty_result(self, ticker: str, index: Optional[pd.Index] = None) -> dict:
+        index = index if index is not None else pd.Index([])
         return {
             'ticker': ticker,
             'initial_capital': self.initial_capital,
@@ -231,9 +566,16 @@ class BacktestEngine:
             'max_drawdown': 0.0,
             'profit_factor': 0.0,
             'nb_trades': 0,
-            'trades': []
+            'trades': [],
+            'sharpe': 0.0,
+            'sortino': 0.0,
+            'calmar': 0.0,
+            'exposure': 0.0,
+            'max_drawdown_mtm': 0.0,
+            'ledger': TradeLedger.empty(index, ticker),
+            'equity_curve': pd.Series(dtype=np.float64, name="equity"),
         }
-        
+
     def print_report(self, result: Dict[str, Any]):
         """
         Outputs a beautifully formatted terminal report of the simulated strategy.
@@ -253,6 +595,10 @@ class BacktestEngine:
         print(f"Win Rate:         {result['win_rate']*100:.2f}%")
         print(f"Max Drawdown:     \033[91m{result['max_drawdown']*100:.2f}%\033[0m")
         print(f"Profit Factor:    {result['profit_factor']:.2f}")
+        if 'sharpe' in result:
+            print(f"Sharpe / Sortino: {result['sharpe']:.2f} / {result['sortino']:.2f}")
+            print(f"Calmar Ratio:     {result['calmar']:.2f}")
+            print(f"Exposure:         {result['exposure']*100:.2f}%")
         print(f"Total Trades:     {result['nb_trades']}")
         
         if result['nb_trades'] > 0:
@@ -0,0 +1,98 @@
+import numpy as np
+
+
+class FirstPassageIndex:
+    """
+    Finds the first candle where the price leaves a [lower, upper] band.
+
+    The lows and highs are summarized once into per-block extrema (block minimum of
+    the lows, block maximum of the highs). A query only inspects candles inside the
+    first block that can contain a crossing, so locating the exit of a position costs
+    O(duration / block_size + block_size) instead of one comparison per held candle.
+    NaN prices never count as a crossing, like the `low <= sl` checks of the engine.
+    """
+
+    # Candles checked one by one before switching to the block search (most trades are short)
+    PROBE = 8
+
+    def __init__(self, lows: np.ndarray, highs: np.ndarray, block_size: int = 64):
+        """
+        Args:
+            lows (np.ndarray): Low price of every candle.
+            highs (np.ndarray): High price of every candle.
+            block_size (int): Number of candles summarized by one block extremum.
+
+        Raises:
+            ValueError: If the arrays differ in length or block_size is not positive.
+        """
+        if block_size <= 0:
+            raise ValueError("Fatal error: block_size must be positive.")
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        if self.lows.shape != self.highs.shape:
+            raise ValueError(
+                f"Fatal error: lows and highs lengths differ: {self.lows.shape} vs {self.highs.shape}"
+            )
+        self.block_size = block_size
+        self.n = len(self.lows)
+
+        if self.n:
+            starts = np.arange(0, self.n, block_size)
+            self.block_lows = np.fmin.reduceat(self.lows, starts)
+            self.block_highs = np.fmax.reduceat(self.highs, starts)
+        else:
+            self.block_lows = self.block_highs = np.empty(0)
+
+    def first_cross(self, start: int, lower: float, upper: float) -> int:
+        """
+        Returns the first position >= start where low <= lower or high >= upper.
+
+        Args:
+            start (int): First candle to inspect.
+            lower (float): Level crossed when a low reaches it (SL of a BUY, TP of a SELL).
+            upper (float): Level crossed when a high reaches it (TP of a BUY, SL of a SELL).
+
+        Returns:
+            int: The candle position, or len(lows) if the band is never left.
+        """
+        n = self.n
+        lows, highs = self.lows, self.highs
+
+        probe_end = min(start + self.PROBE, n)
+        for i in range(start, probe_end):
+            if lows[i] <= lower or highs[i] >= upper:
+                return i
+        if probe_end == n:
+            return n
+
+        # Rest of the current block
+        size = self.block_size
+        block = probe_end // size
+        block_end = min((block + 1) * size, n)
+        hit = self._scan(probe_end, block_end, lower, upper)
+        if hit is not None:
+            return hit
+
+        # Whole blocks, inspected in growing spans so short trades stay cheap
+        nb_blocks = len(self.block_lows)
+        block += 1
+        span = 8
+        while block < nb_blocks:
+            stop = min(block + span, nb_blocks)
+            crossed = np.flatnonzero(
+                (self.block_lows[block:stop] <= lower) | (self.block_highs[block:stop] >= upper)
+            )
+            if len(crossed):
+                first = (block + int(crossed[0])) * size
+                # The block extremum guarantees a crossing inside this block
+                return self._scan(first, min(first + size, n), lower, upper)
+            block = stop
+            span *= 2
+        return n
+
+    def _scan(self, start: int, stop: int, lower: float, upper: float):
+        """
+        Vectorized check of the candles [start, stop); None if nothing crosses.
+        """
+        hits = np.flatnonzero((self.lows[start:stop] <= lower) | (self.highs[start:stop] >= upper))
+        return start + int(hits[0]) if len(hits) else None
@@ -0,0 +1,321 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.types import Action
+
+# Outcome codes of the ledger 'outcome' column
+OUTCOME_CODES = {"LOSS": -1, "OPEN": 0, "WIN": 1}
+OUTCOME_NAMES = {code: name for name, code in OUTCOME_CODES.items()}
+
+# Column name → dtype, in ledger order
+LEDGER_COLUMNS = {
+    "entry_idx": np.int64,      # candle position of the signal (entry at its close)
+    "exit_idx": np.int64,       # candle position where the trade was closed
+    "direction": np.int8,       # Action value (1 BUY, -1 SELL)
+    "entry": np.float64,
+    "sl": np.float64,
+    "tp": np.float64,
+    "position_size": np.float64,
+    "confidence": np.float64,
+    "exit_price": np.float64,
+    "pnl": np.float64,
+    "outcome": np.int8,         # OUTCOME_CODES
+}
+
+
+class TradeLedger:
+    """
+    Columnar trade history of one backtest.
+
+    Every column is a contiguous 1-D NumPy array (see LEDGER_COLUMNS), which keeps
+    millions of trades compact and lets them be handed to Arrow without copying.
+    Candle positions are stored instead of dates; the readable trade dicts of
+    BacktestEngine are only built on demand by to_records().
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], index: pd.Index, ticker: str):
+        """
+        Args:
+            columns (Dict[str, np.ndarray]): One array per LEDGER_COLUMNS key, all the same length.
+            index (pd.Index): Candle labels the positions refer to.
+            ticker (str): The traded asset.
+
+        Raises:
+            KeyError: If a ledger column is missing.
+            ValueError: If the columns differ in length.
+        """
+        missing = [name for name in LEDGER_COLUMNS if name not in columns]
+        if missing:
+            raise KeyError(f"Fatal error: Ledger columns missing: {missing}")
+
+        self.columns = {
+            name: np.ascontiguousarray(columns[name], dtype=dtype) for name, dtype in LEDGER_COLUMNS.items()
+        }
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Fatal error: Ledger columns lengths differ: {sorted(lengths)}")
+        self.index = index
+        self.ticker = ticker
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple], index: pd.Index, ticker: str) -> 'TradeLedger':
+        """
+        Builds a ledger from per-trade tuples laid out in LEDGER_COLUMNS order.
+        """
+        if len(rows) == 0:
+            return cls.empty(index, ticker)
+        transposed = list(zip(*rows))
+        return cls(dict(zip(LEDGER_COLUMNS, transposed)), index, ticker)
+
+    @classmethod
+    def empty(cls, index: pd.Index, ticker: str) -> 'TradeLedger':
+        return cls({name: np.empty(0, dtype=dtype) for name, dtype in LEDGER_COLUMNS.items()}, index, ticker)
+
+    def __len__(self) -> int:
+        return len(self.columns["pnl"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """
+        Rebuilds the BacktestEngine trade dictionary of a single trade.
+        """
+        c = self.columns
+        return {
+            'ticker': self.ticker,
+            'entry_date': str(self.index[c["entry_idx"][position]]),
+            'direction': Action(int(c["direction"][position])).name,
+            'entry': float(c["entry"][position]),
+            'sl': float(c["sl"][position]),
+            'tp': float(c["tp"][position]),
+            'position_size': float(c["position_size"][position]),
+            'confidence': float(c["confidence"][position]),
+            'exit_date': str(self.index[c["exit_idx"][position]]),
+            'exit_price': float(c["exit_price"][position]),
+            'pnl': float(c["pnl"][position]),
+            'outcome': OUTCOME_NAMES[int(c["outcome"][position])],
+        }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Expands the ledger into the list-of-dicts format of BacktestEngine.run()['trades'].
+        """
+        return [self.record(i) for i in range(len(self))]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the ledger as a DataFrame, with the entry and exit candle labels resolved.
+        """
+        frame = pd.DataFrame(self.columns, copy=False)
+        frame.insert(0, "entry_date", self.index[self.columns["entry_idx"]])
+        frame.insert(1, "exit_date", self.index[self.columns["exit_idx"]])
+        return frame
+
+    def to_arrow(self):
+        """
+        Exports the ledger as a pyarrow Table.
+
+        The NumPy columns are wrapped without copying (fixed-width types, no nulls);
+        the entry/exit dates are added as timestamp columns when the index is datetime-based.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa = _require_pyarrow()
+        arrays = [pa.array(values) for values in self.columns.values()]
+        names = list(self.columns)
+        if isinstance(self.index, pd.DatetimeIndex):
+            for name in ("exit_date", "entry_date"):
+                labels = self.index[self.columns[name.replace("date", "idx")]]
+                arrays.insert(0, pa.array(labels))
+                names.insert(0, name)
+        table = pa.Table.from_arrays(arrays, names=names)
+        return table.replace_schema_metadata({"ticker": self.ticker})
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Writes the ledger to a Parquet file (see to_arrow()).
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        pq.write_table(self.to_arrow(), path)
+
+    def mark_to_market(self, closes: np.ndarray, initial_capital: float) -> np.ndarray:
+        """
+        Per-candle equity: initial capital + realized PnL + PnL of the open position at the close.
+
+        A position is held from the candle after its signal up to its exit candle, where
+        the PnL is realized at the exit price. Only one position is open at a time.
+
+        Args:
+            closes (np.ndarray): Close price of every candle of the ledger index.
+            initial_capital (float): Capital before the first trade.
+
+        Returns:
+            np.ndarray: Equity at the close of every candle.
+        """
+        n = len(closes)
+        c = self.columns
+        realized = np.zeros(n)
+        np.add.at(realized, c["exit_idx"], c["pnl"])
+        equity = initial_capital + np.cumsum(realized)
+
+        # Candles strictly inside a holding period [entry_idx + 1, exit_idx)
+        starts = c["entry_idx"] + 1
+        lengths = np.maximum(c["exit_idx"] - starts, 0)
+        if lengths.sum():
+            trade = np.repeat(np.arange(len(self)), lengths)
+            offsets = np.arange(len(trade)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            held = starts[trade] + offsets
+            marks = pd.Series(closes).ffill().to_numpy()
+            equity[held] += (
+                (marks[held] - c["entry"][trade]) * c["position_size"][trade] * c["direction"][trade]
+            )
+        return equity
+
+
+def _require_pyarrow():
+    """
+    Imports pyarrow, which is only needed to export ledgers.
+    """
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "Fatal error: pyarrow is required to export the trade ledger (pip install pyarrow)."
+        ) from exc
+    return pyarrow
+
+
+def trade_stats(pnl: np.ndarray, outcomes: np.ndarray) -> Tuple[float, float]:
+    """
+    Win rate and profit factor of the resolved (non-OPEN) trades.
+
+    Args:
+        pnl (np.ndarray): Realized PnL of every trade.
+        outcomes (np.ndarray): OUTCOME_CODES of every trade.
+
+    Returns:
+        Tuple[float, float]: (win_rate, profit_factor).
+    """
+    resolved = outcomes != OUTCOME_CODES['OPEN']
+    nb_resolved = int(resolved.sum())
+    nb_wins = int((outcomes == OUTCOME_CODES['WIN']).sum())
+    win_rate = nb_wins / nb_resolved if nb_resolved > 0 else 0.0
+
+    gross_profit = sum(pnl[resolved & (pnl > 0)].tolist())
+    gross_loss = abs(sum(pnl[resolved & (pnl < 0)].tolist()))
+    profit_factor = gross_profit / gross_loss if gross_loss > 0 else (float('inf') if gross_profit > 0 else 0.0)
+    return win_rate, profit_factor
+
+
+def summarize_trades(
+    ticker: str,
+    trades: List[dict],
+    initial_capital: float,
+    capital: float,
+    max_drawdown: float,
+    ledger: Optional[TradeLedger] = None,
+) -> Dict[str, Any]:
+    """
+    Base result dictionary of a backtest, shared by every simulation driver
+    (BacktestEngine, PortfolioBacktester, WalkForwardOptimizer).
+
+    Args:
+        ticker (str): The traded asset (or a label such as "PORTFOLIO").
+        trades (List[dict]): Trade dicts, as built by TradeLedger.to_records().
+        initial_capital (float): Starting capital.
+        capital (float): Final capital.
+        max_drawdown (float): Maximum drawdown of the realized capital.
+        ledger (Optional[TradeLedger]): When given, the trade count and statistics are
+                                        read from it instead of the trade dicts (which
+                                        may then be left empty).
+
+    Returns:
+        Dict[str, Any]: 'ticker', 'initial_capital', 'capital_final', 'total_return',
+                        'win_rate', 'max_drawdown', 'profit_factor', 'nb_trades' and 'trades'.
+    """
+    if ledger is not None:
+        nb_trades = len(ledger)
+        win_rate, profit_factor = trade_stats(ledger["pnl"], ledger["outcome"])
+    else:
+        nb_trades = len(trades)
+        win_rate, profit_factor = trade_stats(
+            np.array([t['pnl'] for t in trades], dtype=np.float64),
+            np.array([OUTCOME_CODES[t['outcome']] for t in trades], dtype=np.int8),
+        )
+    return {
+        'ticker': ticker,
+        'initial_capital': initial_capital,
+        'capital_final': capital,
+        'total_return': (capital - initial_capital) / initial_capital,
+        'win_rate': win_rate,
+        'max_drawdown': max_drawdown,
+        'profit_factor': profit_factor,
+        'nb_trades': nb_trades,
+        'trades': trades
+    }
+
+
+def curve_metrics(equity: pd.Series, exposure: float, periods_per_year: Optional[float] = None) -> Dict[str, float]:
+    """
+    Risk-adjusted metrics of a per-candle equity curve.
+
+    Args:
+        equity (pd.Series): Mark-to-market equity at every candle close.
+        exposure (float): Fraction of candles spent holding a position.
+        periods_per_year (Optional[float]): Candles per year used to annualize
+                                            (default: inferred from the index spacing).
+
+    Returns:
+        Dict[str, float]: 'sharpe', 'sortino', 'calmar', 'exposure' and 'max_drawdown_mtm'.
+    """
+    values = equity.to_numpy(dtype=np.float64)
+    if len(values) < 2:
+        return {"sharpe": 0.0, "sortino": 0.0, "calmar": 0.0, "exposure": exposure, "max_drawdown_mtm": 0.0}
+
+    if periods_per_year is None:
+        periods_per_year = infer_periods_per_year(equity.index)
+
+    returns = values[1:] / values[:-1] - 1.0
+    mean = returns.mean()
+    std = returns.std()
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    scale = np.sqrt(periods_per_year)
+    sharpe = float(mean / std * scale) if std > 0 else 0.0
+    sortino = float(mean / downside * scale) if downside > 0 else 0.0
+
+    peaks = np.maximum.accumulate(values)
+    max_drawdown = float(np.max((peaks - values) / peaks))
+    growth = values[-1] / values[0]
+    annual_return = growth ** (periods_per_year / (len(values) - 1)) - 1.0 if growth > 0 else -1.0
+    if max_drawdown > 0:
+        calmar = float(annual_return / max_drawdown)
+    else:
+        calmar = float('inf') if annual_return > 0 else 0.0
+
+    return {
+        "sharpe": sharpe,
+        "sortino": sortino,
+        "calmar": calmar,
+        "exposure": exposure,
+        "max_drawdown_mtm": max_drawdown,
+    }
+
+
+def infer_periods_per_year(index: pd.Index) -> float:
+    """
+    Number of candles per year, from the median spacing of a datetime index
+    (markets are assumed to trade around the clock). Falls back to 252 daily candles.
+    """
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        spacing = np.median(np.diff(index.as_unit("ns").asi8)) / 1e9
+        if spacing > 0:
+            return 365.25 * 86400 / spacing
+    return 252.0
@@ -0,0 +1,143 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Upper bound on the number of (path × trade) cells simulated at once (~32 MB of float64)
+_MAX_CELLS_PER_CHUNK = 4_000_000
+
+
+class MonteCarloAnalyzer:
+    """
+    Robustness analysis of a backtest by resampling its trade sequence.
+
+    BacktestEngine sizes every position as a fixed fraction of the current capital,
+    so each trade is turned into a return on the capital it was opened with. Paths
+    are then rebuilt by compounding those returns in a new order:
+    - "shuffle": every path is a random permutation of the trades (same final capital,
+      different drawdowns; tests the luck of the trade ordering);
+    - "bootstrap": every path draws the same number of trades with replacement
+      (tests the luck of the trade mix as well).
+    All paths of a chunk are simulated together as one (paths × trades) array.
+    """
+
+    METHODS = ("shuffle", "bootstrap")
+    PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, result: Dict[str, Any], ruin_threshold: float = 0.5):
+        """
+        Args:
+            result (Dict[str, Any]): Output of BacktestEngine.run() (or PortfolioBacktestEngine.run()).
+            ruin_threshold (float): Loss, as a fraction of the initial capital, counted as ruin
+                                    (e.g. 0.5: the equity fell to half the initial capital).
+
+        Raises:
+            ValueError: If the result holds no trades or the ruin threshold is not in (0, 1].
+        """
+        if not 0.0 < ruin_threshold <= 1.0:
+            raise ValueError(f"Fatal error: ruin_threshold must be in (0, 1], Receive: {ruin_threshold}")
+        # The ledger holds the trades even when the engine skipped the 'trades' dicts (record_trades=False)
+        ledger = result.get("ledger")
+        if ledger is not None:
+            pnl = np.asarray(ledger["pnl"], dtype=np.float64)
+        else:
+            pnl = np.array([t["pnl"] for t in result["trades"]], dtype=np.float64)
+        if not len(pnl):
+            raise ValueError("Fatal error: Monte Carlo analysis requires at least one trade.")
+
+        self.ticker = result["ticker"]
+        self.initial_capital = result["initial_capital"]
+        self.ruin_threshold = ruin_threshold
+
+        capital_before = self.initial_capital + np.concatenate(([0.0], np.cumsum(pnl)[:-1]))
+        self.returns = pnl / capital_before
+
+    def run(
+        self,
+        n_paths: int = 10_000,
+        method: str = "shuffle",
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Simulates resampled equity paths.
+
+        Args:
+            n_paths (int): Number of paths to simulate.
+            method (str): Resampling method, one of METHODS.
+            seed (Optional[int]): Seed of the random generator (for reproducible runs).
+
+        Returns:
+            dict: 'final_capital' and 'max_drawdown' arrays (one value per path),
+                  'risk_of_ruin' and 'prob_loss' probabilities, and a 'summary'
+                  DataFrame of percentiles.
+
+        Raises:
+            ValueError: If the method is unknown or n_paths is not positive.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Fatal error: Unknown Monte Carlo method '{method}'. Expected one of {self.METHODS}.")
+        if n_paths <= 0:
+            raise ValueError("Fatal error: n_paths must be positive.")
+
+        rng = np.random.default_rng(seed)
+        n_trades = len(self.returns)
+        chunk = max(1, _MAX_CELLS_PER_CHUNK // n_trades)
+
+        final_capital = np.empty(n_paths)
+        max_drawdown = np.empty(n_paths)
+        ruined = np.empty(n_paths, dtype=bool)
+        ruin_level = self.initial_capital * (1.0 - self.ruin_threshold)
+
+        for start in range(0, n_paths, chunk):
+            rows = min(chunk, n_paths - start)
+            if method == "shuffle":
+                # One independent permutation per row
+                order = np.argsort(rng.random((rows, n_trades)), axis=1)
+            else:
+                order = rng.integers(0, n_trades, size=(rows, n_trades))
+
+            equity = self.initial_capital * np.cumprod(1.0 + self.returns[order], axis=1)
+            peaks = np.maximum(np.maximum.accumulate(equity, axis=1), self.initial_capital)
+
+            stop = start + rows
+            final_capital[start:stop] = equity[:, -1]
+            max_drawdown[start:stop] = np.max((peaks - equity) / peaks, axis=1)
+            ruined[start:stop] = equity.min(axis=1) <= ruin_level
+
+        total_return = (final_capital - self.initial_capital) / self.initial_capital
+        summary = pd.DataFrame(
+            {
+                "final_capital": np.percentile(final_capital, self.PERCENTILES),
+                "total_return": np.percentile(total_return, self.PERCENTILES),
+                "max_drawdown": np.percentile(max_drawdown, self.PERCENTILES),
+            },
+            index=pd.Index([f"p{p}" for p in self.PERCENTILES], name="percentile"),
+        )
+
+        return {
+            "ticker": self.ticker,
+            "method": method,
+            "n_paths": n_paths,
+            "n_trades": n_trades,
+            "final_capital": final_capital,
+            "max_drawdown": max_drawdown,
+            "risk_of_ruin": float(ruined.mean()),
+            "prob_loss": float((final_capital < self.initial_capital).mean()),
+            "summary": summary,
+        }
+
+    def print_report(self, mc: Dict[str, Any]):
+        """
+        Outputs the Monte Carlo distributions as a terminal report.
+        """
+        print(f"\n{'='*70}")
+        print(f"🎲 MONTE CARLO ({mc['method']}): {mc['ticker']} — {mc['n_paths']} paths × {mc['n_trades']} trades")
+        print(f"{'='*70}")
+
+        print(f"{'Percentile':<12} {'Final Capital':<15} {'Return':<10} {'Max Drawdown'}")
+        for label, row in mc["summary"].iterrows():
+            ret = f"{row['total_return']*100:.2f}%"
+            print(f"{label:<12} {row['final_capital']:<15.2f} {ret:<10} {row['max_drawdown']*100:.2f}%")
+
+        print(f"\nRisk of Ruin (-{self.ruin_threshold:.0%}): {mc['risk_of_ruin']*100:.2f}%")
+        print(f"Probability of Loss:      {mc['prob_loss']*100:.2f}%")
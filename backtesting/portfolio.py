@@ -0,0 +1,291 @@
+from functools import reduce
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import BacktestEngine
+from backtesting.ledger import curve_metrics, summarize_trades
+from core.types import Action, ConsensusBatch
+
+
+class PortfolioBacktestEngine:
+    """
+    Simulates a whole watchlist as one portfolio sharing a single capital pool.
+
+    The candle timelines of every ticker are merged into one time index and laid
+    out as (time × ticker) arrays. The simulation then walks the merged index once,
+    applying the BacktestEngine rules (next-candle entry, ATR-based SL/TP,
+    pessimistic both-hit, loss cooldown) to all tickers at each step with vectorized
+    operations, instead of running N separate passes over per-ticker frames.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 1000.0,
+        risk_per_trade: float = 0.02,
+        max_positions: Optional[int] = None,
+    ):
+        """
+        Args:
+            initial_capital (float): Starting capital of the shared pool.
+            risk_per_trade (float): Fraction of the current capital to risk per trade.
+            max_positions (Optional[int]): Cap on concurrent positions (open + pending entries).
+                                           When more signals fire than free slots, the most
+                                           confident ones win. None means unlimited.
+
+        Raises:
+            ValueError: If max_positions is not positive.
+        """
+        if max_positions is not None and max_positions <= 0:
+            raise ValueError("Fatal error: max_positions must be a positive integer or None.")
+        self.initial_capital = initial_capital
+        self.risk_per_trade = risk_per_trade
+        self.max_positions = max_positions
+
+    def run(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        signals: Dict[str, Union[List[dict], ConsensusBatch]],
+        configs: Optional[Dict[str, dict]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the portfolio simulation.
+
+        Args:
+            frames (Dict[str, pd.DataFrame]): Processed market data per ticker (OHLC + ATR_14).
+            signals (Dict[str, Union[List[dict], ConsensusBatch]]): Consensus signals per ticker,
+                in any format accepted by BacktestEngine.run(). Tickers without signals never trade.
+            configs (Optional[Dict[str, dict]]): Market configuration per ticker (ATR multiplier,
+                cooldown, etc.). Missing tickers use the BacktestEngine defaults.
+
+        Returns:
+            dict: Portfolio metrics (same keys as BacktestEngine.run except 'ledger', 'max_drawdown'
+                  measured on the mark-to-market equity, 'exposure' as the fraction of candles with
+                  at least one open position), plus 'tickers' and 'per_ticker'.
+
+        Raises:
+            ValueError: If there is no ticker, or a ticker has no candle.
+        """
+        configs = configs or {}
+        tickers = list(frames)
+        if not tickers:
+            raise ValueError("Fatal error: The portfolio requires at least one ticker.")
+        empty = [ticker for ticker in tickers if len(frames[ticker]) == 0]
+        if empty:
+            raise ValueError(f"Fatal error: The portfolio requires candles for every ticker, Receive: {empty}")
+
+        timeline = reduce(lambda left, right: left.union(right), (frames[t].index for t in tickers))
+        n_steps, n_tickers = len(timeline), len(tickers)
+
+        # 1. Lay every ticker out on the merged timeline (NaN / 0 where it has no candle)
+        highs = np.full((n_steps, n_tickers), np.nan)
+        lows = np.full((n_steps, n_tickers), np.nan)
+        closes = np.full((n_steps, n_tickers), np.nan)
+        atrs = np.full((n_steps, n_tickers), np.nan)
+        actions = np.zeros((n_steps, n_tickers), dtype=np.int8)
+        confidences = np.zeros((n_steps, n_tickers))
+        has_candle = np.zeros((n_steps, n_tickers), dtype=bool)
+        last_position = np.zeros(n_tickers, dtype=np.int64)
+
+        for k, ticker in enumerate(tickers):
+            df = frames[ticker]
+            rows = timeline.get_indexer(df.index)
+            highs[rows, k] = df["high"].to_numpy(dtype=np.float64)
+            lows[rows, k] = df["low"].to_numpy(dtype=np.float64)
+            closes[rows, k] = df["close"].to_numpy(dtype=np.float64)
+            if "ATR_14" in df.columns:
+                atrs[rows, k] = df["ATR_14"].to_numpy(dtype=np.float64, na_value=np.nan)
+            has_candle[rows, k] = True
+            last_position[k] = rows[-1]
+
+            ticker_signals = signals.get(ticker)
+            if ticker_signals is None or len(ticker_signals) == 0:
+                continue
+            aligned = BacktestEngine.align_signals(df, ticker_signals)
+            if aligned is None:
+                continue
+            row_actions, row_confidences, start_idx = aligned
+            actions[rows[start_idx:], k] = row_actions[start_idx:]
+            confidences[rows[start_idx:], k] = row_confidences[start_idx:]
+
+        # Last known close per ticker, used to mark open positions to market
+        marks = pd.DataFrame(closes).ffill().to_numpy()
+
+        # 2. Per-ticker risk parameters
+        def param(key: str, default: float) -> np.ndarray:
+            return np.array([configs.get(t, {}).get(key, default) for t in tickers], dtype=np.float64)
+
+        atr_sl_multiplier = param("atr_sl_multiplier", 1.5)
+        rr_ratio = param("rr_ratio", 2.0)
+        min_confidence = param("min_confidence", 0.50)
+        cooldown_candles = param("cooldown_candles", 6).astype(np.int64)
+        cooldown_override = param("cooldown_override_confidence", 0.70)
+
+        # 3. Portfolio state, one slot per ticker
+        in_position = np.zeros(n_tickers, dtype=bool)
+        pending = np.zeros(n_tickers, dtype=bool)
+        direction = np.zeros(n_tickers)
+        entry = np.zeros(n_tickers)
+        sl = np.zeros(n_tickers)
+        tp = np.zeros(n_tickers)
+        size = np.zeros(n_tickers)
+        entry_conf = np.zeros(n_tickers)
+        entry_step = np.zeros(n_tickers, dtype=np.int64)
+        cooldown = np.zeros(n_tickers, dtype=np.int64)
+
+        capital = self.initial_capital
+        equity = np.empty(n_steps)
+        held_steps = 0
+        trades: List[dict] = []
+
+        for t in range(n_steps):
+            present = has_candle[t]
+
+            # a. Pending entries become positions at the start of the ticker's next candle
+            activate = pending & present
+            in_position |= activate
+            pending &= ~activate
+
+            # b. SL / TP resolution, pessimistic when both are hit in the same candle
+            check = in_position & present
+            if check.any():
+                is_buy = direction > 0
+                sl_hit = check & np.where(is_buy, lows[t] <= sl, highs[t] >= sl)
+                tp_hit = check & np.where(is_buy, highs[t] >= tp, lows[t] <= tp)
+                exits = sl_hit | tp_hit
+                if exits.any():
+                    exit_price = np.where(sl_hit, sl, tp)
+                    pnl = (exit_price - entry) * size * direction
+                    for k in np.flatnonzero(exits):
+                        outcome = 'LOSS' if sl_hit[k] else 'WIN'
+                        trades.append(self._trade(
+                            tickers[k], timeline, entry_step[k], t, direction[k], entry[k], sl[k], tp[k],
+                            size[k], entry_conf[k], exit_price[k], pnl[k], outcome,
+                        ))
+                        capital += float(pnl[k])
+                    in_position &= ~exits
+                    cooldown = np.where(sl_hit, cooldown_candles, cooldown)
+
+            # c. Cooldown ticks on every candle of an idle ticker
+            idle = present & ~in_position & ~pending
+            cooldown = np.where(idle & (cooldown > 0), cooldown - 1, cooldown)
+
+            # d. New signals (entry at this close, executed on the ticker's next candle)
+            step_actions = actions[t]
+            step_conf = confidences[t]
+            step_atr = atrs[t]
+            candidates = (
+                idle
+                # An entry signalled on a ticker's last candle could never be executed
+                & (t < last_position)
+                & (step_actions != 0)
+                & (step_conf >= min_confidence)
+                & ~((cooldown > 0) & (step_conf < cooldown_override))
+                & (step_atr > 0)
+            )
+            if candidates.any():
+                chosen = np.flatnonzero(candidates)
+                side = step_actions[chosen].astype(np.float64)
+                stop_distance = step_atr[chosen] * atr_sl_multiplier[chosen]
+                new_entry = closes[t, chosen]
+                new_sl = new_entry - side * stop_distance
+                new_tp = new_entry + side * stop_distance * rr_ratio[chosen]
+                # Same expression as BacktestEngine (entry - sl, or sl - entry for a SELL)
+                risk_per_unit = (new_entry - new_sl) * side
+
+                keep = np.flatnonzero(risk_per_unit > 0)
+                if self.max_positions is not None:
+                    free_slots = max(self.max_positions - int((in_position | pending).sum()), 0)
+                    # Most confident first, ticker order on ties
+                    keep = keep[np.argsort(-step_conf[chosen[keep]], kind="stable")][:free_slots]
+
+                if len(keep):
+                    slots = chosen[keep]
+                    pending[slots] = True
+                    direction[slots] = side[keep]
+                    entry[slots] = new_entry[keep]
+                    sl[slots] = new_sl[keep]
+                    tp[slots] = new_tp[keep]
+                    size[slots] = capital * self.risk_per_trade / risk_per_unit[keep]
+                    entry_conf[slots] = step_conf[slots]
+                    entry_step[slots] = t
+
+            # e. Mark-to-market equity of the shared pool
+            open_pnl = (marks[t] - entry) * size * direction
+            equity[t] = capital + open_pnl[in_position].sum()
+            held_steps += bool(in_position.any())
+
+        # Open positions are closed at each ticker's last close
+        for k in np.flatnonzero(in_position):
+            last = last_position[k]
+            exit_price = closes[last, k]
+            pnl = (exit_price - entry[k]) * size[k] * direction[k]
+            trades.append(self._trade(
+                tickers[k], timeline, entry_step[k], last, direction[k], entry[k], sl[k], tp[k],
+                size[k], entry_conf[k], exit_price, pnl, 'OPEN',
+            ))
+            capital += float(pnl)
+
+        peaks = np.maximum.accumulate(np.concatenate(([self.initial_capital], equity)))[1:]
+        max_drawdown = float(np.max((peaks - equity) / peaks)) if n_steps else 0.0
+
+        result = summarize_trades("PORTFOLIO", trades, self.initial_capital, capital, max(max_drawdown, 0.0))
+        equity_curve = pd.Series(equity, index=timeline, name="equity")
+        result.update(curve_metrics(equity_curve, held_steps / n_steps if n_steps else 0.0))
+        result["tickers"] = tickers
+        result["equity_curve"] = equity_curve
+        result["per_ticker"] = self._per_ticker(tickers, trades)
+        return result
+
+    @staticmethod
+    def _trade(
+        ticker: str,
+        timeline: pd.Index,
+        entry_step: int,
+        exit_step: int,
+        direction: float,
+        entry: float,
+        sl: float,
+        tp: float,
+        size: float,
+        confidence: float,
+        exit_price: float,
+        pnl: float,
+        outcome: str,
+    ) -> dict:
+        """
+        Formats a closed position with the same keys as BacktestEngine trades.
+        """
+        return {
+            'ticker': ticker,
+            'entry_date': str(timeline[entry_step]),
+            'direction': Action(int(direction)).name,
+            'entry': float(entry),
+            'sl': float(sl),
+            'tp': float(tp),
+            'position_size': float(size),
+            'confidence': float(confidence),
+            'exit_date': str(timeline[exit_step]),
+            'exit_price': float(exit_price),
+            'pnl': float(pnl),
+            'outcome': outcome,
+        }
+
+    @staticmethod
+    def _per_ticker(tickers: List[str], trades: List[dict]) -> pd.DataFrame:
+        """
+        Per-ticker breakdown of the portfolio trades.
+        """
+        rows = []
+        for ticker in tickers:
+            ticker_trades = [t for t in trades if t['ticker'] == ticker]
+            resolved = [t for t in ticker_trades if t['outcome'] != 'OPEN']
+            wins = [t for t in resolved if t['outcome'] == 'WIN']
+            rows.append({
+                'ticker': ticker,
+                'nb_trades': len(ticker_trades),
+                'pnl': sum(t['pnl'] for t in ticker_trades),
+                'win_rate': len(wins) / len(resolved) if resolved else 0.0,
+            })
+        return pd.DataFrame(rows).set_index('ticker')
@@ -0,0 +1,236 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from backtesting.engine import BacktestEngine
+from core.orchestrator import MarketOrchestrator
+from data.shared_frame import SharedFrame
+from core.types import ConsensusBatch
+
+# MarketConfig keys that can be swept without recomputing features or agent signals.
+# (fast_ma / slow_ma change the feature set itself and are therefore not sweepable here.)
+SWEEPABLE_KEYS = (
+    "atr_sl_multiplier",
+    "rr_ratio",
+    "min_confidence",
+    "cooldown_candles",
+    "cooldown_override_confidence",
+    "activation_threshold",
+)
+
+METRIC_COLUMNS = [
+    "total_return", "max_drawdown", "profit_factor", "win_rate", "nb_trades",
+    "sharpe", "sortino", "calmar", "exposure", "max_drawdown_mtm",
+]
+
+# Metrics where a smaller value ranks first
+LOWER_IS_BETTER = {"max_drawdown", "max_drawdown_mtm"}
+
+# Per-process state, installed once by init_worker() instead of being pickled with every task
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def expand_grid(grid: Dict[str, Sequence]) -> List[dict]:
+    """
+    Expands a parameter grid into the list of every combination (cartesian product).
+
+    Args:
+        grid (Dict[str, Sequence]): Mapping of config key → candidate values,
+                                    e.g. {"rr_ratio": [1.5, 2.0], "cooldown_candles": [4, 6]}.
+
+    Returns:
+        List[dict]: One config override per combination, in a deterministic order.
+
+    Raises:
+        ValueError: If a key is not sweepable or has no candidate values.
+    """
+    unknown = [key for key in grid if key not in SWEEPABLE_KEYS]
+    if unknown:
+        raise ValueError(f"Fatal error: Unsupported sweep keys {unknown}. Allowed: {list(SWEEPABLE_KEYS)}")
+
+    empty = [key for key, values in grid.items() if len(values) == 0]
+    if empty:
+        raise ValueError(f"Fatal error: No candidate values for sweep keys {empty}.")
+
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def init_worker(state: Dict[str, Any]) -> None:
+    """
+    Process pool initializer: stores the shared market data and agent signals once per worker.
+    A SharedFrame is attached as zero-copy read-only views instead of being unpickled.
+    """
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+    if isinstance(state["processed_df"], SharedFrame):
+        _WORKER_STATE["processed_df"] = state["processed_df"].frame()
+    _WORKER_STATE["consensus_cache"] = {}
+
+
+def clear_worker() -> None:
+    """
+    Drops the state installed by init_worker() (after an in-process run).
+    """
+    _WORKER_STATE.clear()
+
+
+def _consensus(threshold: float) -> ConsensusBatch:
+    """
+    Full-history consensus for an activation threshold, cached in the worker.
+    The agent batches are look-ahead free, so any window can be sliced out of it.
+    """
+    state = _WORKER_STATE
+    consensus = state["consensus_cache"].get(threshold)
+    if consensus is None:
+        consensus = state["orchestrator"].get_consensus_batch(
+            state["batches"],
+            index=state["processed_df"].index,
+            activation_threshold=threshold,
+        )
+        state["consensus_cache"][threshold] = consensus
+    return consensus
+
+
+def backtest_window(params: dict, start: int, stop: int, record_trades: bool = False) -> Dict[str, Any]:
+    """
+    Runs one backtest for a config override over the candles [start, stop),
+    using the state installed by init_worker(). Trade dicts are only built
+    when record_trades is True; the columnar ledger is always returned.
+    """
+    state = _WORKER_STATE
+    config = {**state["base_config"], **params}
+    threshold = config.get("activation_threshold", state["orchestrator"].activation_threshold)
+
+    engine = BacktestEngine(
+        initial_capital=state["initial_capital"],
+        risk_per_trade=state["risk_per_trade"],
+        record_trades=record_trades,
+    )
+    return engine.run(
+        state["processed_df"].iloc[start:stop],
+        _consensus(threshold).slice(start, stop),
+        state["ticker"],
+        config,
+    )
+
+
+def _evaluate(params: dict) -> dict:
+    """
+    Sweep task: backtests a config override over the sweep window and keeps the metrics.
+    """
+    stop = len(_WORKER_STATE["processed_df"])
+    lookback = _WORKER_STATE["lookback"]
+    start = 0 if lookback is None else max(stop - lookback, 0)
+
+    result = backtest_window(params, start, stop)
+    return {**params, **{metric: result[metric] for metric in METRIC_COLUMNS}}
+
+
+class ParameterSweep:
+    """
+    Grid search over MarketConfig risk/consensus parameters.
+
+    Features and agent signals are computed once; every combination then only
+    re-runs the (cheap) vectorized consensus and the BacktestEngine, fanned out
+    across a process pool.
+    """
+
+    def __init__(
+        self,
+        processed_df: pd.DataFrame,
+        orchestrator: MarketOrchestrator,
+        ticker: str,
+        base_config: Optional[dict] = None,
+        lookback: Optional[int] = None,
+        initial_capital: float = 1000.0,
+        risk_per_trade: float = 0.02,
+    ):
+        """
+        Args:
+            processed_df (pd.DataFrame): Market data already processed by the FeaturePipeline.
+            orchestrator (MarketOrchestrator): Orchestrator holding the Monkeys to evaluate.
+            ticker (str): The asset being tested.
+            base_config (Optional[dict]): Market config the grid values are layered on.
+            lookback (Optional[int]): Only simulate the last N candles (default: full history).
+            initial_capital (float): Starting capital for every backtest.
+            risk_per_trade (float): Fraction of capital risked per trade.
+        """
+        self.processed_df = processed_df
+        self.orchestrator = orchestrator
+        self.ticker = ticker
+        self.base_config = dict(base_config or {})
+        self.lookback = lookback
+        self.initial_capital = initial_capital
+        self.risk_per_trade = risk_per_trade
+
+        # Agents are evaluated once, whatever the number of combinations
+        self.batches = orchestrator.analyze_batch(processed_df)
+
+    def _worker_state(self, shared: Optional[SharedFrame] = None) -> Dict[str, Any]:
+        return {
+            "processed_df": self.processed_df if shared is None else shared,
+            "orchestrator": self.orchestrator,
+            "batches": self.batches,
+            "ticker": self.ticker,
+            "base_config": self.base_config,
+            "lookback": self.lookback,
+            "initial_capital": self.initial_capital,
+            "risk_per_trade": self.risk_per_trade,
+        }
+
+    def run(
+        self,
+        grid: Dict[str, Sequence],
+        processes: Optional[int] = None,
+        sort_by: str = "total_return",
+    ) -> pd.DataFrame:
+        """
+        Backtests every combination of the grid and ranks them.
+
+        Args:
+            grid (Dict[str, Sequence]): Mapping of config key → candidate values (see SWEEPABLE_KEYS).
+            processes (Optional[int]): Number of worker processes (default: CPU count).
+                                       1 runs everything in the current process.
+            sort_by (str): Metric used to rank the combinations
+                           (descending, except for LOWER_IS_BETTER metrics).
+
+        Returns:
+            pd.DataFrame: One row per combination (parameters + metrics), best first.
+        """
+        if sort_by not in METRIC_COLUMNS:
+            raise ValueError(f"Fatal error: Unknown ranking metric '{sort_by}'. Expected one of {METRIC_COLUMNS}.")
+
+        combinations = expand_grid(grid)
+        processes = processes or os.cpu_count() or 1
+
+        if processes == 1:
+            init_worker(self._worker_state())
+            rows = [_evaluate(params) for params in combinations]
+            clear_worker()
+        else:
+            # Combinations are sent grouped by activation threshold, so that a chunk mostly reuses
+            # the consensus cached by its worker (see _consensus()); large chunks amortize IPC
+            order = sorted(
+                range(len(combinations)), key=lambda i: combinations[i].get("activation_threshold", 0.0)
+            )
+            chunksize = max(1, len(combinations) // (processes * 4))
+            # The market data is published once in shared memory instead of pickled per worker
+            with SharedFrame(self.processed_df) as shared, ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=init_worker,
+                initargs=(self._worker_state(shared),),
+            ) as pool:
+                results = pool.map(_evaluate, [combinations[i] for i in order], chunksize=chunksize)
+                # Back to the grid order, so that ties rank as in the in-process run
+                rows = [None] * len(combinations)
+                for i, row in zip(order, results):
+                    rows[i] = row
+
+        table = pd.DataFrame(rows, columns=list(grid) + METRIC_COLUMNS)
+        table = table.sort_values(sort_by, ascending=sort_by in LOWER_IS_BETTER, kind="stable")
+        table.index = pd.RangeIndex(1, len(table) + 1, name="rank")
+        return table
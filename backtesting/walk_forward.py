@@ -0,0 +1,230 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from backtesting.ledger import curve_metrics, summarize_trades
+from backtesting.sweep import (
+    LOWER_IS_BETTER,
+    METRIC_COLUMNS,
+    ParameterSweep,
+    backtest_window,
+    clear_worker,
+    expand_grid,
+    init_worker,
+)
+from core.orchestrator import MarketOrchestrator
+from data.shared_frame import SharedFrame
+
+
+def _run_window(task: Tuple[int, int, int, List[dict], str]) -> Dict[str, Any]:
+    """
+    Walk-forward task: optimizes the grid on the train window, then replays
+    the winning parameters on the following test window.
+    """
+    train_start, test_start, test_end, combinations, sort_by = task
+
+    best_params, best_score = None, None
+    for params in combinations:
+        score = backtest_window(params, train_start, test_start)[sort_by]
+        if sort_by in LOWER_IS_BETTER:
+            score = -score
+        # Strict comparison keeps the first combination on ties (deterministic)
+        if best_score is None or score > best_score:
+            best_params, best_score = params, score
+
+    train_score = -best_score if sort_by in LOWER_IS_BETTER else best_score
+    return {
+        "best_params": best_params,
+        "train_score": train_score,
+        "test_result": backtest_window(best_params, test_start, test_end, record_trades=True),
+    }
+
+
+class WalkForwardOptimizer(ParameterSweep):
+    """
+    Out-of-sample validation over rolling train/test windows.
+
+    For every window the grid is optimized on the train candles and the winner
+    is applied to the next test candles. Features and agent signals are computed
+    once for the whole history (they are look-ahead free), and the windows run
+    in parallel across a process pool. Test results are stitched together.
+    """
+
+    def __init__(
+        self,
+        processed_df: pd.DataFrame,
+        orchestrator: MarketOrchestrator,
+        ticker: str,
+        train_size: int,
+        test_size: int,
+        step: Optional[int] = None,
+        anchored: bool = False,
+        base_config: Optional[dict] = None,
+        initial_capital: float = 1000.0,
+        risk_per_trade: float = 0.02,
+    ):
+        """
+        Args:
+            processed_df (pd.DataFrame): Market data already processed by the FeaturePipeline.
+            orchestrator (MarketOrchestrator): Orchestrator holding the Monkeys to evaluate.
+            ticker (str): The asset being tested.
+            train_size (int): Number of candles used to optimize each window.
+            test_size (int): Number of out-of-sample candles following each train window.
+            step (Optional[int]): Shift between consecutive windows (default: test_size,
+                                  i.e. contiguous test windows). Must be at least test_size:
+                                  overlapping test windows would count the same out-of-sample
+                                  candles and trades several times in the stitched results.
+            anchored (bool): If True, every train window starts at the first candle (expanding window).
+            base_config (Optional[dict]): Market config the grid values are layered on.
+            initial_capital (float): Starting capital of the stitched test equity.
+            risk_per_trade (float): Fraction of capital risked per trade.
+
+        Raises:
+            ValueError: If the window sizes are not positive or exceed the data,
+                        or if step is smaller than test_size.
+        """
+        if train_size <= 0 or test_size <= 0 or (step is not None and step <= 0):
+            raise ValueError("Fatal error: train_size, test_size and step must be positive.")
+        if step is not None and step < test_size:
+            raise ValueError(
+                f"Fatal error: step ({step}) must be at least test_size ({test_size}), "
+                f"otherwise the test windows overlap."
+            )
+        if train_size >= len(processed_df):
+            raise ValueError(
+                f"Fatal error: train_size ({train_size}) must be smaller than the data ({len(processed_df)} candles)."
+            )
+
+        super().__init__(
+            processed_df,
+            orchestrator,
+            ticker,
+            base_config=base_config,
+            initial_capital=initial_capital,
+            risk_per_trade=risk_per_trade,
+        )
+        self.train_size = train_size
+        self.test_size = test_size
+        self.step = step or test_size
+        self.anchored = anchored
+
+    def windows(self) -> List[Tuple[int, int, int]]:
+        """
+        Lists the walk-forward windows as candle positions.
+
+        Returns:
+            List[Tuple[int, int, int]]: (train_start, test_start, test_end) triplets; the train
+                                        window is [train_start, test_start), the test window
+                                        [test_start, test_end). The last test window may be shorter.
+        """
+        n = len(self.processed_df)
+        windows = []
+        start = 0
+        while start + self.train_size < n:
+            test_start = start + self.train_size
+            train_start = 0 if self.anchored else start
+            windows.append((train_start, test_start, min(test_start + self.test_size, n)))
+            start += self.step
+        return windows
+
+    def run(
+        self,
+        grid: Dict[str, Sequence],
+        processes: Optional[int] = None,
+        sort_by: str = "total_return",
+    ) -> Dict[str, Any]:
+        """
+        Runs the walk-forward optimization.
+
+        Args:
+            grid (Dict[str, Sequence]): Mapping of config key → candidate values (see SWEEPABLE_KEYS).
+            processes (Optional[int]): Number of worker processes (default: CPU count).
+                                       1 runs everything in the current process.
+            sort_by (str): Metric optimized on each train window.
+
+        Returns:
+            dict: BacktestEngine-style metrics of the stitched out-of-sample trades, plus
+                  'equity' (capital after each closed trade), 'equity_curve' (per-candle
+                  mark-to-market equity of the test windows) with its curve metrics,
+                  and 'windows' (per-window summary).
+        """
+        if sort_by not in METRIC_COLUMNS:
+            raise ValueError(f"Fatal error: Unknown ranking metric '{sort_by}'. Expected one of {METRIC_COLUMNS}.")
+
+        combinations = expand_grid(grid)
+        windows = self.windows()
+        tasks = [(train_start, test_start, test_end, combinations, sort_by) for train_start, test_start, test_end in windows]
+        processes = min(processes or os.cpu_count() or 1, len(tasks))
+
+        if processes <= 1:
+            init_worker(self._worker_state())
+            outcomes = [_run_window(task) for task in tasks]
+            clear_worker()
+        else:
+            with SharedFrame(self.processed_df) as shared, ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=init_worker,
+                initargs=(self._worker_state(shared),),
+            ) as pool:
+                outcomes = list(pool.map(_run_window, tasks))
+
+        return self._stitch(windows, outcomes, sort_by)
+
+    def _stitch(self, windows: List[Tuple[int, int, int]], outcomes: List[Dict[str, Any]], sort_by: str) -> Dict[str, Any]:
+        """
+        Chains the test windows into a single out-of-sample track record.
+
+        Every window is simulated from the same initial capital so they can run
+        independently. Position sizing is a fixed fraction of capital, so a whole
+        window scales linearly with its starting capital: trades are rescaled by
+        the capital growth accumulated over the previous windows.
+        """
+        index = self.processed_df.index
+        capital = self.initial_capital
+        peak_capital = capital
+        max_drawdown = 0.0
+        trades = []
+        equity_dates = [str(index[windows[0][1]])] if windows else []
+        equity_values = [capital]
+        curves = []
+        held_candles = 0.0
+        summary = []
+
+        for (train_start, test_start, test_end), outcome in zip(windows, outcomes):
+            result = outcome["test_result"]
+            scale = capital / self.initial_capital
+            window_start_capital = capital
+            curves.append(result["equity_curve"] * scale)
+            held_candles += result["exposure"] * len(result["equity_curve"])
+
+            for trade in result["trades"]:
+                trade = dict(trade, pnl=trade["pnl"] * scale, position_size=trade["position_size"] * scale)
+                capital += trade["pnl"]
+                trades.append(trade)
+                equity_dates.append(trade["exit_date"])
+                equity_values.append(capital)
+
+                if trade["outcome"] != "OPEN":
+                    peak_capital = max(peak_capital, capital)
+                    max_drawdown = max(max_drawdown, (peak_capital - capital) / peak_capital)
+
+            summary.append({
+                "train_start": index[train_start],
+                "test_start": index[test_start],
+                "test_end": index[test_end - 1],
+                **outcome["best_params"],
+                f"train_{sort_by}": outcome["train_score"],
+                "test_return": (capital - window_start_capital) / window_start_capital,
+                "test_trades": result["nb_trades"],
+            })
+
+        stitched = summarize_trades(self.ticker, trades, self.initial_capital, capital, max_drawdown)
+        stitched["equity"] = pd.Series(equity_values, index=equity_dates, name="capital")
+
+        curve = pd.concat(curves) if curves else pd.Series(dtype=float, name="equity")
+        stitched.update(curve_metrics(curve, held_candles / len(curve) if len(curve) else 0.0))
+        stitched["equity_curve"] = curve
+        stitched["windows"] = pd.DataFrame(summary)
+        return stitched
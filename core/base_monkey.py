@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from core.types import MonkeySignal
+from core.types import MonkeySignal, MonkeySignalBatch
 
 class BaseMonkey(ABC):
     """
@@ -19,4 +20,35 @@ class BaseMonkey(ABC):
         :param market_data: Pandas DataFrame containing the necessary features.
         :return: MonkeySignal (validated by core.types)
         """
-        pass
\ No newline at end of file
+        pass
+
+    def analyze_batch(self, market_data: pd.DataFrame) -> MonkeySignalBatch:
+        """
+        Analyzes every row of the market data in a single call.
+        Row i of the result must equal analyze(market_data.iloc[:i + 1]).
+
+        This generic fallback literally replays analyze() on each prefix (O(n²)).
+        Agents whose decision only depends on the latest row should override it
+        with a vectorized implementation.
+        :param market_data: Pandas DataFrame containing the necessary features.
+        :return: MonkeySignalBatch with one action/confidence per row
+        """
+        actions = np.zeros(len(market_data), dtype=np.int8)
+        confidences = np.zeros(len(market_data), dtype=np.float64)
+
+        for i in range(len(market_data)):
+            signal = self.analyze(market_data.iloc[:i + 1])
+            actions[i] = signal.action.value
+            confidences[i] = signal.confidence
+
+        return MonkeySignalBatch(self.name, actions, confidences)
+
+    @staticmethod
+    def _column_values(market_data: pd.DataFrame, column: str) -> np.ndarray:
+        """
+        Extracts a column as a float64 array, mapping pd.NA / None to NaN.
+        Missing columns are returned as all-NaN, mirroring `latest.get(column, pd.NA)`.
+        """
+        if column not in market_data.columns:
+            return np.full(len(market_data), np.nan)
+        return market_data[column].to_numpy(dtype=np.float64, na_value=np.nan)
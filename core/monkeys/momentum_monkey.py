@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from core.types import Action, MonkeySignal
+from core.types import Action, MonkeySignal, MonkeySignalBatch
 from core.base_monkey import BaseMonkey
 
 
@@ -36,15 +37,18 @@ class MomentumMonkey(BaseMonkey):
         self.macd_signal_col = macd_signal_col
         self.atr_col = atr_col
 
-    def analyze(self, market_data: pd.DataFrame) -> MonkeySignal:
-        """
-        Analyzes market data using RSI and MACD to generate a trading signal.
-        """
+    def _check_columns(self, market_data: pd.DataFrame) -> None:
         required_cols = [self.rsi_col, self.macd_col, self.macd_signal_col]
         missing = [c for c in required_cols if c not in market_data.columns]
         if missing:
             raise KeyError(f"Fatal error: Missing columns {missing} for {self.name}.")
 
+    def analyze(self, market_data: pd.DataFrame) -> MonkeySignal:
+        """
+        Analyzes market data using RSI and MACD to generate a trading signal.
+        """
+        self._check_columns(market_data)
+
         latest = market_data.iloc[-1]
 
         # If core indicators are NaN, wait
@@ -79,3 +83,27 @@ class MomentumMonkey(BaseMonkey):
             return MonkeySignal(self.name, Action.BUY, confidence)
         else:
             return MonkeySignal(self.name, Action.SELL, confidence)
+
+    def analyze_batch(self, market_data: pd.DataFrame) -> MonkeySignalBatch:
+        """
+        Vectorized version of analyze(): evaluates RSI/MACD rules on every row at once.
+        """
+        self._check_columns(market_data)
+
+        rsi = self._column_values(market_data, self.rsi_col)
+        macd = self._column_values(market_data, self.macd_col)
+        macd_signal = self._column_values(market_data, self.macd_signal_col)
+        atr = self._column_values(market_data, self.atr_col)
+
+        # NaN indicators compare False everywhere below and therefore end up as WAIT
+        is_buy = (rsi > 50) & (macd > 0) & (macd > macd_signal)
+        is_sell = (rsi < 50) & (macd < 0) & (macd < macd_signal)
+
+        rsi_strength = np.minimum(np.abs(rsi - 50) / 50.0, 1.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            macd_strength = np.where(atr > 0, np.minimum(np.abs(macd) / (atr * 0.1), 1.0), 0.5)
+        confidence = (rsi_strength + macd_strength) / 2.0
+
+        actions = np.where(is_buy, Action.BUY.value, np.where(is_sell, Action.SELL.value, Action.WAIT.value))
+        confidences = np.where(is_buy | is_sell, confidence, 0.0)
+        return MonkeySignalBatch(self.name, actions, confidences)
@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 
 from core.base_monkey import BaseMonkey
-from core.types import Action, MonkeySignal, TradePlan
+from core.types import Action, MonkeySignal, MonkeySignalBatch, TradePlan
 
 class RiskMonkey(BaseMonkey):
     """
@@ -24,15 +25,18 @@ class RiskMonkey(BaseMonkey):
         self.atr_multiplier = atr_multiplier
         self.rr_ratio = rr_ratio
 
+    def _check_columns(self, market_data: pd.DataFrame) -> None:
+        if self.atr_col not in market_data.columns:
+            raise KeyError(
+                f"Fatal error: Missing column for {self.name}. Required: {self.atr_col}"
+            )
+
     def analyze(self, market_data: pd.DataFrame) -> MonkeySignal:
         """
         RiskMonkey always waits, but its confidence depends on the availability
         of the ATR to compute the risk.
         """
-        if self.atr_col not in market_data.columns:
-            raise KeyError(
-                f"Fatal error: Missing column for {self.name}. Required: {self.atr_col}"
-            )
+        self._check_columns(market_data)
 
         latest = market_data.iloc[-1]
         
@@ -41,6 +45,17 @@ class RiskMonkey(BaseMonkey):
             
         return MonkeySignal(self.name, Action.WAIT, 1.0)
 
+    def analyze_batch(self, market_data: pd.DataFrame) -> MonkeySignalBatch:
+        """
+        Vectorized version of analyze(): always WAIT, confident wherever the ATR is known.
+        """
+        self._check_columns(market_data)
+
+        atr = self._column_values(market_data, self.atr_col)
+        actions = np.full(len(market_data), Action.WAIT.value)
+        confidences = np.where(np.isnan(atr), 0.0, 1.0)
+        return MonkeySignalBatch(self.name, actions, confidences)
+
     def compute_trade_plan(self, df: pd.DataFrame, consensus: dict, ticker: str) -> TradePlan:
         """
         Generates a structured TradePlan based on the orchestrator's consensus
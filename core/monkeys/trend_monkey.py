@@ -1,5 +1,6 @@
-from core.types import Action, MonkeySignal
+from core.types import Action, MonkeySignal, MonkeySignalBatch
 from core.base_monkey import BaseMonkey
+import numpy as np
 import pandas as pd
 
 class TrendMonkey(BaseMonkey):
@@ -13,11 +14,14 @@ class TrendMonkey(BaseMonkey):
         self.fast_col = fast_col
         self.slow_col = slow_col
 
-    def analyze(self, market_data: pd.DataFrame) -> MonkeySignal:
+    def _check_columns(self, market_data: pd.DataFrame) -> None:
         if self.fast_col not in market_data.columns or self.slow_col not in market_data.columns or "close" not in market_data.columns:
             # According to rules, we must explicitly crash if data is corrupted/missing
             raise KeyError(f"Fatal error: Missing columns for {self.name}. Required: {self.fast_col}, {self.slow_col}, close")
 
+    def analyze(self, market_data: pd.DataFrame) -> MonkeySignal:
+        self._check_columns(market_data)
+
         # Need at least two rows to check a crossover if we wanted to be precise,
         # but for a simple state-based signal, we can just check the latest row.
         latest = market_data.iloc[-1]
@@ -55,3 +59,27 @@ class TrendMonkey(BaseMonkey):
             
         else:
             return MonkeySignal(self.name, Action.WAIT, 0.0)
+
+    def analyze_batch(self, market_data: pd.DataFrame) -> MonkeySignalBatch:
+        """
+        Vectorized version of analyze(): applies the same filters to every row at once.
+        """
+        self._check_columns(market_data)
+
+        fast = self._column_values(market_data, self.fast_col)
+        slow = self._column_values(market_data, self.slow_col)
+        close = self._column_values(market_data, "close")
+
+        # NaN rows compare False everywhere below and therefore end up as WAIT
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff = np.abs(fast - slow) / slow
+        confidence = np.minimum(diff * 20.0, 1.0)
+
+        # Momentum Filter (> 0.3% spread) + Price Confirmation against the slow trend
+        active = diff > 0.003
+        is_buy = active & (fast > slow) & (close > slow)
+        is_sell = active & (fast < slow) & (close < slow)
+
+        actions = np.where(is_buy, Action.BUY.value, np.where(is_sell, Action.SELL.value, Action.WAIT.value))
+        confidences = np.where(is_buy | is_sell, confidence, 0.0)
+        return MonkeySignalBatch(self.name, actions, confidences)
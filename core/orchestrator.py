@@ -1,9 +1,24 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
-from core.types import Action, MonkeySignal
+from core.types import Action, MonkeySignal, MonkeySignalBatch, ConsensusBatch
 from core.base_monkey import BaseMonkey
 
+def _round_like_python(values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    Vectorized round() that returns exactly what Python's built-in round() would.
+    np.round scales by 10**decimals before rounding, which can only disagree with
+    round() when the scaled value lies next to a .5 tie; those few rows are redone in Python.
+    """
+    rounded = np.round(values, decimals)
+    scaled = values * (10.0 ** decimals)
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), decimals)
+    return rounded
+
+
 class MarketOrchestrator:
     """
     The Brain of the Agent-Monkey system.
@@ -47,6 +62,40 @@ class MarketOrchestrator:
                 # In production, we would log the error. Here we raise an exception to fix it early.
                 raise RuntimeError(f"Crash of agent '{monkey.name}' during analysis: {str(e)}")
 
+        return self.aggregate(signals)
+
+    def analyze_batch(self, market_data: pd.DataFrame) -> List[MonkeySignalBatch]:
+        """
+        Queries all agents once over the full history.
+        Row i of every batch is what the agent would answer on market_data.iloc[:i + 1],
+        so this replaces re-running get_consensus() on growing slices.
+
+        Args:
+            market_data (pd.DataFrame): Pandas DataFrame containing historical data and features.
+
+        Returns:
+            List[MonkeySignalBatch]: One batch per Monkey, in the orchestrator's order.
+        """
+        batches: List[MonkeySignalBatch] = []
+
+        for monkey in self.monkeys:
+            try:
+                batches.append(monkey.analyze_batch(market_data))
+            except Exception as e:
+                raise RuntimeError(f"Crash of agent '{monkey.name}' during analysis: {str(e)}")
+
+        return batches
+
+    def aggregate(self, signals: List[MonkeySignal]) -> Dict[str, Any]:
+        """
+        Turns one signal per Monkey (in the orchestrator's order) into the final consensus.
+
+        Args:
+            signals (List[MonkeySignal]): The agents' decisions for a single candle.
+
+        Returns:
+            Dict[str, Any]: Dictionary representing the final decision and agent logs.
+        """
         # 2. Consensus Calculation (Weighted Average)
         total_weight = sum(monkey.weight for monkey in self.monkeys)
         
@@ -76,4 +125,65 @@ class MarketOrchestrator:
             "Confiance": round(abs_confidence, 2),
             "Log_Agents": " | ".join(logs_notion),
             "Raw_Score": round(final_score, 4)
-        }
\ No newline at end of file
+        }
+
+    def get_consensus_batch(
+        self,
+        batches: List[MonkeySignalBatch],
+        index: Optional[pd.Index] = None,
+        activation_threshold: Optional[float] = None,
+    ) -> ConsensusBatch:
+        """
+        Vectorized aggregate(): computes the weighted score, threshold and final
+        action for every candle at once. Row i equals aggregate() fed with the
+        i-th signal of each batch.
+
+        Args:
+            batches (List[MonkeySignalBatch]): One batch per Monkey, in the orchestrator's order
+                                               (typically the output of analyze_batch()).
+            index (Optional[pd.Index]): Candle labels to attach (e.g., market_data.index).
+                                        Defaults to a RangeIndex.
+            activation_threshold (Optional[float]): Overrides the orchestrator threshold,
+                                                    handy for parameter sweeps.
+
+        Returns:
+            ConsensusBatch: Columnar consensus, directly consumable by BacktestEngine.run().
+
+        Raises:
+            ValueError: If the batches don't match the Monkeys or have different lengths.
+        """
+        if len(batches) != len(self.monkeys):
+            raise ValueError(
+                f"Fatal error: Expected {len(self.monkeys)} signal batches (one per Monkey), got {len(batches)}."
+            )
+        n = len(batches[0])
+        if any(len(batch) != n for batch in batches):
+            raise ValueError("Fatal error: All signal batches must have the same length.")
+        if index is None:
+            index = pd.RangeIndex(n)
+        if activation_threshold is None:
+            activation_threshold = self.activation_threshold
+
+        # Same accumulation order as aggregate() so the floats match bit for bit
+        total_weight = sum(monkey.weight for monkey in self.monkeys)
+        weighted_score = np.zeros(n, dtype=np.float64)
+        for monkey, batch in zip(self.monkeys, batches):
+            weighted_score += batch.actions.astype(np.float64) * batch.confidences * monkey.weight
+
+        final_score = weighted_score / total_weight
+        abs_confidence = np.abs(final_score)
+
+        is_active = abs_confidence >= activation_threshold
+        actions = np.where(
+            is_active,
+            np.where(final_score > 0, Action.BUY.value, Action.SELL.value),
+            Action.WAIT.value,
+        ).astype(np.int8)
+
+        return ConsensusBatch(
+            index=index,
+            actions=actions,
+            confidences=_round_like_python(abs_confidence, 2),
+            raw_scores=_round_like_python(final_score, 4),
+            monkey_batches=list(batches),
+        )
@@ -1,6 +1,17 @@
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import numpy as np
+import pandas as pd
+
+def index_timestamps(index: pd.Index) -> Optional[np.ndarray]:
+    """
+    Returns the candle labels as int64 nanoseconds since the epoch (UTC for tz-aware
+    indexes), or None when the index is not a DatetimeIndex.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        return None
+    return index.as_unit("ns").asi8
 
 class Action(Enum):
     """
@@ -31,6 +42,126 @@ class MonkeySignal:
                 f"Confidence should be between 0.0 and 1.0, Receive: {self.confidence}"
             )
 
+@dataclass
+class MonkeySignalBatch:
+    """
+    Columnar counterpart of MonkeySignal, produced by BaseMonkey.analyze_batch().
+    Row i holds the decision the agent would take if called with analyze()
+    on the market data truncated at row i (no look-ahead).
+    """
+    monkey_name: str
+    actions: np.ndarray       # int8 Action values (-1, 0, 1), one per row
+    confidences: np.ndarray   # float64 in [0.0, 1.0], one per row
+
+    def __post_init__(self):
+        """
+        Quant validation: same guarantees as MonkeySignal, checked for every row at once.
+        """
+        self.actions = np.asarray(self.actions, dtype=np.int8)
+        self.confidences = np.asarray(self.confidences, dtype=np.float64)
+
+        if self.actions.shape != self.confidences.shape:
+            raise ValueError(
+                f"Fatal error ({self.monkey_name}): "
+                f"actions and confidences lengths differ: {self.actions.shape} vs {self.confidences.shape}"
+            )
+        if not np.all((self.confidences >= 0.0) & (self.confidences <= 1.0)):
+            raise ValueError(
+                f"Fatal error ({self.monkey_name}): "
+                f"Confidence should be between 0.0 and 1.0 on every row."
+            )
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def signal_at(self, position: int) -> MonkeySignal:
+        """
+        Rebuilds the scalar MonkeySignal for a given row position.
+        """
+        return MonkeySignal(
+            self.monkey_name,
+            Action(int(self.actions[position])),
+            float(self.confidences[position]),
+        )
+
+@dataclass
+class ConsensusBatch:
+    """
+    Columnar counterpart of the MarketOrchestrator.get_consensus() dictionary,
+    one entry per candle of `index`. Produced by get_consensus_batch().
+    The Notion 'Log_Agents' strings are only formatted on demand.
+    """
+    index: pd.Index           # candle labels of the analyzed market data
+    actions: np.ndarray       # int8 final Action values ('Signal')
+    confidences: np.ndarray   # float64 rounded to 2 decimals ('Confiance')
+    raw_scores: np.ndarray    # float64 rounded to 4 decimals ('Raw_Score')
+    monkey_batches: List[MonkeySignalBatch] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def slice(self, start: int, stop: int) -> 'ConsensusBatch':
+        """
+        Returns the candles at positions [start, stop), like `iloc[start:stop]`.
+        """
+        return ConsensusBatch(
+            index=self.index[start:stop],
+            actions=self.actions[start:stop],
+            confidences=self.confidences[start:stop],
+            raw_scores=self.raw_scores[start:stop],
+            monkey_batches=[
+                MonkeySignalBatch(b.monkey_name, b.actions[start:stop], b.confidences[start:stop])
+                for b in self.monkey_batches
+            ],
+        )
+
+    def tail(self, n: int) -> 'ConsensusBatch':
+        """
+        Returns the last n candles (the whole batch if n exceeds its length).
+        """
+        return self.slice(max(len(self) - n, 0), len(self))
+
+    def timestamps(self) -> Optional[np.ndarray]:
+        """
+        Candle labels as int64 epoch nanoseconds (None if the index is not datetime-based).
+        """
+        return index_timestamps(self.index)
+
+    def log_agents(self, position: int) -> str:
+        """
+        Formats the 'Log_Agents' string of get_consensus() for a single candle.
+        """
+        logs_notion = []
+        for batch in self.monkey_batches:
+            signal = batch.signal_at(position)
+            logs_notion.append(f"[{signal.monkey_name}: {signal.action.name} ({signal.confidence:.0%})]")
+        return " | ".join(logs_notion)
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """
+        Rebuilds the get_consensus() dictionary for a single candle, with the
+        'Date' / 'Datetime' display keys used by main.run_backtest and the int64
+        'Timestamp' (epoch nanoseconds) BacktestEngine aligns on.
+        """
+        timestamp = self.index[position]
+        record = {
+            "Signal": Action(int(self.actions[position])).name,
+            "Confiance": float(self.confidences[position]),
+            "Log_Agents": self.log_agents(position),
+            "Raw_Score": float(self.raw_scores[position]),
+            "Date": str(timestamp.date()) if hasattr(timestamp, "date") else str(timestamp),
+            "Datetime": str(timestamp),
+        }
+        if isinstance(self.index, pd.DatetimeIndex):
+            record["Timestamp"] = int(timestamp.value)
+        return record
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Expands the whole batch into the list-of-dicts format (builds every log string).
+        """
+        return [self.record(i) for i in range(len(self))]
+
 @dataclass
 class TradePlan:
     """
@@ -0,0 +1,134 @@
+import asyncio
+from typing import Optional, Tuple
+
+import ccxt.async_support as ccxt_async
+import pandas as pd
+
+from data.ccxt_fetcher import CCXTDataFetcher
+from data.rate_limiter import TokenBucket, exchange_limiter
+
+
+class AsyncCCXTDataFetcher(CCXTDataFetcher):
+    """
+    Asynchronous variant of CCXTDataFetcher, built on CCXT's async exchange classes.
+
+    fetch_async() can run concurrently for many symbols within one event loop; the
+    exchange instance is shared, and its requests are throttled by the exchange's
+    TokenBucket, together with those of the synchronous fetchers. The blocking fetch() of the BaseDataFetcher interface runs
+    fetch_async() in its own event loop.
+
+    The exchange holds an HTTP session bound to the event loop it was first used in:
+    call close() before that loop ends.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str = "binance",
+        api_key: Optional[str] = None,
+        secret: Optional[str] = None,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        """
+        Initializes the async CCXT exchange.
+
+        Args:
+            exchange_id (str): Name of the CCXT exchange ('binance', 'bybit', 'kraken'...).
+            api_key (Optional[str]): API key (optional for public read).
+            secret (Optional[str]): API secret (optional for public read).
+            max_concurrency (int): Maximum number of windows of one fetch downloaded at once
+                                   (default: 4).
+            rate_limiter (Optional[TokenBucket]): Budget of the exchange's requests (default: the
+                                                  one shared by every fetcher of the exchange in
+                                                  this process, see exchange_limiter).
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(f"Fatal error: max_concurrency must be positive, Receive: {max_concurrency}")
+        exchange_class = getattr(ccxt_async, exchange_id)
+        self.exchange: ccxt_async.Exchange = exchange_class({
+            "apiKey": api_key,
+            "secret": secret,
+            "enableRateLimit": True,
+        })
+        self.exchange_id = exchange_id
+        self.max_concurrency = max_concurrency
+        # Requests of concurrent coroutines (and of the synchronous fetchers) share one budget
+        self.rate_limiter = rate_limiter or exchange_limiter(exchange_id, self.exchange.rateLimit)
+        self.rate_limiter.install(self.exchange, asynchronous=True)
+
+    def fetch(
+        self,
+        ticker: str,
+        period: str = "6mo",
+        interval: str = "1d",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Blocking fetch (see CCXTDataFetcher.fetch), in a dedicated event loop.
+        """
+        async def run() -> pd.DataFrame:
+            try:
+                return await self.fetch_async(ticker, period=period, interval=interval, start=start, end=end)
+            finally:
+                await self.close()
+
+        return asyncio.run(run())
+
+    async def fetch_async(
+        self,
+        ticker: str,
+        period: str = "6mo",
+        interval: str = "1d",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Fetches OHLCV data without blocking the event loop. Same arguments, result and
+        errors as CCXTDataFetcher.fetch().
+        """
+        ccxt_symbol, ccxt_timeframe, since, end_ts = self._request(ticker, period, interval, start, end)
+        windows = self._windows(since, end_ts, ccxt_timeframe)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_window(window: Tuple[Optional[int], Optional[int]]) -> list:
+            async with semaphore:
+                return await self._fetch_window_async(ccxt_symbol, ccxt_timeframe, *window)
+
+        pages = await asyncio.gather(*(fetch_window(window) for window in windows))
+        raw_data = self._stitch(pages, windows, ccxt_symbol)
+        return self._to_frame(raw_data, ticker, ccxt_symbol, ccxt_timeframe, end)
+
+    async def _fetch_window_async(
+        self,
+        ccxt_symbol: str,
+        ccxt_timeframe: str,
+        since: Optional[int],
+        stop: Optional[int],
+    ) -> list:
+        """
+        Asynchronous _fetch_window().
+        """
+        raw_data = []
+        current_since = since
+        last = self._last_open(stop, ccxt_timeframe)
+
+        while True:
+            chunk = await self.exchange.fetch_ohlcv(
+                symbol=ccxt_symbol,
+                timeframe=ccxt_timeframe,
+                since=current_since,
+                limit=self.PAGE_LIMIT,
+            )
+            current_since = self._next_since(raw_data, chunk, last)
+            if current_since is None:
+                return raw_data
+
+    async def close(self) -> None:
+        """
+        Releases the exchange's HTTP session (it is reopened on the next request).
+        """
+        await self.exchange.close()
@@ -0,0 +1,100 @@
+import json
+import os
+import re
+from typing import Optional
+
+import pandas as pd
+
+from data.columnar import read_frame, write_frame
+
+
+class CandleStore:
+    """
+    Persistent local store of raw OHLCV candles, one entry per (exchange, symbol, timeframe).
+
+    Each entry holds the candles in the columnar format of data.columnar (one
+    memory-mappable .npy file per column) plus `meta.json`, which records the oldest
+    timestamp the stored history is complete from. DataFetcherRouter serves requests
+    from the store and only downloads the candles after the last stored one.
+    """
+
+    def __init__(self, root: str = os.path.join(".cache", "candles")):
+        """
+        Args:
+            root (str): Directory holding the store entries.
+        """
+        self.root = root
+
+    def load(self, exchange: str, symbol: str, timeframe: str, mmap: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Returns the stored candles (oldest first), or None if nothing is stored.
+        """
+        entry = self._entry(exchange, symbol, timeframe)
+        if self.complete_from(exchange, symbol, timeframe) is None:
+            return None
+        return read_frame(os.path.join(entry, "frame"), mmap=mmap)
+
+    def complete_from(self, exchange: str, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        """
+        Oldest timestamp from which the stored history has no missing candle
+        (the earliest start ever requested from the exchange), or None if nothing is stored.
+        """
+        meta_path = os.path.join(self._entry(exchange, symbol, timeframe), "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            return pd.Timestamp(json.load(f)["complete_from"])
+
+    def merge(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        candles: pd.DataFrame,
+        complete_from: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Adds freshly fetched candles to the entry and returns the whole stored history.
+
+        Candles are merged on their timestamp: a candle fetched again (e.g. the one that
+        was still forming) replaces the stored one. The result is sorted and unique.
+
+        Args:
+            exchange (str): Exchange id.
+            symbol (str): Market symbol.
+            timeframe (str): Candle interval.
+            candles (pd.DataFrame): Candles with a UTC DatetimeIndex.
+            complete_from (Optional[pd.Timestamp]): Start of the range `candles` were requested
+                                                    from, when it extends the complete history
+                                                    backwards (default: keep the stored one, or
+                                                    the first candle for a new entry).
+
+        Returns:
+            pd.DataFrame: The stored candles after the merge.
+        """
+        stored = self.load(exchange, symbol, timeframe)
+        previous = self.complete_from(exchange, symbol, timeframe)
+        if stored is not None and len(stored):
+            merged = pd.concat([stored, candles])
+            merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        else:
+            merged = candles.sort_index()
+
+        starts = [start for start in (previous, complete_from) if start is not None]
+        if not starts and len(merged):
+            starts = [merged.index[0]]
+        start = min(starts) if starts else pd.Timestamp.now(tz="UTC")
+
+        entry = self._entry(exchange, symbol, timeframe)
+        os.makedirs(entry, exist_ok=True)
+        meta_path = os.path.join(entry, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        write_frame(merged, os.path.join(entry, "frame"))
+        # Written last: marks the entry as complete
+        with open(meta_path, "w") as f:
+            json.dump({"complete_from": start.isoformat()}, f)
+        return merged
+
+    def _entry(self, exchange: str, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, re.sub(r"[^A-Za-z0-9._-]+", "-", f"{exchange}_{symbol}_{timeframe}"))
@@ -1,9 +1,11 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 import ccxt
 
 from data.base_fetcher import BaseDataFetcher
+from data.rate_limiter import TokenBucket, exchange_limiter
 
 
 class CCXTDataFetcher(BaseDataFetcher):
@@ -39,11 +41,16 @@ class CCXTDataFetcher(BaseDataFetcher):
         "1mo": "1M",
     }
 
+    # Candles requested per fetch_ohlcv() call, and per window of a partitioned range
+    PAGE_LIMIT = 1000
+
     def __init__(
         self,
         exchange_id: str = "binance",
         api_key: Optional[str] = None,
         secret: Optional[str] = None,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[TokenBucket] = None,
     ):
         """
         Initializes the CCXT exchange.
@@ -53,7 +60,17 @@ class CCXTDataFetcher(BaseDataFetcher):
                                Default is Binance — public OHLCV access without API key.
             api_key (Optional[str]): API key (optional for public read).
             secret (Optional[str]): API secret (optional for public read).
+            max_concurrency (int): Maximum number of windows of one fetch() downloaded at once
+                                   (default: 4, 1 for a sequential pagination).
+            rate_limiter (Optional[TokenBucket]): Budget of the exchange's requests (default: the
+                                                  one shared by every fetcher of the exchange in
+                                                  this process, see exchange_limiter).
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
         """
+        if max_concurrency <= 0:
+            raise ValueError(f"Fatal error: max_concurrency must be positive, Receive: {max_concurrency}")
         # getattr(ccxt, "binance") is equivalent to ccxt.binance()
         # This allows choosing the exchange dynamically via a string
         exchange_class = getattr(ccxt, exchange_id)
@@ -63,6 +80,10 @@ class CCXTDataFetcher(BaseDataFetcher):
             "enableRateLimit": True,  # Automatically respects API rate limits
         })
         self.exchange_id = exchange_id
+        self.max_concurrency = max_concurrency
+        # Every request (weighted by CCXT's endpoint cost) is charged to the shared budget
+        self.rate_limiter = rate_limiter or exchange_limiter(exchange_id, self.exchange.rateLimit)
+        self.rate_limiter.install(self.exchange)
 
     def _convert_ticker(self, ticker: str) -> str:
         """
@@ -121,6 +142,19 @@ class CCXTDataFetcher(BaseDataFetcher):
         """
         return self.INTERVAL_MAP.get(interval, interval)
 
+    @classmethod
+    def interval_seconds(cls, interval: str) -> int:
+        """
+        Duration of one candle of the given interval, in seconds.
+
+        Args:
+            interval (str): yfinance or CCXT interval ('1d', '1h', '1wk'...).
+
+        Returns:
+            int: The candle duration (a month counts as 30 days).
+        """
+        return int(ccxt.Exchange.parse_timeframe(cls.INTERVAL_MAP.get(interval, interval)))
+
     def fetch(
         self,
         ticker: str,
@@ -151,43 +185,177 @@ class CCXTDataFetcher(BaseDataFetcher):
             ValueError: If no data is returned or columns are missing.
             ccxt.BaseError: If the exchange returns an error (unknown symbol, etc.).
         """
-        ccxt_symbol = self._convert_ticker(ticker)
-        ccxt_timeframe = self._interval_to_ccxt(interval)
+        ccxt_symbol, ccxt_timeframe, since, end_ts = self._request(ticker, period, interval, start, end)
+        windows = self._windows(since, end_ts, ccxt_timeframe)
 
-        # Calculate start timestamp
-        if start:
-            since = int(pd.Timestamp(start, tz="UTC").timestamp() * 1000)
+        if len(windows) == 1 or self.max_concurrency == 1:
+            pages = [self._fetch_window(ccxt_symbol, ccxt_timeframe, *window) for window in windows]
         else:
-            since = self._period_to_since(period)
+            # Loaded once up front, instead of by every thread's first request
+            self.exchange.load_markets()
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(windows))) as pool:
+                pages = list(pool.map(lambda window: self._fetch_window(ccxt_symbol, ccxt_timeframe, *window), windows))
+
+        raw_data = self._stitch(pages, windows, ccxt_symbol)
+        return self._to_frame(raw_data, ticker, ccxt_symbol, ccxt_timeframe, end)
 
+    def _fetch_window(
+        self,
+        ccxt_symbol: str,
+        ccxt_timeframe: str,
+        since: Optional[int],
+        stop: Optional[int],
+    ) -> list:
+        """
+        Paginates through the candles opened in [since, stop) (bypassing exchange limits
+        e.g. 1000 candles). The last page may run past `stop`, see _stitch().
+        """
         raw_data = []
         current_since = since
-        
-        # Pagination loop to fetch all historical data needed (bypassing exchange limits e.g. 1000 candles)
+        last = self._last_open(stop, ccxt_timeframe)
+
         while True:
             chunk = self.exchange.fetch_ohlcv(
                 symbol=ccxt_symbol,
                 timeframe=ccxt_timeframe,
                 since=current_since,
-                limit=1000,
+                limit=self.PAGE_LIMIT,
             )
+            current_since = self._next_since(raw_data, chunk, last)
+            if current_since is None:
+                return raw_data
+
+    @staticmethod
+    def _last_open(stop: Optional[int], ccxt_timeframe: str) -> Optional[int]:
+        """
+        Latest open time (ms) of a candle needed before `stop` (exclusive): pagination ends
+        once it is reached, without asking for the next, unwanted page.
+        """
+        if stop is None:
+            return None
+        if ccxt_timeframe.endswith("M"):
+            # Months vary in length: only the candles opened at or after stop are known to be unwanted
+            return stop - 1
+        return stop - int(ccxt.Exchange.parse_timeframe(ccxt_timeframe)) * 1000
+
+    def _windows(
+        self,
+        since: Optional[int],
+        end_ts: Optional[int],
+        ccxt_timeframe: str,
+    ) -> List[Tuple[Optional[int], Optional[int]]]:
+        """
+        Splits the requested range into [start, stop) windows of PAGE_LIMIT candles (ms
+        timestamps), which can be fetched independently: one request each, usually.
+
+        A range without a start, or in months (whose length varies), is a single window
+        paginated sequentially.
+        """
+        if since is None or ccxt_timeframe.endswith("M"):
+            return [(since, end_ts + 1 if end_ts is not None else None)]
+
+        step = self.PAGE_LIMIT * int(ccxt.Exchange.parse_timeframe(ccxt_timeframe)) * 1000
+        stop = end_ts + 1 if end_ts is not None else int(datetime.now(timezone.utc).timestamp() * 1000) + 1
+        if stop - since <= step:
+            # Unbounded request: candles opened during the call are still wanted
+            return [(since, end_ts + 1 if end_ts is not None else None)]
+
+        windows = [(start, min(start + step, stop)) for start in range(since, stop, step)]
+        if end_ts is None:
+            windows[-1] = (windows[-1][0], None)
+        return windows
 
-            if not chunk:
-                break
+    def _stitch(
+        self,
+        pages: List[list],
+        windows: List[Tuple[Optional[int], Optional[int]]],
+        ccxt_symbol: str,
+    ) -> list:
+        """
+        Concatenates the candles of consecutive windows, keeping each window's own range
+        (once per timestamp).
+
+        Raises:
+            ValueError: If a window came back empty although later windows have candles:
+                        the exchange returns the first candles after `since`, so that would
+                        leave a hole in the history.
+        """
+        raw_data = []
+        for i, (page, (start, stop)) in enumerate(zip(pages, windows)):
+            if not page and any(pages[i + 1:]):
+                raise ValueError(
+                    f"Fatal error: {self.exchange_id} returned no candle for '{ccxt_symbol}' "
+                    f"from {pd.Timestamp(start, unit='ms', tz='UTC')} although later candles exist."
+                )
+            for candle in page:
+                if stop is not None and candle[0] >= stop:
+                    continue
+                if raw_data and candle[0] <= raw_data[-1][0]:
+                    continue
+                raw_data.append(candle)
+        return raw_data
+
+    def _request(
+        self,
+        ticker: str,
+        period: str,
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+    ) -> Tuple[str, str, Optional[int], Optional[int]]:
+        """
+        Translates a fetch request into CCXT terms.
+
+        Returns:
+            Tuple[str, str, Optional[int], Optional[int]]: The CCXT symbol and timeframe, and the
+                                                           start / end timestamps in ms (None if unset).
+        """
+        ccxt_symbol = self._convert_ticker(ticker)
+        ccxt_timeframe = self._interval_to_ccxt(interval)
+
+        # Calculate start timestamp
+        if start:
+            since = int(pd.Timestamp(start, tz="UTC").timestamp() * 1000)
+        else:
+            since = self._period_to_since(period)
+        end_ts = int(pd.Timestamp(end, tz="UTC").timestamp() * 1000) if end else None
+        return ccxt_symbol, ccxt_timeframe, since, end_ts
+
+    @staticmethod
+    def _next_since(raw_data: list, chunk: list, end_ts: Optional[int]) -> Optional[int]:
+        """
+        Appends a page of candles to raw_data and returns the `since` of the next page,
+        or None when the pagination is over.
+        """
+        if not chunk:
+            return None
 
-            # Prevent infinite loop if API returns the same data
-            if raw_data and chunk[-1][0] <= raw_data[-1][0]:
-                break
+        # Prevent infinite loop if API returns the same data
+        if raw_data and chunk[-1][0] <= raw_data[-1][0]:
+            return None
 
-            raw_data.extend(chunk)
-            current_since = chunk[-1][0] + 1  # +1ms to avoid fetching the exact same last candle
+        raw_data.extend(chunk)
+        next_since = chunk[-1][0] + 1  # +1ms to avoid fetching the exact same last candle
 
-            # Early break if we have reached the end date
-            if end:
-                end_ts = int(pd.Timestamp(end, tz="UTC").timestamp() * 1000)
-                if current_since > end_ts:
-                    break
+        # Early break if we have reached the end date
+        if end_ts is not None and next_since > end_ts:
+            return None
+        return next_since
 
+    def _to_frame(
+        self,
+        raw_data: list,
+        ticker: str,
+        ccxt_symbol: str,
+        ccxt_timeframe: str,
+        end: Optional[str],
+    ) -> pd.DataFrame:
+        """
+        Builds the normalized OHLCV DataFrame from CCXT candles.
+
+        Raises:
+            ValueError: If no data was returned or columns are missing.
+        """
         if not raw_data:
             raise ValueError(
                 f"No data returned by {self.exchange_id} "
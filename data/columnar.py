@@ -0,0 +1,187 @@
+import json
+import os
+import shutil
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Name of the metadata file; it is written last and marks a complete frame
+_META_FILE = "columns.json"
+# Prefix of the frames written by append_part()
+_PART_PREFIX = "part-"
+
+
+def write_frame(df: pd.DataFrame, directory: str) -> None:
+    """
+    Stores a DataFrame as a directory of NumPy arrays: one .npy file per column
+    plus the index (int64 ticks for a DatetimeIndex, in its own time unit).
+
+    Each column can then be loaded (or memory-mapped) on its own, without parsing
+    the rest of the file. The frame is first written to a sibling temporary
+    directory, then swapped in, so a reader never sees a half-written frame.
+
+    Args:
+        df (pd.DataFrame): The frame to store. Columns must have a fixed-width NumPy dtype
+                           or hold text without missing values.
+        directory (str): Target directory (replaced if it exists).
+
+    Raises:
+        ValueError: If a column holds Python objects or missing text values.
+    """
+    staging = f"{directory}.tmp"
+    if os.path.exists(staging):
+        shutil.rmtree(staging)
+    os.makedirs(staging)
+
+    columns = []
+    for position, name in enumerate(df.columns):
+        values = encode_column(df[name])
+        np.save(os.path.join(staging, f"{position}.npy"), values, allow_pickle=False)
+        columns.append({"name": name, "dtype": values.dtype.str})
+
+    index_values, meta_index = encode_index(df.index)
+    np.save(os.path.join(staging, "index.npy"), index_values, allow_pickle=False)
+
+    with open(os.path.join(staging, _META_FILE), "w") as f:
+        json.dump({"rows": len(df), "columns": columns, "index": meta_index}, f)
+
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.replace(staging, directory)
+
+
+def append_part(df: pd.DataFrame, directory: str) -> None:
+    """
+    Appends a block of rows to a partitioned frame: every call stores a new
+    `part-NNNNN` frame (see write_frame) inside `directory`.
+
+    Used to write large results incrementally, one bounded block at a time.
+
+    Args:
+        df (pd.DataFrame): The rows to append (same columns as the previous parts).
+        directory (str): The partitioned frame directory (created if needed).
+    """
+    os.makedirs(directory, exist_ok=True)
+    position = len(_parts(directory))
+    write_frame(df, os.path.join(directory, f"{_PART_PREFIX}{position:05d}"))
+
+
+def iter_parts(directory: str, mmap: bool = False) -> Iterator[pd.DataFrame]:
+    """
+    Yields the parts of a partitioned frame in order (a single frame for a
+    directory written by write_frame).
+    """
+    if os.path.exists(os.path.join(directory, _META_FILE)):
+        yield read_frame(directory, mmap=mmap)
+        return
+    for part in _parts(directory):
+        yield read_frame(part, mmap=mmap)
+
+
+def iter_chunks(directory: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Reads a stored frame (single or partitioned) as blocks of at most `chunk_size` rows.
+
+    The columns are memory-mapped and only one block is copied into memory at a time,
+    so frames larger than the available memory can be processed.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Fatal error: chunk_size must be positive, Receive: {chunk_size}")
+    for part in iter_parts(directory, mmap=True):
+        for start in range(0, len(part), chunk_size):
+            yield part.iloc[start:start + chunk_size].copy()
+
+
+def read_frame(directory: str, mmap: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Loads a frame stored by write_frame() (or all the parts written by append_part()).
+
+    Args:
+        directory (str): The frame directory.
+        mmap (bool): Memory-map the column files instead of reading them.
+
+    Returns:
+        Optional[pd.DataFrame]: The frame, or None if the directory holds no complete frame.
+    """
+    meta_path = os.path.join(directory, _META_FILE)
+    if not os.path.exists(meta_path):
+        parts = _parts(directory)
+        if not parts:
+            return None
+        return pd.concat([read_frame(part, mmap=mmap) for part in parts])
+    with open(meta_path) as f:
+        meta = json.load(f)
+
+    mode = "r" if mmap else None
+    index_values = np.load(os.path.join(directory, "index.npy"), mmap_mode=mode, allow_pickle=False)
+    index = decode_index(index_values, meta["index"])
+
+    data = {
+        column["name"]: np.load(os.path.join(directory, f"{position}.npy"), mmap_mode=mode, allow_pickle=False)
+        for position, column in enumerate(meta["columns"])
+    }
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+def encode_column(series: pd.Series) -> np.ndarray:
+    """
+    Fixed-width NumPy array of a column. Text columns (e.g. the fetcher's 'source')
+    become fixed-width unicode arrays.
+
+    Raises:
+        ValueError: If the column holds Python objects or missing text values.
+    """
+    values = series.to_numpy()
+    if values.dtype == object:
+        if not pd.api.types.is_string_dtype(series) or series.isna().any():
+            raise ValueError(f"Fatal error: Column '{series.name}' has an object dtype and cannot be stored as columnar data.")
+        values = np.asarray(values, dtype=str)
+    return values
+
+
+def encode_index(index: pd.Index) -> Tuple[np.ndarray, dict]:
+    """
+    Index values (int64 ticks for a DatetimeIndex, in its own time unit) and the
+    JSON-serializable metadata decode_index() needs to rebuild it.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        meta = {"kind": "datetime", "unit": index.unit, "tz": str(index.tz) if index.tz is not None else None}
+        values = index.asi8
+    else:
+        meta = {"kind": "values"}
+        values = index.to_numpy()
+    meta["name"] = index.name
+    return values, meta
+
+
+def decode_index(values: np.ndarray, meta: dict) -> pd.Index:
+    """
+    Rebuilds an index stored by encode_index().
+    """
+    if meta["kind"] == "datetime":
+        index = pd.DatetimeIndex(np.asarray(values).view(f"datetime64[{meta['unit']}]"))
+        if meta["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+    else:
+        index = pd.Index(values)
+    index.name = meta["name"]
+    return index
+
+
+def _parts(directory: str) -> List[str]:
+    """
+    Complete parts of a partitioned frame, in append order.
+    """
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(
+        name for name in os.listdir(directory) if name.startswith(_PART_PREFIX) and not name.endswith(".tmp")
+    )
+    return [
+        os.path.join(directory, name) for name in names
+        if os.path.exists(os.path.join(directory, name, _META_FILE))
+    ]
@@ -0,0 +1,46 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Storage dtype of the prices, volumes and features in compact mode
+COMPACT_FLOAT = np.float32
+
+
+def compact_frame(df: pd.DataFrame, exclude: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Returns a compact copy of a market DataFrame, for large (e.g. minute-level) histories.
+
+    - float64 columns (OHLCV, features) are stored as float32: half the memory and cache
+      bandwidth, ~7 significant digits (prices are known to far fewer);
+    - a text column holding a single value on every row (the fetcher's 'source') is
+      dropped and its value moved to `df.attrs`, e.g. df.attrs['source'] == 'binance';
+      other text columns become categoricals.
+
+    Indicators still compute in float64 (see FeatureContext.column): only the storage
+    is compact.
+
+    Args:
+        df (pd.DataFrame): The market data.
+        exclude (Optional[Sequence[str]]): Columns to keep as they are.
+
+    Returns:
+        pd.DataFrame: The compact frame (same index and row order).
+    """
+    exclude = set(exclude or ())
+    compact = df.copy()
+    for name in df.columns:
+        if name in exclude:
+            continue
+        column = df[name]
+        if column.dtype == np.float64:
+            compact[name] = column.astype(COMPACT_FLOAT)
+        elif pd.api.types.is_string_dtype(column) and not isinstance(column.dtype, pd.CategoricalDtype):
+            values = column.unique()
+            if len(values) == 1 and isinstance(values[0], str):
+                compact.attrs[name] = values[0]
+                compact.drop(columns=[name], inplace=True)
+            else:
+                compact[name] = column.astype("category")
+    return compact
+
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+class FetchCache:
+    """
+    In-memory cache of fetched frames, with single-flight request coalescing.
+
+    - Entries expire `ttl` seconds after they were fetched, and the least recently used
+      entry is evicted beyond `max_entries`.
+    - Concurrent identical requests (threads in get(), coroutines in get_async()) share one
+      in-flight fetch: the first caller fetches, the others wait for its result (or error).
+      Errors are never cached.
+    - Every caller receives its own shallow copy of a cached or shared frame: with pandas'
+      Copy-on-Write, adding columns (as FeaturePipeline does) or writing values into it
+      copies the touched data instead of modifying the cached frame.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: int = 64):
+        """
+        Args:
+            ttl (Optional[float]): Lifetime of an entry in seconds (None: results are not kept,
+                                   only concurrent requests are coalesced).
+            max_entries (int): Maximum number of cached frames (default: 64).
+
+        Raises:
+            ValueError: If ttl is negative or max_entries is not positive.
+        """
+        if ttl is not None and ttl < 0:
+            raise ValueError(f"Fatal error: ttl must be non-negative, Receive: {ttl}")
+        if max_entries <= 0:
+            raise ValueError(f"Fatal error: max_entries must be positive, Receive: {max_entries}")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._in_flight_async: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Returns the cached frame of `key`, or fetches it (once for all concurrent callers).
+
+        Args:
+            key (Hashable): Identity of the request.
+            fetch (Callable[[], pd.DataFrame]): Fetches the frame on a cache miss.
+
+        Returns:
+            pd.DataFrame: A copy of the frame.
+        """
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached.copy(deep=False)
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result().copy(deep=False)
+
+        try:
+            df = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            stored = self._store(key, df)
+            del self._in_flight[key]
+        future.set_result(df)
+        return df.copy(deep=False) if stored else df
+
+    async def get_async(self, key: Hashable, fetch: Callable[[], Awaitable[pd.DataFrame]]) -> pd.DataFrame:
+        """
+        Asynchronous get(): coalesces the identical requests of the coroutines of one event loop.
+        """
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached.copy(deep=False)
+        future = self._in_flight_async.get(key)
+        if future is not None:
+            return (await asyncio.shield(future)).copy(deep=False)
+
+        future = self._in_flight_async[key] = asyncio.get_running_loop().create_future()
+        try:
+            df = await fetch()
+        except BaseException as e:
+            del self._in_flight_async[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Marked as retrieved when no other coroutine awaited it
+            raise
+        with self._lock:
+            stored = self._store(key, df)
+        del self._in_flight_async[key]
+        future.set_result(df)
+        return df.copy(deep=False) if stored else df
+
+    def clear(self) -> None:
+        """
+        Drops every cached frame.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: Hashable) -> Optional[pd.DataFrame]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, df = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return df
+
+    def _store(self, key: Hashable, df: pd.DataFrame) -> bool:
+        if not self.ttl:
+            return False
+        self._entries[key] = (time.monotonic() + self.ttl, df)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
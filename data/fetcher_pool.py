@@ -0,0 +1,72 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+from data.ccxt_fetcher import CCXTDataFetcher
+
+
+class FetcherPool:
+    """
+    Reusable fetchers of one exchange, each used by one thread at a time.
+
+    CCXT's synchronous exchanges keep their HTTP connections alive in a per-instance
+    session: reusing the instances spares the TCP/TLS handshakes and the market loading,
+    and threads fetching different tickers do not share an instance. At most `size`
+    instances are created; extra threads wait for one to be released. Their requests
+    are throttled by the exchange's shared TokenBucket (see data.rate_limiter).
+    """
+
+    def __init__(self, factory: Callable[[], CCXTDataFetcher], size: int = 4):
+        """
+        Args:
+            factory (Callable[[], CCXTDataFetcher]): Creates a new fetcher.
+            size (int): Maximum number of fetchers (default: 4).
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size <= 0:
+            raise ValueError(f"Fatal error: pool size must be positive, Receive: {size}")
+        self.factory = factory
+        self.size = size
+        # Most recently released last: its connections are the most likely to still be open
+        self._idle: List[CCXTDataFetcher] = []
+        self._created = 0
+        self._released = threading.Condition()
+
+    def add(self, fetcher: CCXTDataFetcher) -> None:
+        """
+        Adds an existing fetcher to the pool (it counts towards `size`).
+        """
+        with self._released:
+            self._created += 1
+            self._idle.append(fetcher)
+            self._released.notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[CCXTDataFetcher]:
+        """
+        Lends a fetcher for the duration of the `with` block.
+        """
+        with self._released:
+            while not self._idle and self._created >= self.size:
+                self._released.wait()
+            fetcher = self._idle.pop() if self._idle else None
+            if fetcher is None:
+                self._created += 1
+
+        if fetcher is None:
+            try:
+                fetcher = self.factory()
+            except Exception:
+                with self._released:
+                    self._created -= 1
+                    self._released.notify()
+                raise
+
+        try:
+            yield fetcher
+        finally:
+            with self._released:
+                self._idle.append(fetcher)
+                self._released.notify()
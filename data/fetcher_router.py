@@ -1,9 +1,16 @@
+import asyncio
+import threading
 import warnings
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 import pandas as pd
 
+from data.async_ccxt_fetcher import AsyncCCXTDataFetcher
 from data.base_fetcher import BaseDataFetcher
+from data.candle_store import CandleStore
 from data.ccxt_fetcher import CCXTDataFetcher
+from data.fetch_cache import FetchCache
+from data.fetcher_pool import FetcherPool
+from data.compact import compact_frame
 
 
 class DataFetcherRouter(BaseDataFetcher):
@@ -22,6 +29,12 @@ class DataFetcherRouter(BaseDataFetcher):
         self,
         default_crypto_exchange: str = "binance",
         api_keys: Optional[dict] = None,
+        compact: bool = False,
+        store: Optional[CandleStore] = None,
+        max_concurrency: int = 4,
+        pool_size: int = 4,
+        cache_ttl: Optional[float] = 300.0,
+        cache_size: int = 64,
     ):
         """
         Initializes the router with the CCXT exchanges.
@@ -30,23 +43,143 @@ class DataFetcherRouter(BaseDataFetcher):
             default_crypto_exchange (str): Default CCXT exchange for cryptos (default: 'binance').
             api_keys (Optional[dict]): Dictionary mapping exchange names to their API keys.
                                        e.g., {"binance": {"api_key": "x", "secret": "y"}}
+            compact (bool): Return float32 OHLCV with the 'source' moved to `df.attrs['source']`
+                            (see data.compact.compact_frame), for large histories.
+            store (Optional[CandleStore]): Local candle store. When set, requests are served
+                                           from disk and only the candles after the last
+                                           stored one are downloaded.
+            max_concurrency (int): Maximum number of concurrent fetch_async() requests per
+                                   exchange (default: 4).
+            pool_size (int): Maximum number of CCXT instances per exchange used by threads
+                             calling fetch() concurrently (default: 4), see FetcherPool.
+            cache_ttl (Optional[float]): Seconds during which a fetched frame is served again from
+                                         memory for an identical request (default: 300, five
+                                         minutes; None disables the memory cache). Concurrent
+                                         identical requests always share one fetch, see FetchCache.
+            cache_size (int): Maximum number of frames kept in memory (default: 64).
+
+        Every exchange's requests, from all the threads and coroutines of the process, share
+        one TokenBucket sized on the exchange's rate limit (see data.rate_limiter).
+
+        Raises:
+            ValueError: If max_concurrency, pool_size or cache_size is not positive.
         """
+        if max_concurrency <= 0:
+            raise ValueError(f"Fatal error: max_concurrency must be positive, Receive: {max_concurrency}")
+        if pool_size <= 0:
+            raise ValueError(f"Fatal error: pool_size must be positive, Receive: {pool_size}")
+        if cache_size <= 0:
+            raise ValueError(f"Fatal error: cache_size must be positive, Receive: {cache_size}")
         self.default_crypto_exchange = default_crypto_exchange
         self.api_keys = api_keys or {}
+        self.compact = compact
+        self.store = store
+        
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        # Identical (exchange, ticker, period, interval, start, end) requests share their result
+        self.memory = FetchCache(ttl=cache_ttl, max_entries=cache_size)
         
         # Cache for dynamically instantiated CCXT fetchers
         self._ccxt_fetchers = {}
+        # Reusable fetchers for concurrent fetch() calls, seeded with the cached one
+        self._pools: Dict[str, FetcherPool] = {}
+        self._pools_lock = threading.Lock()
+        # Async fetchers and their concurrency limits, bound to the running event loop
+        self._async_fetchers: Dict[str, AsyncCCXTDataFetcher] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
         
     def _get_ccxt_fetcher(self, exchange_id: str) -> 'CCXTDataFetcher':
         """Retrieves or creates a CCXT fetcher for a given exchange."""
         if exchange_id not in self._ccxt_fetchers:
+            self._ccxt_fetchers[exchange_id] = self._new_ccxt_fetcher(exchange_id)
+        return self._ccxt_fetchers[exchange_id]
+
+    def _new_ccxt_fetcher(self, exchange_id: str) -> CCXTDataFetcher:
+        keys = self.api_keys.get(exchange_id, {})
+        return CCXTDataFetcher(
+            exchange_id=exchange_id,
+            api_key=keys.get("api_key"),
+            secret=keys.get("secret"),
+        )
+
+    def _get_pool(self, exchange_id: str) -> FetcherPool:
+        """Retrieves or creates the pool of CCXT fetchers of a given exchange."""
+        with self._pools_lock:
+            if exchange_id not in self._pools:
+                pool = FetcherPool(lambda: self._new_ccxt_fetcher(exchange_id), size=self.pool_size)
+                pool.add(self._get_ccxt_fetcher(exchange_id))
+                self._pools[exchange_id] = pool
+            return self._pools[exchange_id]
+
+    def _get_async_fetcher(self, exchange_id: str) -> AsyncCCXTDataFetcher:
+        """Retrieves or creates an async CCXT fetcher (and its concurrency limit) for a given exchange."""
+        if exchange_id not in self._async_fetchers:
             keys = self.api_keys.get(exchange_id, {})
-            self._ccxt_fetchers[exchange_id] = CCXTDataFetcher(
+            self._async_fetchers[exchange_id] = AsyncCCXTDataFetcher(
                 exchange_id=exchange_id,
                 api_key=keys.get("api_key"),
                 secret=keys.get("secret"),
             )
-        return self._ccxt_fetchers[exchange_id]
+            self._semaphores[exchange_id] = asyncio.Semaphore(self.max_concurrency)
+        return self._async_fetchers[exchange_id]
+
+    def resolve(self, ticker: str) -> Tuple[str, str]:
+        """
+        Splits an optionally prefixed ticker into its exchange and symbol.
+
+        Args:
+            ticker (str): Asset symbol, optionally prefixed with provider (e.g., 'kraken:BTC/USDT').
+
+        Returns:
+            Tuple[str, str]: The exchange id and the bare ticker.
+        """
+        if ":" in ticker:
+            prefix, clean_ticker = ticker.split(":", 1)
+            return prefix.lower(), clean_ticker
+        return self.default_crypto_exchange, ticker
+
+    def fetch_recent(self, ticker: str, bars: int, interval: str = "1d") -> pd.DataFrame:
+        """
+        Fetches just enough recent history: the last `bars` closed candles plus the
+        one currently forming, instead of a fixed period.
+
+        Typically called with FeaturePipeline.lookback, so that the features of the
+        latest candle are fully warmed up without downloading months of data.
+
+        Args:
+            ticker (str): Asset symbol, optionally prefixed with provider (e.g., 'binance:BTC/USDT').
+            bars (int): Number of candles needed.
+            interval (str): Candle interval.
+
+        Returns:
+            pd.DataFrame: Normalized OHLCV DataFrame (fewer rows if the market has gaps).
+
+        Raises:
+            ValueError: If bars is not positive.
+        """
+        return self.fetch(ticker=ticker, interval=interval, start=self._recent_start(bars, interval))
+
+    async def fetch_recent_async(self, ticker: str, bars: int, interval: str = "1d") -> pd.DataFrame:
+        """
+        Asynchronous fetch_recent(), see fetch_async().
+        """
+        return await self.fetch_async(ticker=ticker, interval=interval, start=self._recent_start(bars, interval))
+
+    @staticmethod
+    def _recent_start(bars: int, interval: str) -> str:
+        """
+        Start date of a fetch_recent() request.
+
+        Raises:
+            ValueError: If bars is not positive.
+        """
+        if bars <= 0:
+            raise ValueError(f"Fatal error: bars must be positive, Receive: {bars}")
+        seconds = CCXTDataFetcher.interval_seconds(interval)
+        # The candle opened bars + 1 intervals ago is the oldest one needed
+        start = pd.Timestamp.now(tz="UTC") - pd.Timedelta(seconds=seconds * (bars + 1))
+        return start.strftime("%Y-%m-%d %H:%M:%S")
 
     def fetch(
         self,
@@ -74,23 +207,140 @@ class DataFetcherRouter(BaseDataFetcher):
             pd.DataFrame: Normalized OHLCV DataFrame, transparent source for the caller.
         """
         # Parse explicit provider prefix from ticker (e.g. "kraken:BTC/USDT")
-        exchange_id = self.default_crypto_exchange
-        clean_ticker = ticker
-        
-        if ":" in ticker:
-            prefix, clean_ticker = ticker.split(":", 1)
-            exchange_id = prefix.lower()
+        exchange_id, clean_ticker = self.resolve(ticker)
         
         kwargs = dict(ticker=clean_ticker, period=period, interval=interval, start=start, end=end)
 
-        try:
-            fetcher = self._get_ccxt_fetcher(exchange_id)
-            df = fetcher.fetch(**kwargs)
-            print(f"✅ [{clean_ticker}] Data fetched via CCXT ({exchange_id})")
+        def download() -> pd.DataFrame:
+            try:
+                with self._get_pool(exchange_id).checkout() as fetcher:
+                    if self.store is not None:
+                        df = self._fetch_stored(fetcher.fetch, exchange_id, **kwargs)
+                    else:
+                        df = fetcher.fetch(**kwargs)
+                return self._finish(df, exchange_id, clean_ticker)
+            except Exception as e:
+                raise self._fetch_error(exchange_id, clean_ticker, e) from e
+
+        return self.memory.get((exchange_id, *kwargs.values()), download)
+
+    async def fetch_async(
+        self,
+        ticker: str,
+        period: str = "6mo",
+        interval: str = "1d",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Asynchronous fetch(): many tickers can be fetched concurrently from one event loop,
+        e.g. with asyncio.gather() or asyncio.as_completed().
+
+        Each exchange gets one async CCXT instance, whose rate limiter spaces the requests
+        of all the coroutines, and at most `max_concurrency` requests in flight. Call
+        close_async() before the event loop ends.
+
+        Args:
+            ticker (str): Asset symbol, optionally prefixed with provider (e.g., 'binance:BTC/USDT').
+            period (str): Lookback period.
+            interval (str): Candle interval.
+            start (Optional[str]): Start date.
+            end (Optional[str]): End date.
+
+        Returns:
+            pd.DataFrame: Normalized OHLCV DataFrame, as returned by fetch().
+
+        Raises:
+            RuntimeError: If the exchange fails to return the data.
+        """
+        exchange_id, clean_ticker = self.resolve(ticker)
+        kwargs = dict(ticker=clean_ticker, period=period, interval=interval, start=start, end=end)
+
+        async def download_async() -> pd.DataFrame:
+            try:
+                fetcher = self._get_async_fetcher(exchange_id)
+                async with self._semaphores[exchange_id]:
+                    if self.store is not None:
+                        # The store logic (disk I/O) runs in a thread, the downloads in this loop
+                        loop = asyncio.get_running_loop()
+                        def download(**request) -> pd.DataFrame:
+                            return asyncio.run_coroutine_threadsafe(fetcher.fetch_async(**request), loop).result()
+                        df = await asyncio.to_thread(self._fetch_stored, download, exchange_id, **kwargs)
+                    else:
+                        df = await fetcher.fetch_async(**kwargs)
+                return self._finish(df, exchange_id, clean_ticker)
+            except Exception as e:
+                raise self._fetch_error(exchange_id, clean_ticker, e) from e
+
+        return await self.memory.get_async((exchange_id, *kwargs.values()), download_async)
+
+    async def close_async(self) -> None:
+        """
+        Closes the async exchange sessions opened by fetch_async() in the running event loop.
+        """
+        fetchers = list(self._async_fetchers.values())
+        self._async_fetchers.clear()
+        self._semaphores.clear()
+        for fetcher in fetchers:
+            await fetcher.close()
+
+    def _finish(self, df: pd.DataFrame, exchange_id: str, clean_ticker: str) -> pd.DataFrame:
+        if self.compact:
+            df = compact_frame(df)
+        print(f"✅ [{clean_ticker}] Data fetched via CCXT ({exchange_id})")
+        return df
+
+    @staticmethod
+    def _fetch_error(exchange_id: str, clean_ticker: str, error: Exception) -> RuntimeError:
+        # We fail fast, no silent fallback to avoid dissonances or bad data integrations
+        return RuntimeError(
+            f"🚨 Fatal Error: CCXT ({exchange_id}) failed to fetch data for '{clean_ticker}'. "
+            f"Original error: {error}"
+        )
+
+    def _fetch_stored(
+        self,
+        download: Callable[..., pd.DataFrame],
+        exchange_id: str,
+        ticker: str,
+        period: str,
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+    ) -> pd.DataFrame:
+        """
+        Serves a request from the candle store, downloading only what it lacks:
+        the candles after the last stored one (that one included, as it may have still
+        been forming), or the whole range when the store does not reach back far enough.
+        `download` takes the keyword arguments of fetch() and returns the exchange's candles.
+        """
+        if start is not None:
+            since = pd.Timestamp(start, tz="UTC")
+        elif period in CCXTDataFetcher.PERIOD_MAP:
+            since = pd.Timestamp.now(tz="UTC") - pd.Timedelta(CCXTDataFetcher.PERIOD_MAP[period])
+        else:
+            # Unknown period: the exchange picks the range, nothing can be served from disk
+            df = download(ticker=ticker, period=period, interval=interval, start=start, end=end)
+            self.store.merge(exchange_id, ticker, interval, df)
             return df
-        except Exception as e:
-            # We fail fast, no silent fallback to avoid dissonances or bad data integrations
-            raise RuntimeError(
-                f"🚨 Fatal Error: CCXT ({exchange_id}) failed to fetch data for '{clean_ticker}'. "
-                f"Original error: {e}"
-            ) from e
+        end_ts = pd.Timestamp(end, tz="UTC") if end else None
+
+        complete_from = self.store.complete_from(exchange_id, ticker, interval)
+        stored = self.store.load(exchange_id, ticker, interval)
+        if complete_from is None or since < complete_from or stored is None or len(stored) == 0:
+            # Up to now when candles are stored, so that no hole is left before them
+            fresh_end = end if stored is None or len(stored) == 0 else None
+            fresh = download(ticker=ticker, period=period, interval=interval, start=since.isoformat(), end=fresh_end)
+            candles = self.store.merge(exchange_id, ticker, interval, fresh, complete_from=since)
+        elif end_ts is not None and stored.index[-1] >= end_ts:
+            candles = stored
+        else:
+            fresh = download(ticker=ticker, period=period, interval=interval, start=stored.index[-1].isoformat(), end=end)
+            candles = self.store.merge(exchange_id, ticker, interval, fresh)
+
+        candles = candles[candles.index >= since]
+        if end_ts is not None:
+            candles = candles[candles.index <= end_ts]
+        if candles.empty:
+            raise ValueError(f"Fatal error: No stored candles for '{ticker}' ({interval}) in the requested range.")
+        return candles
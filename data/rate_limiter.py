@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second refill the bucket, up to `capacity`.
+
+    A request charges its cost to the bucket and is sent once the bucket is back to zero
+    tokens (the bucket can go into debt: callers queue up in reservation order). Each caller
+    reserves its slot under the lock, then waits outside of it, so threads (acquire) and
+    coroutines (acquire_async) can share one budget.
+
+    CCXT exchanges route every request through their `throttle(cost)` method, with the
+    endpoint's weight as cost; install() replaces it with the bucket. CCXT's own
+    synchronous throttle reads and writes the timestamp of the last request without a lock
+    and is per instance: threads, or several instances of the same exchange, burst past
+    the exchange's budget.
+
+    The bucket's state lives in memory: it is shared by the threads and coroutines of one
+    process only. Separate processes (e.g. two scripts running at the same time) each get
+    their own budget and must be kept under the exchange's limit by the caller.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate (float): Tokens refilled per second (requests per second at cost 1).
+            capacity (float): Maximum number of tokens, i.e. requests sent back to back
+                              (default: 1, evenly spaced requests).
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"Fatal error: rate and capacity must be positive, Receive: {rate}, {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """
+        Charges a request and returns how long (in seconds) the caller must wait before sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= cost
+            return max(0.0, -self._tokens) / self.rate
+
+    def acquire(self, cost: Optional[float] = None) -> None:
+        """
+        Blocks until the caller may send a request of the given cost (default: 1).
+        """
+        wait = self.reserve(1.0 if cost is None else cost)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, cost: Optional[float] = None) -> None:
+        """
+        Asynchronous acquire(): waits without blocking the event loop.
+        """
+        wait = self.reserve(1.0 if cost is None else cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def install(self, exchange, asynchronous: bool = False) -> None:
+        """
+        Makes a CCXT exchange instance throttle its requests with this bucket.
+
+        Args:
+            exchange: A ccxt (or ccxt.async_support) exchange with enableRateLimit.
+            asynchronous (bool): True for an exchange of ccxt.async_support.
+        """
+        exchange.throttle = self.acquire_async if asynchronous else self.acquire
+
+
+_EXCHANGE_BUCKETS: Dict[str, TokenBucket] = {}
+_EXCHANGE_BUCKETS_LOCK = threading.Lock()
+
+
+def exchange_limiter(exchange_id: str, rate_limit_ms: float) -> TokenBucket:
+    """
+    The token bucket shared by every fetcher of an exchange in this process.
+
+    Buckets are not shared across processes: all the fetching of this project (router
+    thread pool, morning_run's asyncio scan, windowed CCXT downloads) runs in one process,
+    and the process pools of the sweeps only backtest data that was already fetched.
+
+    Args:
+        exchange_id (str): CCXT exchange id.
+        rate_limit_ms (float): The exchange's `rateLimit` (ms per unit of cost), used when
+                               the bucket is created.
+
+    Returns:
+        TokenBucket: The exchange's bucket.
+    """
+    with _EXCHANGE_BUCKETS_LOCK:
+        if exchange_id not in _EXCHANGE_BUCKETS:
+            _EXCHANGE_BUCKETS[exchange_id] = TokenBucket(rate=1000 / max(float(rate_limit_ms), 1e-3))
+        return _EXCHANGE_BUCKETS[exchange_id]
@@ -0,0 +1,151 @@
+import os
+import threading
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from data.columnar import decode_index, encode_column, encode_index
+
+# Every array starts on a cache line
+_ALIGNMENT = 64
+# Segments attached by this process, kept open for as long as the process lives
+_ATTACHED: Dict[str, SharedMemory] = {}
+_ATTACH_LOCK = threading.Lock()
+
+
+class SharedFrame:
+    """
+    A DataFrame published once in shared memory, for process-pool workers.
+
+    The columns (OHLCV and features) and the index are copied into a single
+    multiprocessing.shared_memory segment. Pickling a SharedFrame only sends its
+    layout (segment name, dtypes, offsets), so passing it to a worker costs a few
+    hundred bytes whatever the size of the data, and every worker reads the same
+    physical pages: frame() returns read-only NumPy-backed views, without copy.
+
+    The process that created the segment owns it: close() (or leaving the `with`
+    block, or garbage-collecting the SharedFrame) releases and unlinks it. Workers
+    never unlink a segment, and keep their attachment until they exit.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Publishes `df` in a new shared memory segment.
+
+        Args:
+            df (pd.DataFrame): The frame to share. Columns must have a fixed-width NumPy dtype
+                               or hold text without missing values (see data.columnar).
+
+        Raises:
+            ValueError: If a column holds Python objects or missing text values.
+        """
+        arrays = [encode_column(df[name]) for name in df.columns]
+        index_values, self._index_meta = encode_index(df.index)
+        arrays.append(np.asarray(index_values))
+
+        self._names: List = list(df.columns)
+        self._rows = len(df)
+        self._layout = []
+        size = 0
+        for values in arrays:
+            self._layout.append((values.dtype.str, size))
+            size += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._shm: Optional[SharedMemory] = SharedMemory(create=True, size=max(size, 1))
+        self.name = self._shm.name
+        for values, (dtype, offset) in zip(arrays, self._layout):
+            np.ndarray(len(values), dtype=dtype, buffer=self._shm.buf, offset=offset)[:] = values
+        # Bound to this process: a forked worker inheriting the object never unlinks it
+        self._finalizer = weakref.finalize(self, _release, self._shm, os.getpid())
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __getstate__(self) -> dict:
+        # Only the layout travels to the workers, never the data
+        state = self.__dict__.copy()
+        state.update(_shm=None, _finalizer=None, _frame=None)
+        return state
+
+    def __enter__(self) -> 'SharedFrame':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the shared segment in bytes.
+        """
+        return self._buffer().nbytes
+
+    def frame(self) -> pd.DataFrame:
+        """
+        The shared DataFrame, as read-only views over the segment (built once per process).
+
+        Raises:
+            RuntimeError: If the owner already closed the frame.
+        """
+        if self._frame is None:
+            buffer = self._buffer()
+            arrays = []
+            for dtype, offset in self._layout:
+                values = np.ndarray(self._rows, dtype=dtype, buffer=buffer, offset=offset)
+                values.flags.writeable = False
+                arrays.append(values)
+            index = decode_index(arrays.pop(), self._index_meta)
+            data = dict(zip(self._names, arrays))
+            self._frame = pd.DataFrame(data, index=index, columns=self._names, copy=False)
+        return self._frame
+
+    def close(self) -> None:
+        """
+        Releases the segment. In the owning process it is also unlinked, so the views
+        returned by frame() must not be used afterwards.
+        """
+        self._frame = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def _buffer(self) -> memoryview:
+        if self._shm is not None:
+            if not self._finalizer.alive:
+                raise RuntimeError(f"Fatal error: Shared frame '{self.name}' is closed.")
+            return self._shm.buf
+        return _attach(self.name).buf
+
+
+def _release(shm: SharedMemory, owner: int) -> None:
+    if os.getpid() != owner:
+        return
+    try:
+        shm.close()
+    except BufferError:
+        # Views are still referenced: the mapping goes away with them
+        pass
+    shm.unlink()
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Opens an existing segment without handing it to this process' resource tracker.
+
+    Before Python 3.13 attaching registers the segment with the resource tracker, which
+    then unlinks it (with a leak warning) when the worker exits, while the owner still
+    uses it. The registration is skipped here; the owner remains solely responsible.
+    """
+    with _ATTACH_LOCK:
+        if name not in _ATTACHED:
+            try:
+                _ATTACHED[name] = SharedMemory(name=name, track=False)
+            except TypeError:
+                register = resource_tracker.register
+                resource_tracker.register = lambda *args, **kwargs: None
+                try:
+                    _ATTACHED[name] = SharedMemory(name=name)
+                finally:
+                    resource_tracker.register = register
+        return _ATTACHED[name]
@@ -1,6 +1,12 @@
+import math
 from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
 import pandas as pd
 
+from features.context import FeatureContext, feature_signature
+from features.panel import Panel
+from features.streaming import FeatureStream
+
 class BaseFeature(ABC):
     """
     Abstract Base Class for all feature engineering modules.
@@ -8,6 +14,15 @@ class BaseFeature(ABC):
     transformations, or computer vision matrix formulations.
     """
 
+    # Implementation version: bump it whenever the computed values change,
+    # so that persisted results (see features.cache.FeatureCache) are invalidated.
+    VERSION = 1
+
+    # EMA-based features count as converged after EMA_CONVERGENCE * span bars: the weight
+    # of the seed value has then decayed to about exp(-2 * EMA_CONVERGENCE).
+    # Can be tuned globally (BaseFeature.EMA_CONVERGENCE = 6) or per feature instance.
+    EMA_CONVERGENCE = 4.0
+
     def __init__(self, name: str):
         """
         Initialize the feature module.
@@ -31,4 +46,116 @@ class BaseFeature(ABC):
         Returns:
             pd.DataFrame: A new DataFrame containing the original columns plus the computed feature.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def compute_from(self, df: pd.DataFrame, context: FeatureContext) -> pd.DataFrame:
+        """
+        Computes the feature using the intermediate series shared by the pipeline.
+
+        Features implementing produce() get their columns written into `df`; the others
+        simply call compute().
+
+        Args:
+            df (pd.DataFrame): The market data (the same DataFrame the context was built on).
+            context (FeatureContext): The pipeline's memoized intermediate results.
+
+        Returns:
+            pd.DataFrame: The DataFrame containing the computed feature.
+
+        Raises:
+            NotImplementedError: If `df` is a Panel and the feature only implements compute().
+        """
+        if self.produces_columns:
+            for name, values in self.produce(df, context).items():
+                df[name] = values
+            return df
+        if isinstance(df, Panel):
+            raise NotImplementedError(f"Fatal error: {type(self).__name__} has no panel form.")
+        return self.compute(df)
+
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        """
+        Computes the feature's columns without modifying `df`.
+
+        This is the thread-safe form of compute_from(): it only reads the raw columns and
+        the (shared, read-only) context nodes and returns new series, so the pipeline can
+        run several features concurrently and merge their columns afterwards.
+        Features built from the context override it; the default runs compute() on a
+        copy of `df` and returns the columns it added.
+
+        Args:
+            df (pd.DataFrame): The market data (the same DataFrame the context was built on).
+            context (FeatureContext): The pipeline's memoized intermediate results.
+
+        Returns:
+            Dict[str, pd.Series]: The new columns, in the order they must be added.
+        """
+        result = self.compute(df.copy())
+        return {name: result[name] for name in result.columns if name not in df.columns}
+
+    @property
+    def produces_columns(self) -> bool:
+        """
+        True when the feature implements produce() itself, i.e. it never writes into the
+        shared DataFrame and can run on a worker thread.
+        """
+        return type(self).produce is not BaseFeature.produce
+
+    @property
+    def streams(self) -> bool:
+        """
+        True when the feature has a streaming form (it implements _new_stream()), i.e.
+        stream() can continue its values candle by candle.
+        """
+        return type(self)._new_stream is not BaseFeature._new_stream
+
+    @property
+    def warmup(self) -> Optional[int]:
+        """
+        Number of leading rows for which compute() returns NaN (None when unknown).
+        The pipeline trims them by position instead of scanning every column.
+        """
+        return None
+
+    @property
+    def lookback(self) -> Optional[int]:
+        """
+        Minimum number of bars of history needed for a fully valid value on the latest bar
+        (None when unknown). Used to right-size fetches.
+        """
+        return None if self.warmup is None else self.warmup + 1
+
+    def ema_horizon(self, span: int) -> int:
+        """
+        Bars after which an EMA of the given span is considered converged (see EMA_CONVERGENCE).
+        """
+        return int(math.ceil(self.EMA_CONVERGENCE * span))
+
+    def signature(self) -> Tuple:
+        """
+        Identity of this feature's computation (class + parameters), used by the
+        pipeline to run duplicated features only once.
+        """
+        return feature_signature(self)
+
+    def stream(self, history: Optional[pd.DataFrame] = None) -> FeatureStream:
+        """
+        Returns the incremental (streaming) form of this feature.
+
+        Args:
+            history (Optional[pd.DataFrame]): Past candles used to warm the state up.
+                                              The stream then continues right after them.
+
+        Returns:
+            FeatureStream: A stream emitting the same values as compute(), one candle at a time.
+        """
+        stream = self._new_stream()
+        if history is not None:
+            stream.update_frame(history)
+        return stream
+
+    def _new_stream(self) -> FeatureStream:
+        """
+        Builds an empty stream. Features supporting live updates override this.
+        """
+        raise NotImplementedError(f"Fatal error: {type(self).__name__} has no streaming form.")
\ No newline at end of file
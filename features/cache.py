@@ -0,0 +1,204 @@
+import copy
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+import sys
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from data.columnar import read_frame, write_frame
+from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.pipeline import FeaturePipeline, PipelineStream
+from features.streaming import FeatureStream
+
+# Layout version of the cache entries; bump it when the on-disk format changes
+CACHE_FORMAT = 1
+
+
+class FeatureCache:
+    """
+    Persistent on-disk cache of computed features, with incremental append.
+
+    One entry is kept per (exchange, ticker, interval): the raw candles and their
+    feature columns, stored column by column (see data.columnar), plus the pickled
+    PipelineStream state right after the last stored candle. On the next run only
+    the candles that are not in the cache yet are computed, by feeding them to the
+    restored stream, so the result equals pipeline.generate(raw_df).
+
+    Indicators with an infinite memory (EMA, MACD) depend on the first candle they were
+    seeded from: an entry is only continued when raw_df starts on the same candle as
+    the stored history. A window sliding forward (e.g. fetch_recent) is recomputed.
+
+    The most recent candle is treated as still forming: it is computed on a copy of
+    the state and never stored. An entry is rebuilt from scratch when the feature set,
+    a feature's parameters, its VERSION or its source code change, or when the
+    fetched candles no longer match the stored ones.
+    """
+
+    def __init__(self, root: str = os.path.join(".cache", "features")):
+        """
+        Args:
+            root (str): Directory holding the cache entries.
+        """
+        self.root = root
+
+    def generate(
+        self,
+        pipeline: FeaturePipeline,
+        raw_df: pd.DataFrame,
+        ticker: str,
+        exchange: str,
+        interval: str,
+    ) -> pd.DataFrame:
+        """
+        Cached equivalent of pipeline.generate(raw_df).
+
+        Args:
+            pipeline (FeaturePipeline): The feature pipeline.
+            raw_df (pd.DataFrame): The raw OHLCV market data, oldest first.
+            ticker (str): Asset symbol the data belongs to.
+            exchange (str): Exchange the data was fetched from.
+            interval (str): Candle interval.
+
+        Returns:
+            pd.DataFrame: The processed dataset without NaN values, equal to
+                          pipeline.generate(raw_df).
+        """
+        features = pipeline.unique_features()
+        entry = os.path.join(self.root, _slug(f"{exchange}_{ticker}_{interval}"))
+        fingerprint = _fingerprint(features, list(raw_df.columns), (ticker, exchange, interval))
+
+        cached = self._load(entry, fingerprint)
+        new_rows = _new_rows(cached[0], raw_df) if cached is not None else None
+        if new_rows is None:
+            return self._rebuild(entry, fingerprint, pipeline, raw_df)
+
+        frame, stream = cached
+        committed, live = new_rows.iloc[:-1], new_rows.iloc[-1:]
+        parts = [frame[stream.columns], stream.update_frame(committed)]
+        if len(committed):
+            stored = pd.concat([frame, committed.join(parts[1])])
+            self._save(entry, fingerprint, stored, stream)
+        parts.append(copy.deepcopy(stream).update_frame(live))
+
+        history = pd.concat(parts)
+        processed_df = raw_df.copy()
+        for column in stream.columns:
+            processed_df[column] = history[column].reindex(raw_df.index)
+        processed_df.dropna(inplace=True)
+        return pipeline.cast(processed_df)
+
+    def _rebuild(
+        self,
+        entry: str,
+        fingerprint: str,
+        pipeline: FeaturePipeline,
+        raw_df: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Computes the whole history and stores it (minus the forming candle) as a new entry.
+        """
+        processed_df = pipeline.compute_features(raw_df)
+        # A feature without a streaming form cannot be continued: no caching
+        if pipeline.streams and len(raw_df) > 1 and raw_df.index.is_monotonic_increasing and raw_df.index.is_unique:
+            self._save(entry, fingerprint, processed_df.iloc[:-1], pipeline.stream(raw_df.iloc[:-1]))
+        processed_df.dropna(inplace=True)
+        return pipeline.cast(processed_df)
+
+    def _load(self, entry: str, fingerprint: str) -> Optional[Tuple[pd.DataFrame, PipelineStream]]:
+        """
+        Reads an entry back, or returns None when it is missing, stale or incomplete.
+        """
+        meta_path = os.path.join(entry, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("format") != CACHE_FORMAT or meta.get("fingerprint") != fingerprint:
+            return None
+
+        frame = read_frame(os.path.join(entry, "frame"))
+        if frame is None or len(frame) != meta["rows"]:
+            return None
+        with open(os.path.join(entry, "state.pkl"), "rb") as f:
+            stream = pickle.load(f)
+        return frame, stream
+
+    def _save(self, entry: str, fingerprint: str, frame: pd.DataFrame, stream: PipelineStream) -> None:
+        """
+        Writes an entry. meta.json is written last and marks the entry as complete.
+        """
+        os.makedirs(entry, exist_ok=True)
+        meta_path = os.path.join(entry, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        write_frame(frame, os.path.join(entry, "frame"))
+        with open(os.path.join(entry, "state.pkl"), "wb") as f:
+            pickle.dump(stream, f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(meta_path, "w") as f:
+            json.dump({"format": CACHE_FORMAT, "fingerprint": fingerprint, "rows": len(frame)}, f)
+
+
+def _new_rows(frame: pd.DataFrame, raw_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Returns the candles of raw_df that come after the cached ones, or None if the
+    cache cannot be continued (different first candle, gap, or cached candles that changed).
+    """
+    if len(frame) == 0 or len(raw_df) == 0:
+        return None
+    if not (raw_df.index.is_monotonic_increasing and raw_df.index.is_unique):
+        return None
+
+    # The stream state is seeded from the first stored candle
+    if raw_df.index[0] != frame.index[0]:
+        return None
+
+    last = frame.index[-1]
+    split = raw_df.index.searchsorted(last, side="right")
+    overlap = raw_df.iloc[:split]
+    if len(overlap) == 0:
+        return None
+
+    if len(overlap) != len(frame) or not overlap.index.equals(frame.index):
+        return None
+    if not frame[list(raw_df.columns)].equals(overlap):
+        return None
+    return raw_df.iloc[split:]
+
+
+def _fingerprint(features: List[BaseFeature], raw_columns: List[str], key: Tuple[str, ...]) -> str:
+    """
+    Hash of everything the cached values depend on: the entry key, the raw columns,
+    and for each feature its class, parameters, VERSION and module source.
+    """
+    payload = {
+        "key": list(key),
+        "columns": raw_columns,
+        "features": [
+            [repr(feature.signature()), feature.VERSION, _source_hash(type(feature))]
+            for feature in features
+        ],
+        "support": [_source_hash(cls) for cls in (PipelineStream, FeatureStream, FeatureContext)],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _source_hash(cls: type) -> str:
+    """
+    Hash of the source code of the module defining `cls` (empty when unavailable).
+    """
+    try:
+        source = inspect.getsource(sys.modules[cls.__module__])
+    except (OSError, TypeError, KeyError):
+        return ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", name)
@@ -0,0 +1,117 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class FeatureContext:
+    """
+    Memoized graph of the intermediate series shared between features.
+
+    Features ask the context for their building blocks (EMA of a column at a span,
+    rolling mean at a window, close diff, True Range...) instead of computing them
+    on their own. Each node is identified by a key built from its operation and its
+    inputs, and is computed once per DataFrame: an EMAFeature(12) and a MACDFeature
+    share the same EMA_12 of close, a BollingerFeature(20) reuses the rolling mean
+    of an SMAFeature(20), and RSI / ATR share the close diff and shift.
+
+    Every node only uses element-wise and column-wise pandas operations, so the same
+    code runs on a single-symbol DataFrame (one Series per column) and on a Panel
+    (one time × symbol DataFrame per column, see features.panel).
+
+    The context is thread-safe: features running concurrently (see FeaturePipeline's
+    `workers`) still compute each node exactly once, the others waiting for it.
+    """
+
+    def __init__(self, df: Union[pd.DataFrame, Any]):
+        """
+        Args:
+            df (Union[pd.DataFrame, Panel]): The market data every node is computed from.
+        """
+        self.df = df
+        self._nodes: Dict[Hashable, pd.Series] = {}
+        self._lock = threading.Lock()
+        self._node_locks: Dict[Hashable, threading.Lock] = {}
+
+    def node(self, key: Hashable, compute: Callable[[], pd.Series]) -> pd.Series:
+        """
+        Returns the series identified by `key`, computing it on first request.
+
+        Args:
+            key (Hashable): Unique identifier of the computation (operation + inputs).
+            compute (Callable[[], pd.Series]): Builds the series when it is not cached yet.
+
+        Returns:
+            pd.Series: The (shared) series. Callers must not mutate it.
+        """
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+        with self._lock:
+            node_lock = self._node_locks.setdefault(key, threading.Lock())
+        # Per-node lock: a node's inputs are other nodes (a DAG), so this cannot deadlock
+        with node_lock:
+            if key not in self._nodes:
+                self._nodes[key] = compute()
+        return self._nodes[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes
+
+    def column(self, name: str) -> pd.Series:
+        """
+        Returns a raw column of the market data (upcast to float64 when stored as float32).
+
+        Raises:
+            KeyError: If the column is missing.
+        """
+        if name not in self.df.columns:
+            raise KeyError(f"Fatal error: Column '{name}' missing from DataFrame.")
+        values = self.df[name]
+        if isinstance(values, pd.Series) and values.dtype == np.float32:
+            # Compact (float32) data: indicators still compute in float64
+            return self.node(("float64", name), lambda: values.astype(np.float64))
+        return values
+
+    def ema(self, column: str, span: int) -> pd.Series:
+        """
+        Exponential moving average of a column (pandas adjust=False convention).
+        """
+        return self.node(("ema", column, span), lambda: self.column(column).ewm(span=span, adjust=False).mean())
+
+    def rolling_mean(self, column: str, window: int) -> pd.Series:
+        return self.node(("rolling_mean", column, window), lambda: self.column(column).rolling(window=window).mean())
+
+    def rolling_std(self, column: str, window: int) -> pd.Series:
+        return self.node(("rolling_std", column, window), lambda: self.column(column).rolling(window=window).std())
+
+    def diff(self, column: str, periods: int = 1) -> pd.Series:
+        return self.node(("diff", column, periods), lambda: self.column(column).diff(periods))
+
+    def shift(self, column: str, periods: int = 1) -> pd.Series:
+        return self.node(("shift", column, periods), lambda: self.column(column).shift(periods))
+
+    def true_range(self) -> pd.Series:
+        """
+        True Range: max(high - low, |high - prev_close|, |low - prev_close|).
+        """
+        def compute() -> pd.Series:
+            high, low = self.column("high"), self.column("low")
+            prev_close = self.shift("close")
+            high_low = high - low
+            high_prev_close = (high - prev_close).abs()
+            low_prev_close = (low - prev_close).abs()
+            # Element-wise max skipping NaN (works for Series and time × symbol frames alike)
+            return np.fmax(np.fmax(high_low, high_prev_close), low_prev_close)
+
+        return self.node(("true_range",), compute)
+
+
+def feature_signature(feature: Any) -> Tuple:
+    """
+    Identity of a feature's computation: its class and its parameters.
+    Two features with the same signature produce the same columns.
+    """
+    params = tuple(sorted((key, repr(value)) for key, value in vars(feature).items()))
+    return (type(feature).__module__, type(feature).__qualname__, params)
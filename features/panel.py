@@ -0,0 +1,139 @@
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class Panel:
+    """
+    Aligned market data of several symbols: one (time × symbol) DataFrame per column.
+
+    A Panel quacks like the single-symbol DataFrame the features work on: `panel['close']`
+    returns the wide close frame and `panel['SMA_20'] = wide` stores a computed one. The
+    FeatureContext nodes (EMAs, rolling windows, diffs, True Range) only use column-wise
+    pandas operations, so a feature's compute_from() runs on every symbol in one call.
+
+    The symbols are aligned on the union of their indexes. A symbol that starts later
+    (or stops earlier) only has leading (or trailing) NaN rows, which the rolling and
+    EMA kernels skip, so its columns equal a computation on its own data. A symbol with
+    holes inside the union index would not, and is rejected by from_frames().
+    """
+
+    def __init__(self, frames: Mapping[str, pd.DataFrame], index: pd.Index, spans: Dict[str, Tuple[int, int]]):
+        """
+        Use Panel.from_frames() to build a panel.
+
+        Args:
+            frames (Mapping[str, pd.DataFrame]): The raw data of each symbol.
+            index (pd.Index): The union index the symbols are aligned on.
+            spans (Dict[str, Tuple[int, int]]): Position range (start, stop) of each symbol in the index.
+        """
+        self.frames = dict(frames)
+        self.index = index
+        self.spans = spans
+        self.symbols: List[str] = list(self.frames)
+        # Raw columns shared by every symbol, then the computed ones in insertion order
+        first = self.frames[self.symbols[0]]
+        self._raw = [name for name in first.columns if all(name in frame.columns for frame in self.frames.values())]
+        self._fields: Dict[str, pd.DataFrame] = {}
+        self._block: Optional[np.ndarray] = None
+        self._block_names: Optional[List[str]] = None
+        self._block_columns: Optional[pd.Index] = None
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> 'Panel':
+        """
+        Aligns the per-symbol OHLCV frames on a common time index.
+
+        Args:
+            frames (Mapping[str, pd.DataFrame]): Raw data of each symbol, keyed by symbol.
+
+        Returns:
+            Panel: The aligned panel.
+
+        Raises:
+            ValueError: If there is no frame, or if a frame is empty, unsorted, or has
+                        holes with respect to the union of the indexes.
+        """
+        if not frames:
+            raise ValueError("Fatal error: A panel needs at least one symbol.")
+        for symbol, frame in frames.items():
+            if len(frame) == 0 or not (frame.index.is_monotonic_increasing and frame.index.is_unique):
+                raise ValueError(f"Fatal error: Data of '{symbol}' must be non-empty, sorted and without duplicates.")
+
+        indexes = [frame.index for frame in frames.values()]
+        index = indexes[0]
+        for other in indexes[1:]:
+            if not index.equals(other):
+                index = index.union(other)
+
+        spans = {}
+        for symbol, frame in frames.items():
+            start = index.get_loc(frame.index[0])
+            stop = start + len(frame)
+            if not index[start:stop].equals(frame.index):
+                raise ValueError(f"Fatal error: Data of '{symbol}' has gaps with respect to the other symbols.")
+            spans[symbol] = (start, stop)
+        return cls(frames, index, spans)
+
+    @property
+    def columns(self) -> List[str]:
+        return self._raw + [name for name in self._fields if name not in self._raw]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields or name in self._raw
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._fields:
+            if name not in self._raw:
+                raise KeyError(f"Fatal error: Column '{name}' missing from Panel.")
+            self._fields[name] = self._align(name)
+        return self._fields[name]
+
+    def __setitem__(self, name: str, value: pd.DataFrame) -> None:
+        self._fields[name] = value
+        self._block_names = None
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """
+        Rebuilds the DataFrame of one symbol: its raw data plus every computed column,
+        restricted to its own index (what the single-symbol computation returns).
+
+        Raises:
+            KeyError: If the symbol is not part of the panel.
+        """
+        if symbol not in self.frames:
+            raise KeyError(f"Fatal error: Symbol '{symbol}' missing from Panel.")
+        start, stop = self.spans[symbol]
+        names = [name for name in self.columns if name not in self._raw]
+        raw_df = self.frames[symbol]
+        if not names:
+            return raw_df.copy()
+        # (symbol, column, time) block: a symbol's features are one contiguous 2-D slice
+        block = self._computed_block(names)[self.symbols.index(symbol), :, start:stop]
+        computed = pd.DataFrame(block.T, index=raw_df.index, columns=self._block_columns, copy=False)
+        overwritten = [name for name in names if name in raw_df.columns]
+        if overwritten:
+            raw_df = raw_df.drop(columns=overwritten)
+        return pd.concat([raw_df, computed], axis=1)
+
+    def _computed_block(self, names: List[str]) -> np.ndarray:
+        """
+        The computed columns stacked as one (symbol, column, time) array, built once.
+        """
+        if self._block_names != names:
+            block = np.empty((len(self.symbols), len(names), len(self.index)))
+            for position, name in enumerate(names):
+                block[:, position, :] = self._fields[name].to_numpy(dtype=np.float64, na_value=np.nan).T
+            self._block, self._block_names, self._block_columns = block, names, pd.Index(names)
+        return self._block
+
+    def _align(self, name: str) -> pd.DataFrame:
+        """
+        Wide (time × symbol) frame of a raw column, NaN outside each symbol's range.
+        """
+        block = np.full((len(self.index), len(self.symbols)), np.nan, order="F")
+        for position, symbol in enumerate(self.symbols):
+            start, stop = self.spans[symbol]
+            block[start:stop, position] = self.frames[symbol][name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.DataFrame(block, index=self.index, columns=self.symbols, copy=False)
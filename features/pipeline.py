@@ -1,7 +1,15 @@
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Optional
 import pandas as pd
 
+from data.columnar import append_part
+from data.compact import compact_frame
+
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.panel import Panel
+from features.streaming import FeatureStream
 
 class FeaturePipeline:
     """
@@ -10,11 +18,20 @@ class FeaturePipeline:
     Ensures immutability of the raw data and tracks feature provenance for Notion logging.
     """
 
-    def __init__(self):
+    def __init__(self, compact: bool = False, workers: Optional[int] = None):
         """
         Initialize an empty pipeline
+
+        Args:
+            compact (bool): Return float32 prices and features, with constant text columns
+                            moved to `attrs` (see data.compact.compact_frame). The indicators
+                            are still computed in float64.
+            workers (Optional[int]): Run the features concurrently on a pool of this many
+                                     threads (None or 1: one after the other).
         """
         self.features: List[BaseFeature] = []
+        self.compact = compact
+        self.workers = workers
 
     def add_feature(self, feature: BaseFeature) -> 'FeaturePipeline':
         """
@@ -30,9 +47,52 @@ class FeaturePipeline:
         self.features.append(feature)
         return self
 
+    def unique_features(self) -> List[BaseFeature]:
+        """
+        The pipeline's features with duplicates removed (same class and parameters),
+        keeping the first occurrence. A duplicate would only rewrite the same columns.
+
+        Returns:
+            List[BaseFeature]: The features to actually run, in pipeline order.
+        """
+        unique = {}
+        for feature in self.features:
+            unique.setdefault(feature.signature(), feature)
+        return list(unique.values())
+
+    @property
+    def warmup(self) -> Optional[int]:
+        """
+        Leading rows with NaN features: the largest warmup of the pipeline's features
+        (None if one of them does not declare it).
+        """
+        return _aggregate(feature.warmup for feature in self.unique_features())
+
+    @property
+    def lookback(self) -> Optional[int]:
+        """
+        Bars of history needed for every feature to be valid on the latest bar
+        (None if one of them does not declare it). See BaseFeature.lookback.
+        """
+        return _aggregate(feature.lookback for feature in self.unique_features())
+
+    @property
+    def streams(self) -> bool:
+        """
+        True when every feature has a streaming form (see BaseFeature.streams).
+        """
+        return all(feature.streams for feature in self.unique_features())
+
     def generate(self, raw_df: pd.DataFrame) -> pd.DataFrame:
         """
         Executes the feature generation sequentially.
+
+        Every feature draws its intermediate series (EMAs, rolling means, close diff,
+        True Range...) from a single FeatureContext, so a computation shared by several
+        features (e.g. the EMA_12 of an EMAFeature and of MACD) is done once per run.
+
+        When every feature declares its warmup and the raw data has no missing value,
+        the warm-up rows are trimmed by position; otherwise rows with NaN are dropped.
         
         Args:
             raw_df (pd.DataFrame): The raw OHLCV market data.
@@ -40,15 +100,150 @@ class FeaturePipeline:
         Returns:
             pd.DataFrame: A fully processed, ML-ready dataset without NaN values.
         """
-        processed_df = raw_df.copy()
+        return self.cast(self._trim(raw_df, self.compute_features(raw_df)))
 
-        for feature in self.features:
-            processed_df = feature.compute(processed_df)
+    def generate_panel(self, frames: Mapping[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        Multi-symbol equivalent of generate(): computes every feature for all the
+        symbols at once, on a Panel of (time × symbol) frames.
 
-        processed_df.dropna(inplace=True)
+        Each indicator is a single vectorized pandas call over all the symbols instead
+        of one call per symbol, so the Python overhead of a scan no longer grows with the
+        size of the watchlist. The pipeline must suit every symbol (see generate_grouped()
+        for symbols with different configurations). When a feature has no panel form, or
+        the symbols cannot be aligned, generate() is run per symbol instead.
+
+        Args:
+            frames (Mapping[str, pd.DataFrame]): The raw OHLCV market data of each symbol.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The processed dataset of each symbol, equal to generate().
+        """
+        if len(frames) < 2:
+            return {symbol: self.generate(raw_df) for symbol, raw_df in frames.items()}
+        try:
+            panel = Panel.from_frames(frames)
+            panel = self._run_features(panel, FeatureContext(panel))
+        except (ValueError, NotImplementedError):
+            return {symbol: self.generate(raw_df) for symbol, raw_df in frames.items()}
+
+        return {symbol: self.cast(self._trim(raw_df, panel.frame(symbol))) for symbol, raw_df in frames.items()}
+
+    def cast(self, processed_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the pipeline's output representation to a processed dataset:
+        compact_frame() in compact mode, unchanged otherwise.
+        """
+        return compact_frame(processed_df) if self.compact else processed_df
 
+    def _trim(self, raw_df: pd.DataFrame, processed_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Removes the warm-up rows: by position when every feature declares its warmup and
+        the raw data has no missing value, otherwise by dropping the rows with NaN.
+        """
+        warmup = self.warmup
+        if warmup is not None and not raw_df.isna().to_numpy().any():
+            return processed_df.iloc[warmup:]
+
+        processed_df.dropna(inplace=True)
         return processed_df
 
+    def compute_features(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes every feature on a copy of the data, keeping the warm-up rows (NaN).
+
+        Args:
+            raw_df (pd.DataFrame): The raw OHLCV market data.
+
+        Returns:
+            pd.DataFrame: The raw columns followed by the feature columns, on the full index.
+        """
+        processed_df = raw_df.copy()
+        return self._run_features(processed_df, FeatureContext(processed_df))
+
+    def _run_features(self, df: pd.DataFrame, context: FeatureContext) -> pd.DataFrame:
+        """
+        Runs every feature on `df` (a DataFrame or a Panel) and returns it with their columns.
+
+        With several workers, the features implementing produce() run concurrently on a
+        thread pool (the pandas / NumPy kernels release the GIL): they only read the raw
+        columns and the thread-safe context, and return their columns instead of writing
+        them. The columns are then added in pipeline order, and the features that only
+        implement compute() run at their place in that order, so the result is identical
+        to the sequential run.
+        """
+        features = self.unique_features()
+        concurrent = [feature for feature in features if feature.produces_columns]
+        if not self.workers or self.workers <= 1 or len(concurrent) < 2:
+            for feature in features:
+                df = feature.compute_from(df, context)
+            return df
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            produced = {id(feature): pool.submit(feature.produce, df, context) for feature in concurrent}
+
+        for feature in features:
+            if id(feature) in produced:
+                for name, values in produced[id(feature)].result().items():
+                    df[name] = values
+            else:
+                df = feature.compute_from(df, context)
+        return df
+
+    def generate_chunked(self, chunks: Iterable[pd.DataFrame], output_dir: str) -> int:
+        """
+        Out-of-core equivalent of generate(), for histories that do not fit in memory.
+
+        The raw data is consumed as time-ordered blocks (e.g. data.columnar.iter_chunks()).
+        Every block is fed to the pipeline's stream, which carries each feature's warm-up
+        state (rolling windows, EMA values...) across the block boundaries, and its rows
+        are appended to `output_dir` as soon as they are computed (data.columnar.append_part()).
+        Peak memory is bounded by the block size. The streams replay the pandas kernels,
+        so read_frame(output_dir) equals generate() on the whole history exactly.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): The raw OHLCV blocks, oldest first.
+            output_dir (str): Directory receiving the processed rows (must not exist yet or be empty).
+
+        Returns:
+            int: Number of rows written (warm-up rows with NaN values are dropped).
+
+        Raises:
+            ValueError: If a feature has no streaming form, or the output directory is not empty.
+        """
+        static = [feature.name for feature in self.unique_features() if not feature.streams]
+        if static:
+            raise ValueError(f"Fatal error: Chunked mode needs streaming features, Receive: {static}")
+        if os.path.isdir(output_dir) and os.listdir(output_dir):
+            raise ValueError(f"Fatal error: Output directory '{output_dir}' is not empty.")
+
+        stream = self.stream()
+        rows = 0
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            features = stream.update_frame(chunk)
+            processed_df = chunk.copy()
+            for column in stream.columns:
+                processed_df[column] = features[column]
+            processed_df.dropna(inplace=True)
+            if len(processed_df):
+                append_part(self.cast(processed_df), output_dir)
+                rows += len(processed_df)
+        return rows
+
+    def stream(self, history: Optional[pd.DataFrame] = None) -> 'PipelineStream':
+        """
+        Returns the incremental form of the whole pipeline, for live candle-by-candle updates.
+
+        Args:
+            history (Optional[pd.DataFrame]): Past candles used to warm every feature up.
+
+        Returns:
+            PipelineStream: A stream emitting every feature column for each new candle.
+        """
+        return PipelineStream([feature.stream(history) for feature in self.unique_features()])
+
     def get_feature_name(self) -> List[str]:
         """
         Retrieves the names of all active features in this pipeline.
@@ -57,4 +252,70 @@ class FeaturePipeline:
         Returns:
             List[str]: A list of feature identifiers.
         """
-        return [feature.name for feature in self.features]
\ No newline at end of file
+        return [feature.name for feature in self.unique_features()]
+
+def generate_grouped(
+    pipelines: Mapping[str, FeaturePipeline],
+    frames: Mapping[str, pd.DataFrame],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Computes the features of many symbols, each with its own pipeline, with one
+    panel run (FeaturePipeline.generate_panel()) per distinct feature set.
+
+    Symbols whose pipelines hold the same features (same classes and parameters, e.g.
+    the default MarketConfig) are grouped together, so a scan of hundreds of tickers
+    costs a handful of vectorized runs.
+
+    Args:
+        pipelines (Mapping[str, FeaturePipeline]): The pipeline of each symbol.
+        frames (Mapping[str, pd.DataFrame]): The raw OHLCV market data of each symbol.
+
+    Returns:
+        Dict[str, pd.DataFrame]: The processed dataset of each symbol, in the order of `frames`.
+
+    Raises:
+        KeyError: If a symbol has no pipeline.
+    """
+    groups: Dict[tuple, List[str]] = {}
+    for symbol in frames:
+        if symbol not in pipelines:
+            raise KeyError(f"Fatal error: No pipeline for '{symbol}'.")
+        signature = tuple(feature.signature() for feature in pipelines[symbol].unique_features())
+        groups.setdefault(signature, []).append(symbol)
+
+    results = {}
+    for symbols in groups.values():
+        pipeline = pipelines[symbols[0]]
+        results.update(pipeline.generate_panel({symbol: frames[symbol] for symbol in symbols}))
+    return {symbol: results[symbol] for symbol in frames}
+
+
+def _aggregate(values: Iterable[Optional[int]]) -> Optional[int]:
+    """
+    Largest declared value, or None if one of them is unknown (0 for no feature).
+    """
+    values = list(values)
+    if any(value is None for value in values):
+        return None
+    return max(values, default=0)
+
+
+class PipelineStream(FeatureStream):
+    """
+    Streaming counterpart of FeaturePipeline.generate(): feeds every bar to the
+    stream of each feature and merges their outputs. Warm-up rows are not dropped,
+    the features simply emit NaN until their window is filled.
+    """
+
+    def __init__(self, streams: List[FeatureStream]):
+        inputs = list(dict.fromkeys(name for stream in streams for name in stream.inputs))
+        super().__init__(inputs=inputs, columns=[column for stream in streams for column in stream.columns])
+        self.streams = streams
+        # Position of each stream's inputs inside the merged bar tuple
+        self._selectors = [[inputs.index(name) for name in stream.inputs] for stream in streams]
+
+    def _step(self, values):
+        outputs = []
+        for stream, selector in zip(self.streams, self._selectors):
+            outputs.extend(stream._step(tuple(values[i] for i in selector)))
+        return tuple(outputs)
@@ -0,0 +1,258 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RollingMean:
+    """
+    O(1) rolling mean over the last `window` values, equivalent to
+    `Series.rolling(window).mean()`.
+
+    Uses the same compensated (Kahan) running sum as the pandas rolling kernel,
+    including its special cases (constant windows return the value itself,
+    an all-positive window never returns a negative mean), so the streamed
+    values track the batch ones to the last bits. NaN values leave the window
+    incomplete: the mean is NaN while one of them is inside.
+    """
+
+    def __init__(self, window: int):
+        if window <= 0:
+            raise ValueError(f"Fatal error: window must be positive, Receive: {window}")
+        self.window = window
+        self.values = deque()
+        self.nobs = 0
+        self.sum = 0.0
+        # The pandas kernel keeps separate compensations for additions and removals
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.neg_ct = 0
+        self.same_count = 0
+        self.prev_value = math.nan
+
+    def update(self, value: float) -> float:
+        """
+        Pushes a new value and returns the mean of the current window.
+        """
+        self.values.append(value)
+        if len(self.values) > self.window:
+            self._remove(self.values.popleft())
+        self._add(value)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs < self.window:
+            return math.nan
+        result = self.sum / self.nobs
+        if self.same_count >= self.nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs += 1
+        y = value - self.compensation_add
+        t = self.sum + y
+        self.compensation_add = t - self.sum - y
+        self.sum = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct += 1
+        if value == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs -= 1
+        y = -value - self.compensation_remove
+        t = self.sum + y
+        self.compensation_remove = t - self.sum - y
+        self.sum = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct -= 1
+
+
+class RollingStd:
+    """
+    O(1) rolling sample standard deviation (ddof=1), equivalent to
+    `Series.rolling(window).std()`, using Welford's add/remove updates.
+    """
+
+    def __init__(self, window: int, ddof: int = 1):
+        if window <= 0:
+            raise ValueError(f"Fatal error: window must be positive, Receive: {window}")
+        self.window = window
+        self.ddof = ddof
+        self.values = deque()
+        self.nobs = 0
+        self.mean = 0.0
+        self.ssqdm = 0.0
+        self.compensation = 0.0
+
+    def update(self, value: float) -> float:
+        """
+        Pushes a new value and returns the standard deviation of the current window.
+        """
+        self.values.append(value)
+        if len(self.values) > self.window:
+            self._remove(self.values.popleft())
+        self._add(value)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs < self.window or self.nobs <= self.ddof:
+            return math.nan
+        if self.nobs == 1:
+            return 0.0
+        variance = self.ssqdm / (self.nobs - self.ddof)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs += 1
+        prev_mean = self.mean - self.compensation
+        y = value - self.compensation
+        t = y - self.mean
+        self.compensation = t + self.mean - y
+        self.mean += t / self.nobs
+        self.ssqdm += (value - prev_mean) * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self.nobs -= 1
+        if self.nobs == 0:
+            self.mean = 0.0
+            self.ssqdm = 0.0
+            return
+        prev_mean = self.mean - self.compensation
+        y = value - self.compensation
+        t = y - self.mean
+        self.compensation = t + self.mean - y
+        self.mean -= t / self.nobs
+        self.ssqdm -= (value - prev_mean) * (value - self.mean)
+
+
+class ExponentialMean:
+    """
+    O(1) exponential moving average, equivalent to `Series.ewm(span, adjust=False).mean()`.
+
+    Follows the pandas adjust=False recursion: the previous average's weight decays by
+    (1 - alpha) per candle, including across NaN gaps, and the average is
+    ((1 - alpha) * previous + alpha * value) / ((1 - alpha) + alpha).
+    """
+
+    def __init__(self, span: int):
+        if span < 1:
+            raise ValueError(f"Fatal error: span must be >= 1, Receive: {span}")
+        self.alpha = 2.0 / (span + 1.0)
+        self.weighted = math.nan
+        self.old_weight = 1.0
+
+    def update(self, value: float) -> float:
+        """
+        Pushes a new value and returns the updated average.
+        """
+        if self.weighted == self.weighted:
+            self.old_weight *= 1.0 - self.alpha
+            if value == value:
+                if self.weighted != value:
+                    self.weighted = (self.old_weight * self.weighted + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif value == value:
+            self.weighted = value
+        return self.weighted
+
+    @property
+    def value(self) -> float:
+        return self.weighted
+
+
+class FeatureStream(ABC):
+    """
+    Stateful, incremental form of a BaseFeature.
+
+    A stream is created by `feature.stream(history)`, then fed one OHLCV bar at a
+    time with `update(bar)`. Every update costs O(1) time and the state O(window)
+    memory, and the emitted values match what `feature.compute()` returns for the
+    same candle on the full history.
+    """
+
+    def __init__(self, inputs: Sequence[str], columns: Sequence[str]):
+        """
+        Args:
+            inputs (Sequence[str]): Bar fields consumed by the stream (e.g. ['close']).
+            columns (Sequence[str]): Output column names, as produced by compute().
+        """
+        self.inputs = list(inputs)
+        self.columns = list(columns)
+        self.last: Dict[str, float] = {column: math.nan for column in self.columns}
+
+    @abstractmethod
+    def _step(self, values: Tuple[float, ...]) -> Tuple[float, ...]:
+        """
+        Advances the state by one candle.
+
+        Args:
+            values (Tuple[float, ...]): The bar values, in `inputs` order.
+
+        Returns:
+            Tuple[float, ...]: The output values, in `columns` order.
+        """
+
+    def update(self, bar: Mapping[str, float]) -> Dict[str, float]:
+        """
+        Feeds one new candle.
+
+        Args:
+            bar (Mapping[str, float]): The candle (dict, pd.Series...) holding the `inputs` fields.
+
+        Returns:
+            Dict[str, float]: The feature values for this candle.
+
+        Raises:
+            KeyError: If a required field is missing from the bar.
+        """
+        missing = [name for name in self.inputs if name not in bar]
+        if missing:
+            raise KeyError(f"Fatal error: Column '{missing[0]}' missing from bar.")
+        outputs = self._step(tuple(float(bar[name]) for name in self.inputs))
+        self.last = dict(zip(self.columns, outputs))
+        return self.last
+
+    def update_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Feeds several new candles at once.
+
+        Args:
+            df (pd.DataFrame): The new candles, oldest first.
+
+        Returns:
+            pd.DataFrame: The feature columns for those candles, on the same index.
+
+        Raises:
+            KeyError: If a required column is missing.
+        """
+        for name in self.inputs:
+            if name not in df.columns:
+                raise KeyError(f"Fatal error: Column '{name}' missing from DataFrame.")
+
+        inputs = [df[name].to_numpy(dtype=np.float64, na_value=np.nan).tolist() for name in self.inputs]
+        rows: List[Tuple[float, ...]] = [self._step(values) for values in zip(*inputs)]
+        if rows:
+            self.last = dict(zip(self.columns, rows[-1]))
+        return pd.DataFrame(rows, index=df.index, columns=self.columns, dtype=np.float64)
@@ -4,6 +4,7 @@ from features.technical.rsi import RSIFeature
 from features.technical.macd import MACDFeature
 from features.technical.bollinger import BollingerFeature
 from features.technical.atr import ATRFeature
+from features.technical.bank import BankFeature, FeatureBank
 
 __all__ = [
     "SMAFeature",
@@ -12,4 +13,6 @@ __all__ = [
     "MACDFeature",
     "BollingerFeature",
     "ATRFeature",
+    "BankFeature",
+    "FeatureBank",
 ]
\ No newline at end of file
@@ -1,6 +1,10 @@
+import math
+from typing import Dict
 import numpy as np
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import FeatureStream, RollingMean
 
 class ATRFeature(BaseFeature):
     """
@@ -28,22 +32,48 @@ class ATRFeature(BaseFeature):
         Returns:
             pd.DataFrame: The mutated DataFrame containing the new ATR column.
         """
+        return self.compute_from(df, FeatureContext(df))
+
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
         required_cols = ["high", "low", "close"]
         for col in required_cols:
             if col not in df.columns:
                 raise KeyError(f"Fatal error: Column '{col}' missing from DataFrame.")
 
-        # Calculate True Range (TR)
-        # TR = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        
-        # We use pandas vectorized operations for performance and avoiding look-ahead bias
-        high_low = df["high"] - df["low"]
-        high_prev_close = (df["high"] - df["close"].shift(1)).abs()
-        low_prev_close = (df["low"] - df["close"].shift(1)).abs()
-        
-        # TR is the element-wise maximum of these three arrays
-        tr = pd.concat([high_low, high_prev_close, low_prev_close], axis=1).max(axis=1)
-        
-        df[self.name] = tr.rolling(window=self.window).mean()
+        # True Range node: max(high - low, abs(high - prev_close), abs(low - prev_close)),
+        # computed with pandas vectorized operations (no look-ahead)
+        tr = context.true_range()
         
-        return df
+        return {self.name: context.node(("true_range_mean", self.window), lambda: tr.rolling(window=self.window).mean())}
+
+    @property
+    def warmup(self) -> int:
+        # The first True Range falls back to high - low
+        return self.window - 1
+
+    @property
+    def lookback(self) -> int:
+        # `window` complete True Ranges need the previous close as well
+        return self.window + 1
+
+    def _new_stream(self) -> 'ATRStream':
+        return ATRStream(self)
+
+
+class ATRStream(FeatureStream):
+    """
+    Incremental ATR: previous close plus an O(1) rolling mean of the True Range.
+    """
+
+    def __init__(self, feature: ATRFeature):
+        super().__init__(inputs=["high", "low", "close"], columns=[feature.name])
+        self.mean = RollingMean(feature.window)
+        self.prev_close = math.nan
+
+    def _step(self, values):
+        high, low, close = values
+        # Row-wise max skipping NaN, like DataFrame.max(axis=1)
+        candidates = [v for v in (high - low, abs(high - self.prev_close), abs(low - self.prev_close)) if v == v]
+        self.prev_close = close
+        tr = max(candidates) if candidates else math.nan
+        return (self.mean.update(tr),)
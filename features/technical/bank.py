@@ -0,0 +1,264 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.panel import Panel
+from features.streaming import FeatureStream
+from features.technical.ema import EMAFeature
+from features.technical.rsi import RSIFeature
+from features.technical.sma import SMAFeature
+
+# Column names served by the bank, e.g. 'SMA_21', 'EMA_50', 'RSI_14'
+_NAME_PATTERN = re.compile(r"^(SMA|EMA|RSI)_([1-9][0-9]*)$")
+
+
+def parse_bank_name(name: str) -> Tuple[str, int]:
+    """
+    Splits a bank column name into its indicator kind and window.
+
+    Args:
+        name (str): Column name such as 'SMA_21'.
+
+    Returns:
+        Tuple[str, int]: The kind ('SMA', 'EMA' or 'RSI') and the window.
+
+    Raises:
+        KeyError: If the name is not a bank column.
+    """
+    match = _NAME_PATTERN.match(name)
+    if match is None:
+        raise KeyError(f"Fatal error: '{name}' is not a feature bank column (expected SMA_w, EMA_w or RSI_w).")
+    return match.group(1), int(match.group(2))
+
+
+class FeatureBank:
+    """
+    Lazy family of moving-average windows over one price column.
+
+    Parameter sweeps over fast_ma / slow_ma need dozens of windows. Instead of one
+    pandas rolling pass per window, the bank computes prefix sums of the column once
+    (and of the RSI gains / losses) and derives every SMA / RSI window from them in
+    O(n). A column is only computed the first time it is requested, then cached.
+
+    EMAs are recursive and cannot share prefix sums: each span runs the pandas kernel,
+    but is still cached and assembled in the same 2-D block as the other windows.
+    Columns are exposed under the names of the single-window features
+    (SMA_w, EMA_w, RSI_w), so agents such as TrendMonkey consume them unchanged.
+    """
+
+    def __init__(self, df: pd.DataFrame, column: str = "close"):
+        """
+        Args:
+            df (pd.DataFrame): The market data.
+            column (str): The price column the windows are computed on (default 'close').
+
+        Raises:
+            KeyError: If the column is missing.
+        """
+        if column not in df.columns:
+            raise KeyError(f"Fatal error: Column '{column}' missing from DataFrame.")
+        self.index = df.index
+        self.column = column
+        self.series = df[column]
+        self.values = self.series.to_numpy(dtype=np.float64, na_value=np.nan)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._prefix: Dict[str, tuple] = {}
+        self._rsi_inputs: Dict[str, np.ndarray] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return _NAME_PATTERN.match(name) is not None
+
+    def __getitem__(self, name: str) -> pd.Series:
+        return pd.Series(self.column_values(name), index=self.index, name=name, copy=False)
+
+    def column_values(self, name: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the values of a bank column, computing it on first request.
+
+        Args:
+            name (str): The bank column, e.g. 'SMA_21'.
+            out (Optional[np.ndarray]): Array receiving the values (e.g. a column of a 2-D block).
+
+        Raises:
+            KeyError: If the name is not a bank column.
+        """
+        if name in self._columns:
+            if out is None:
+                return self._columns[name]
+            out[:] = self._columns[name]
+            return out
+
+        kind, window = parse_bank_name(name)
+        if out is None:
+            out = np.empty(len(self.values))
+        if kind == "SMA":
+            self._window_mean("price", self.values, window, out)
+        elif kind == "EMA":
+            out[:] = self.series.ewm(span=window, adjust=False).mean().to_numpy(dtype=np.float64)
+        else:
+            self._rsi(window, out)
+        self._columns[name] = out
+        return out
+
+    def frame(self, names: Sequence[str]) -> pd.DataFrame:
+        """
+        Materializes the requested columns as one (rows × names) 2-D block.
+        """
+        # Column-major, so that every column is contiguous (and pandas keeps the block as is)
+        block = np.empty((len(self.index), len(names)), order="F")
+        for position, name in enumerate(names):
+            self.column_values(name, out=block[:, position])
+        return pd.DataFrame(block, index=self.index, columns=list(names), copy=False)
+
+    def with_columns(self, df: pd.DataFrame, names: Sequence[str]) -> pd.DataFrame:
+        """
+        Returns a copy of `df` with the requested bank columns added (or replaced).
+
+        Args:
+            df (pd.DataFrame): Market data on the same index as the bank (e.g. the processed dataset).
+            names (Sequence[str]): Bank columns to add, e.g. [config['fast_ma'], config['slow_ma']].
+
+        Returns:
+            pd.DataFrame: The DataFrame an agent can consume.
+        """
+        block = self.frame(names).reindex(df.index)
+        return pd.concat([df.drop(columns=[name for name in names if name in df.columns]), block], axis=1)
+
+    def _prefix_sums(self, key: str, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        Prefix sums of `values`, centered on their mean so that the running total stays
+        small and window differences keep their precision, plus prefix counts of the NaN
+        values and of the value changes (to detect incomplete and constant windows).
+        """
+        if key not in self._prefix:
+            valid = ~np.isnan(values)
+            offset = float(values[valid].mean()) if valid.any() else 0.0
+            sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values - offset, 0.0))))
+            missing = np.concatenate(([0], np.cumsum(~valid)))
+            changes = np.concatenate(([0, 0], np.cumsum(values[1:] != values[:-1])))
+            self._prefix[key] = (sums, missing, changes, offset)
+        return self._prefix[key]
+
+    def _window_mean(self, key: str, values: np.ndarray, window: int, out: np.ndarray) -> np.ndarray:
+        """
+        Rolling mean over `window` values from prefix sums, written into `out`, following
+        Series.rolling(window).mean(): NaN while a NaN is inside the window, and the exact
+        value on a constant window.
+        """
+        sums, missing, changes, offset = self._prefix_sums(key, values)
+        out[:window - 1] = np.nan
+        if window > len(values):
+            return out
+
+        means = out[window - 1:]
+        np.subtract(sums[window:], sums[:-window], out=means)
+        means /= window
+        means += offset
+        constant = changes[window:] == changes[1:len(changes) - window + 1]
+        if constant.any():
+            means[constant] = values[window - 1:][constant]
+        if missing[-1]:
+            means[missing[window:] != missing[:-window]] = np.nan
+        return out
+
+    def _rsi(self, window: int, out: np.ndarray) -> np.ndarray:
+        """
+        RSI from shared gain / loss prefix sums, with the RSIFeature conventions
+        (a NaN price change counts as no change, RSI = 100 when there is no loss).
+        """
+        if "gain" not in self._rsi_inputs:
+            delta = np.diff(self.values, prepend=np.nan)
+            self._rsi_inputs["gain"] = np.where(delta > 0, delta, 0.0)
+            self._rsi_inputs["loss"] = np.where(delta < 0, -delta, 0.0)
+        # Means are never negative (the rolling kernel clips them as well)
+        n = len(self.values)
+        gain = np.maximum(self._window_mean("gain", self._rsi_inputs["gain"], window, np.empty(n)), 0.0)
+        loss = np.maximum(self._window_mean("loss", self._rsi_inputs["loss"], window, np.empty(n)), 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(100, 1 + gain / loss, out=out)
+        np.subtract(100, out, out=out)
+        out[loss == 0] = 100.0
+        return out
+
+
+class BankFeature(BaseFeature):
+    """
+    Pipeline feature adding a whole family of SMA / EMA / RSI windows at once,
+    computed by a FeatureBank (shared prefix sums) and written as one 2-D block.
+    """
+
+    def __init__(self, names: Sequence[str], column: str = "close"):
+        """
+        Initializes the feature bank.
+
+        Args:
+            names (Sequence[str]): Columns to produce, e.g. ['SMA_8', 'SMA_21', 'EMA_20', 'RSI_14'].
+            column (str): The DataFrame column to process (default 'close').
+
+        Raises:
+            KeyError: If a name is not a bank column.
+        """
+        self.names = tuple(dict.fromkeys(names))
+        for name in self.names:
+            parse_bank_name(name)
+        super().__init__(name=f"BANK_{column}_{len(self.names)}")
+        self.column = column
+
+    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes every window of the bank and adds them as columns.
+
+        Args:
+            df (pd.DataFrame): The market data DataFrame.
+
+        Returns:
+            pd.DataFrame: The mutated DataFrame containing one column per bank name.
+        """
+        return self.compute_from(df, FeatureContext(df))
+
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        if isinstance(df, Panel):
+            raise NotImplementedError("Fatal error: BankFeature has no panel form.")
+        # One bank (and one set of prefix sums) per column and pipeline run
+        bank = context.node(("bank", self.column), lambda: FeatureBank(df, self.column))
+        block = bank.frame(self.names)
+        return {name: block[name] for name in self.names}
+
+    def features(self) -> List[BaseFeature]:
+        """
+        The equivalent single-window features, in bank order.
+        """
+        kinds = {"SMA": SMAFeature, "EMA": EMAFeature, "RSI": RSIFeature}
+        return [kinds[kind](window, column=self.column) for kind, window in map(parse_bank_name, self.names)]
+
+    @property
+    def warmup(self) -> int:
+        return max((feature.warmup for feature in self.features()), default=0)
+
+    @property
+    def lookback(self) -> int:
+        features = self.features()
+        for feature in features:
+            feature.EMA_CONVERGENCE = self.EMA_CONVERGENCE
+        return max((feature.lookback for feature in features), default=0)
+
+    def _new_stream(self) -> 'BankStream':
+        return BankStream(self)
+
+
+class BankStream(FeatureStream):
+    """
+    Incremental bank: the O(1) streams of the equivalent single-window features.
+    """
+
+    def __init__(self, feature: BankFeature):
+        super().__init__(inputs=[feature.column], columns=list(feature.names))
+        self.streams = [child.stream() for child in feature.features()]
+
+    def _step(self, values):
+        return tuple(output for stream in self.streams for output in stream._step(values))
@@ -1,5 +1,8 @@
+from typing import Dict
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import FeatureStream, RollingMean, RollingStd
 
 
 class BollingerFeature(BaseFeature):
@@ -35,14 +38,43 @@ class BollingerFeature(BaseFeature):
         Returns:
             pd.DataFrame: The DataFrame with BB_upper, BB_middle, BB_lower columns.
         """
-        if self.column not in df.columns:
-            raise KeyError(f"Fatal error: Column '{self.column}' missing from DataFrame.")
+        return self.compute_from(df, FeatureContext(df))
 
-        rolling_mean = df[self.column].rolling(window=self.window).mean()
-        rolling_std = df[self.column].rolling(window=self.window).std()
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        # The middle band is the same rolling mean node as SMAFeature(window)
+        rolling_mean = context.rolling_mean(self.column, self.window)
+        rolling_std = context.rolling_std(self.column, self.window)
 
-        df[f"BB_middle_{self.window}"] = rolling_mean
-        df[f"BB_upper_{self.window}"] = rolling_mean + (self.num_std * rolling_std)
-        df[f"BB_lower_{self.window}"] = rolling_mean - (self.num_std * rolling_std)
+        return {
+            f"BB_middle_{self.window}": rolling_mean,
+            f"BB_upper_{self.window}": rolling_mean + (self.num_std * rolling_std),
+            f"BB_lower_{self.window}": rolling_mean - (self.num_std * rolling_std),
+        }
 
-        return df
+    @property
+    def warmup(self) -> int:
+        return self.window - 1
+
+    def _new_stream(self) -> 'BollingerStream':
+        return BollingerStream(self)
+
+
+class BollingerStream(FeatureStream):
+    """
+    Incremental Bollinger Bands: O(1) rolling mean and Welford rolling standard deviation.
+    """
+
+    def __init__(self, feature: BollingerFeature):
+        window = feature.window
+        super().__init__(
+            inputs=[feature.column],
+            columns=[f"BB_middle_{window}", f"BB_upper_{window}", f"BB_lower_{window}"],
+        )
+        self.num_std = feature.num_std
+        self.mean = RollingMean(window)
+        self.std = RollingStd(window)
+
+    def _step(self, values):
+        mean = self.mean.update(values[0])
+        std = self.std.update(values[0])
+        return (mean, mean + (self.num_std * std), mean - (self.num_std * std))
@@ -1,5 +1,8 @@
+from typing import Dict
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import ExponentialMean, FeatureStream
 
 class EMAFeature(BaseFeature):
     """
@@ -29,11 +32,32 @@ class EMAFeature(BaseFeature):
         Returns:
             pd.DataFrame: The mutated DataFrame containing the new EMA column.
         """
-        # Fail Fast: Ensure the required column exists before doing math
-        if self.column not in df.columns:
-            raise KeyError(f"Fatal error: Column '{self.column}' missing from DataFrame.")
-
-        # Calculate the exponential moving average
-        df[self.name] = df[self.column].ewm(span=self.window, adjust=False).mean()
-        
-        return df
+        return self.compute_from(df, FeatureContext(df))
+
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        # The EMA node is shared with MACD when the spans match (fails fast on a missing column)
+        return {self.name: context.ema(self.column, self.window)}
+
+    @property
+    def warmup(self) -> int:
+        return 0
+
+    @property
+    def lookback(self) -> int:
+        return self.ema_horizon(self.window)
+
+    def _new_stream(self) -> 'EMAStream':
+        return EMAStream(self)
+
+
+class EMAStream(FeatureStream):
+    """
+    Incremental EMA: the pandas adjust=False recursion, one value at a time.
+    """
+
+    def __init__(self, feature: EMAFeature):
+        super().__init__(inputs=[feature.column], columns=[feature.name])
+        self.ema = ExponentialMean(feature.window)
+
+    def _step(self, values):
+        return (self.ema.update(values[0]),)
@@ -1,5 +1,8 @@
+from typing import Dict
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import ExponentialMean, FeatureStream
 
 
 class MACDFeature(BaseFeature):
@@ -43,18 +46,45 @@ class MACDFeature(BaseFeature):
         Returns:
             pd.DataFrame: The DataFrame with MACD_line, MACD_signal, MACD_histogram columns.
         """
-        if self.column not in df.columns:
-            raise KeyError(f"Fatal error: Column '{self.column}' missing from DataFrame.")
+        return self.compute_from(df, FeatureContext(df))
 
-        # MACD Line = Fast EMA - Slow EMA
-        fast_ema = df[self.column].ewm(span=self.fast_period, adjust=False).mean()
-        slow_ema = df[self.column].ewm(span=self.slow_period, adjust=False).mean()
-        df["MACD_line"] = fast_ema - slow_ema
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        # MACD Line = Fast EMA - Slow EMA (EMA nodes shared with EMAFeature of the same spans)
+        fast_ema = context.ema(self.column, self.fast_period)
+        slow_ema = context.ema(self.column, self.slow_period)
+        line = fast_ema - slow_ema
 
         # Signal Line = EMA of the MACD Line
-        df["MACD_signal"] = df["MACD_line"].ewm(span=self.signal_period, adjust=False).mean()
+        signal = line.ewm(span=self.signal_period, adjust=False).mean()
 
         # Histogram = MACD Line - Signal Line
-        df["MACD_histogram"] = df["MACD_line"] - df["MACD_signal"]
+        return {"MACD_line": line, "MACD_signal": signal, "MACD_histogram": line - signal}
 
-        return df
+    @property
+    def warmup(self) -> int:
+        return 0
+
+    @property
+    def lookback(self) -> int:
+        # The signal EMA is only meaningful once the slow EMA of the line has converged
+        return self.ema_horizon(self.slow_period) + self.ema_horizon(self.signal_period)
+
+    def _new_stream(self) -> 'MACDStream':
+        return MACDStream(self)
+
+
+class MACDStream(FeatureStream):
+    """
+    Incremental MACD: three chained O(1) EMAs.
+    """
+
+    def __init__(self, feature: MACDFeature):
+        super().__init__(inputs=[feature.column], columns=["MACD_line", "MACD_signal", "MACD_histogram"])
+        self.fast = ExponentialMean(feature.fast_period)
+        self.slow = ExponentialMean(feature.slow_period)
+        self.signal = ExponentialMean(feature.signal_period)
+
+    def _step(self, values):
+        line = self.fast.update(values[0]) - self.slow.update(values[0])
+        signal = self.signal.update(line)
+        return (line, signal, line - signal)
@@ -1,5 +1,9 @@
+import math
+from typing import Dict
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import FeatureStream, RollingMean
 
 class RSIFeature(BaseFeature):
     """
@@ -29,18 +33,62 @@ class RSIFeature(BaseFeature):
         Returns:
             pd.DataFrame: The mutated DataFrame containing the new RSI column.
         """
-        if self.column not in df.columns:
-            raise KeyError(f"Fatal error: Column '{self.column}' missing from DataFrame.")
+        return self.compute_from(df, FeatureContext(df))
 
-        delta = df[self.column].diff()
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        delta = context.diff(self.column)
         
         # Ensure we don't look ahead by calculating positive and negative gains
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.window).mean()
+        gain = context.node(
+            ("rsi_gain", self.column, self.window),
+            lambda: (delta.where(delta > 0, 0)).rolling(window=self.window).mean(),
+        )
+        loss = context.node(
+            ("rsi_loss", self.column, self.window),
+            lambda: (-delta.where(delta < 0, 0)).rolling(window=self.window).mean(),
+        )
         
         rs = gain / loss
         # Guard against zero division
-        df[self.name] = 100 - (100 / (1 + rs))
-        df[self.name] = df[self.name].fillna(100.0).where(loss == 0, df[self.name]) # If loss is 0, RSI is 100
+        rsi = 100 - (100 / (1 + rs))
+        rsi = rsi.fillna(100.0).where(loss == 0, rsi) # If loss is 0, RSI is 100
         
-        return df
+        return {self.name: rsi}
+
+    @property
+    def warmup(self) -> int:
+        # The first (NaN) delta counts as a zero gain/loss
+        return self.window - 1
+
+    @property
+    def lookback(self) -> int:
+        # `window` real price changes need window + 1 closes
+        return self.window + 1
+
+    def _new_stream(self) -> 'RSIStream':
+        return RSIStream(self)
+
+
+class RSIStream(FeatureStream):
+    """
+    Incremental RSI: previous close plus two O(1) rolling means (gains and losses).
+    """
+
+    def __init__(self, feature: RSIFeature):
+        super().__init__(inputs=[feature.column], columns=[feature.name])
+        self.gain = RollingMean(feature.window)
+        self.loss = RollingMean(feature.window)
+        self.prev_close = math.nan
+
+    def _step(self, values):
+        close = values[0]
+        delta = close - self.prev_close
+        self.prev_close = close
+
+        # Same values as delta.where(delta > 0, 0) and -delta.where(delta < 0, 0) (NaN delta -> 0)
+        gain = self.gain.update(delta if delta > 0 else 0.0)
+        loss = self.loss.update(-delta if delta < 0 else -0.0)
+
+        if loss == 0:
+            return (100.0,)
+        return (100 - (100 / (1 + gain / loss)),)
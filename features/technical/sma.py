@@ -1,5 +1,8 @@
+from typing import Dict
 import pandas as pd
 from features.base_feature import BaseFeature
+from features.context import FeatureContext
+from features.streaming import FeatureStream, RollingMean
 
 class SMAFeature(BaseFeature):
     """
@@ -30,11 +33,29 @@ class SMAFeature(BaseFeature):
         Returns:
             pd.DataFrame: The mutated DataFrame containing the new SMA column.
         """
-        # Fail Fast: Ensure the required column exists before doing math
-        if self.column not in df.columns:
-            raise KeyError(f"Fatal error: Column '{self.column}' missing from DataFrame.")
-
-        # Calculate the rolling mean
-        df[self.name] = df[self.column].rolling(window=self.window).mean()
-        
-        return df
\ No newline at end of file
+        return self.compute_from(df, FeatureContext(df))
+
+    def produce(self, df: pd.DataFrame, context: FeatureContext) -> Dict[str, pd.Series]:
+        # Fail Fast (inside the context): the required column must exist before doing math
+        # The rolling mean node is shared with Bollinger Bands of the same window
+        return {self.name: context.rolling_mean(self.column, self.window)}
+
+    @property
+    def warmup(self) -> int:
+        return self.window - 1
+
+    def _new_stream(self) -> 'SMAStream':
+        return SMAStream(self)
+
+
+class SMAStream(FeatureStream):
+    """
+    Incremental SMA: O(1) running window sum.
+    """
+
+    def __init__(self, feature: SMAFeature):
+        super().__init__(inputs=[feature.column], columns=[feature.name])
+        self.mean = RollingMean(feature.window)
+
+    def _step(self, values):
+        return (self.mean.update(values[0]),)
\ No newline at end of file
@@ -13,8 +13,10 @@ from typing import List
 
 import pandas as pd
 
+from data.candle_store import CandleStore
 from data.fetcher_router import DataFetcherRouter
 from features.pipeline import FeaturePipeline
+from features.cache import FeatureCache
 from features.technical.sma import SMAFeature
 from features.technical.ema import EMAFeature
 from features.technical.rsi import RSIFeature
@@ -26,21 +28,23 @@ from core.monkeys.trend_monkey import TrendMonkey
 from core.monkeys.momentum_monkey import MomentumMonkey
 from core.monkeys.risk_monkey import RiskMonkey
 from backtesting.engine import BacktestEngine
+from backtesting.monte_carlo import MonteCarloAnalyzer
 from core.market_config import MarketConfig
 
 
-def build_pipeline(config: dict) -> FeaturePipeline:
+def build_pipeline(config: dict, compact: bool = False) -> FeaturePipeline:
     """
     Constructs the feature pipeline with all active indicators.
     Dynamically adjusts SMA windows based on the market config.
 
     Args:
         config (dict): Configuration dictionary containing settings.
+        compact (bool): Produce float32 features (see FeaturePipeline).
 
     Returns:
         FeaturePipeline: A configured pipeline ready to process raw OHLCV data.
     """
-    pipeline = FeaturePipeline()
+    pipeline = FeaturePipeline(compact=compact)
     
     # Extract periods from strings like "SMA_8" -> 8
     fast_period = int(config.get("fast_ma", "SMA_20").split("_")[1])
@@ -93,6 +97,9 @@ def run_backtest(
     period: str = "6mo",
     interval: str = "1d",
     lookback: int = 30,
+    monte_carlo: int = 0,
+    use_cache: bool = False,
+    compact: bool = False,
 ) -> List[dict]:
     """
     Runs a simple backtest: iterates over the last N trading days
@@ -103,6 +110,13 @@ def run_backtest(
         period (str): The data period to fetch (e.g., '6mo', '1y').
         interval (str): The candle interval (e.g., '1d').
         lookback (int): Number of recent days to simulate signals for.
+        monte_carlo (int): Number of Monte Carlo paths to resample the backtest trades over
+                           (0 disables the analysis).
+        use_cache (bool): Reuse the candles and features persisted by previous runs and only
+                          download / compute the new candles (see CandleStore, FeatureCache).
+                          Off by default: every run downloads and computes from scratch.
+        compact (bool): Keep OHLCV and features as float32, with the source in `attrs`
+                        (see data.compact).
 
     Returns:
         List[dict]: A list of consensus dictionaries, one per simulated day.
@@ -110,13 +124,17 @@ def run_backtest(
     config = MarketConfig.load(ticker)
     
     # 1. Fetch raw data
-    router = DataFetcherRouter()
+    router = DataFetcherRouter(compact=compact, store=CandleStore() if use_cache else None)
     raw_df = router.fetch(ticker=ticker, period=period, interval=interval)
     print(f"📡 Fetched {len(raw_df)} candles for {ticker} ({period}, {interval})")
 
     # 2. Compute features
-    pipeline = build_pipeline(config=config)
-    processed_df = pipeline.generate(raw_df)
+    pipeline = build_pipeline(config=config, compact=compact)
+    if use_cache:
+        exchange, symbol = router.resolve(ticker)
+        processed_df = FeatureCache().generate(pipeline, raw_df, symbol, exchange, interval)
+    else:
+        processed_df = pipeline.generate(raw_df)
     print(f"🔧 Features computed: {pipeline.get_feature_name()}")
     print(f"📊 Rows after NaN cleanup: {len(processed_df)}")
 
@@ -139,15 +157,14 @@ def run_backtest(
     print(f"{'Date':<19} {'Signal':<8} {'Confidence':<12} {'Score':<10} {'Agents Log'}")
     print(f"{'-'*19} {'-'*8} {'-'*12} {'-'*10} {'-'*40}")
 
-    for i in range(effective_lookback, 0, -1):
-        # Slice up to row index to avoid look-ahead bias
-        slice_end = len(processed_df) - i + 1
-        data_slice = processed_df.iloc[:slice_end]
-        date_label = str(data_slice.index[-1].date()) if hasattr(data_slice.index[-1], 'date') else str(data_slice.index[-1])
+    # Every agent is evaluated once over the full history. Row i of each batch is
+    # exactly what analyze() returns on processed_df.iloc[:i + 1] (no look-ahead).
+    batches = orchestrator.analyze_batch(processed_df)
+    consensus_batch = orchestrator.get_consensus_batch(batches, index=processed_df.index)
+    simulated = consensus_batch.tail(effective_lookback)
 
-        consensus = orchestrator.get_consensus(data_slice)
-        consensus["Date"] = date_label
-        consensus["Datetime"] = str(data_slice.index[-1])
+    for position in range(len(simulated)):
+        consensus = simulated.record(position)
         results.append(consensus)
 
         # Color-coded signal
@@ -184,9 +201,14 @@ def run_backtest(
 
     # 7. Execute the Backtest Engine
     engine = BacktestEngine(initial_capital=1000.0, risk_per_trade=0.02)
-    stats = engine.run(processed_df, results, ticker, config)
+    stats = engine.run(processed_df, simulated, ticker, config)
     engine.print_report(stats)
 
+    # 8. Monte Carlo robustness of the trade sequence
+    if monte_carlo > 0 and stats["nb_trades"] > 0:
+        analyzer = MonteCarloAnalyzer(stats)
+        analyzer.print_report(analyzer.run(n_paths=monte_carlo, method="bootstrap"))
+
     return results
 
 
@@ -214,6 +236,18 @@ def main() -> None:
         "--lookback", type=int, default=30,
         help="Number of recent days to simulate (default: 30)"
     )
+    parser.add_argument(
+        "--monte-carlo", type=int, default=0,
+        help="Resample the backtest trades over N Monte Carlo paths (default: 0, disabled)"
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse the candles and features stored on disk by previous runs (.cache/) and only process the new candles"
+    )
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="Store OHLCV and features as float32 (half the memory, for long histories)"
+    )
 
     args = parser.parse_args()
 
@@ -222,6 +256,9 @@ def main() -> None:
         period=args.period,
         interval=args.interval,
         lookback=args.lookback,
+        monte_carlo=args.monte_carlo,
+        use_cache=args.cache,
+        compact=args.compact,
     )
 
 
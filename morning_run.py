@@ -1,73 +1,154 @@
 import argparse
-from typing import List
+import asyncio
+from typing import Callable, List, Optional, Tuple
 
+import pandas as pd
+
+from data.candle_store import CandleStore
 from data.fetcher_router import DataFetcherRouter
 from core.types import TradePlan
 from core.monkeys.risk_monkey import RiskMonkey
 from core.market_config import MarketConfig
+from features.cache import FeatureCache
+from features.pipeline import generate_grouped
 # Import the builders from main.py to avoid redefining the whole application stack
 from main import build_pipeline, build_orchestrator
 
 # Default configurable watchlist
 WATCHLIST = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
 
-def scan_market(watchlist: List[str], period: str = "6mo", interval: str = "1d") -> List[TradePlan]:
+def scan_market(
+    watchlist: List[str],
+    period: Optional[str] = None,
+    interval: str = "1d",
+    use_cache: bool = False,
+) -> List[TradePlan]:
     """
     Scans the provided watchlist and generates TradePlans using the default MAS setup.
     Errors on single assets are caught and logged without breaking the whole process.
+    The whole watchlist is fetched concurrently (see DataFetcherRouter.fetch_async): with use_cache,
+    candles and features persisted by the previous runs are reused, only the new candles are downloaded
+    and each ticker is analyzed as soon as its data lands. Without it, the features of all the tickers
+    sharing a configuration are computed in one vectorized panel run once every fetch is done
+    (see generate_grouped).
+
+    Without an explicit period, only the history the pipeline needs is fetched
+    (FeaturePipeline.lookback bars, plus one so that two rows remain after the warmup).
+
+    Returns:
+        List[TradePlan]: The plans of the successfully scanned assets, in watchlist order.
     """
-    # 1. Fetch raw data via the Router (Fail-Fast inside router, caught here)
-    router = DataFetcherRouter()
+    return asyncio.run(_scan_market(watchlist, period, interval, use_cache))
+
+async def _scan_market(
+    watchlist: List[str],
+    period: Optional[str],
+    interval: str,
+    use_cache: bool,
+) -> List[TradePlan]:
+    router = DataFetcherRouter(store=CandleStore() if use_cache else None)
+    cache = FeatureCache() if use_cache else None
     
     # Instantiate RiskMonkey explicitly for TradePlan generation
     risk_monkey = RiskMonkey()
         
-    plans = []
+    plans = {}
     
     print(f"\n{'='*60}")
     print(f"🌅 MORNING RUN - Scanning {len(watchlist)} assets")
     print(f"{'='*60}\n")
     
-    for ticker in watchlist:
-        print(f"📡 Processing {ticker}...", end=" ")
+    configs, pipelines = {}, {}
+
+    async def fetch(ticker: str) -> Tuple[str, Optional[pd.DataFrame]]:
+        # 1. Fetch raw data via the Router (Fail-Fast inside router, caught here)
         try:
-            config = MarketConfig.load(ticker)
-            pipeline = build_pipeline(config=config)
-            orchestrator = build_orchestrator(config=config)
-            
-            # 1. Fetch raw data via the Router (Fail-Fast inside router, caught here)
-            raw_df = router.fetch(ticker=ticker, period=period, interval=interval)
-            
-            # 2. Compute features via Pipeline
-            processed_df = pipeline.generate(raw_df)
-            if len(processed_df) < 2:
-                print(f"\n⚠️ Not enough data after feature computation. Skipping.")
-                continue
-                
-            # 3. Get consensus bounds for the latest available day
-            consensus = orchestrator.get_consensus(processed_df)
-            
-            # 4. Generate TradePlan metrics
-            plan = risk_monkey.compute_trade_plan(processed_df, consensus, ticker)
-            
-            # Override generated_at with actual slice date for accuracy instead of execution time
-            if hasattr(processed_df.index[-1], 'date'):
-                plan.generated_at = str(processed_df.index[-1].date())
-            else:
-                plan.generated_at = str(processed_df.index[-1])
-                
-            plans.append(plan)
-            
-            # Minimal feedback in terminal
-            signal = plan.direction
-            color = "🟢 BUY" if signal == "BUY" else "🔴 SELL" if signal == "SELL" else "⚪ WAIT"
-            print(f"✅ {color} (Conf: {plan.confidence:.2f})")
-            
+            configs[ticker] = MarketConfig.load(ticker)
+            pipelines[ticker] = build_pipeline(config=configs[ticker])
+            lookback = pipelines[ticker].lookback
+            if period is None and lookback is not None:
+                return ticker, await router.fetch_recent_async(ticker=ticker, bars=lookback + 1, interval=interval)
+            return ticker, await router.fetch_async(ticker=ticker, period=period or "6mo", interval=interval)
         except Exception as e:
-            # Handle fetch or compute error without killing the scan
-            print(f"\n❌ Failed: {str(e)}")
+            # Handle fetch error without killing the scan
+            print(f"❌ [{ticker}] Fetch failed: {str(e)}")
+            return ticker, None
+
+    print(f"📡 Fetching {', '.join(watchlist)}...")
+    tasks = [asyncio.ensure_future(fetch(ticker)) for ticker in watchlist]
+    try:
+        if cache is not None:
+            # 2. Compute features and consensus per ticker, as soon as its data lands
+            for task in asyncio.as_completed(tasks):
+                ticker, raw_df = await task
+                if raw_df is None:
+                    continue
+                def generate(raw_df: pd.DataFrame) -> pd.DataFrame:
+                    exchange, symbol = router.resolve(ticker)
+                    return cache.generate(pipelines[ticker], raw_df, symbol, exchange, interval)
+                plans[ticker] = _analyze(ticker, raw_df, generate, configs[ticker], risk_monkey)
+        else:
+            # 2. Compute the features of all the tickers in panel runs
+            raw_frames = {ticker: raw_df for ticker, raw_df in await asyncio.gather(*tasks) if raw_df is not None}
+            try:
+                processed = generate_grouped({ticker: pipelines[ticker] for ticker in raw_frames}, raw_frames)
+            except Exception as e:
+                print(f"\n⚠️ Panel computation failed ({e}). Falling back to one ticker at a time.")
+                processed = {}
+            for ticker, raw_df in raw_frames.items():
+                if ticker in processed:
+                    generate = lambda _, processed_df=processed[ticker]: processed_df
+                else:
+                    generate = pipelines[ticker].generate
+                plans[ticker] = _analyze(ticker, raw_df, generate, configs[ticker], risk_monkey)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await router.close_async()
+
+    return [plans[ticker] for ticker in watchlist if plans.get(ticker) is not None]
+
+def _analyze(
+    ticker: str,
+    raw_df: pd.DataFrame,
+    generate: Callable[[pd.DataFrame], pd.DataFrame],
+    config: MarketConfig,
+    risk_monkey: RiskMonkey,
+) -> Optional[TradePlan]:
+    """
+    Computes the features of one ticker (via `generate`), its consensus and its TradePlan.
+    Errors are caught and logged: None is returned instead.
+    """
+    print(f"🧠 Analyzing {ticker}...", end=" ")
+    try:
+        processed_df = generate(raw_df)
+        if len(processed_df) < 2:
+            print(f"\n⚠️ Not enough data after feature computation. Skipping.")
+            return None
             
-    return plans
+        # 3. Get consensus bounds for the latest available day
+        orchestrator = build_orchestrator(config=config)
+        consensus = orchestrator.get_consensus(processed_df)
+        
+        # 4. Generate TradePlan metrics
+        plan = risk_monkey.compute_trade_plan(processed_df, consensus, ticker)
+        
+        # Override generated_at with actual slice date for accuracy instead of execution time
+        if hasattr(processed_df.index[-1], 'date'):
+            plan.generated_at = str(processed_df.index[-1].date())
+        else:
+            plan.generated_at = str(processed_df.index[-1])
+        
+        # Minimal feedback in terminal
+        signal = plan.direction
+        color = "🟢 BUY" if signal == "BUY" else "🔴 SELL" if signal == "SELL" else "⚪ WAIT"
+        print(f"✅ {color} (Conf: {plan.confidence:.2f})")
+        return plan
+        
+    except Exception as e:
+        # Handle compute error without killing the scan
+        print(f"\n❌ Failed: {str(e)}")
+        return None
 
 def display_summary(plans: List[TradePlan]):
     """
@@ -120,12 +201,16 @@ def main():
         default=WATCHLIST, 
         help="List of tickers to scan (e.g. --tickers BTC/USDT ETH/USDT)"
     )
-    parser.add_argument("--period", type=str, default="6mo", help="Data period to fetch (default: 6mo)")
+    parser.add_argument(
+        "--period", type=str, default=None,
+        help="Data period to fetch (default: just the history the features need)"
+    )
     parser.add_argument("--interval", type=str, default="1d", help="Candle interval (default: 1d)")
+    parser.add_argument("--cache", action="store_true", help="Reuse the candles and features stored on disk by previous runs (.cache/) and only process the new candles")
     
     args = parser.parse_args()
     
-    plans = scan_market(args.tickers, args.period, args.interval)
+    plans = scan_market(args.tickers, args.period, args.interval, use_cache=args.cache)
     if plans:
         display_summary(plans)
     else:
@@ -0,0 +1,117 @@
+"""
+Agent-Monkey — Parameter Sweep Runner
+=====================================
+Fetch data once → Compute features once → Backtest every config combination in parallel.
+
+Usage:
+    python sweep.py --ticker BTC/USDT --grid rr_ratio=1.5,2,2.5 --grid atr_sl_multiplier=1,1.5,2
+    python sweep.py --ticker ETH/USDT --interval 1h --lookback 2000 --grid min_confidence=0.4,0.5,0.6
+    python sweep.py --ticker BTC/USDT --interval 1h --period 1y --walk-forward 2000 500 --grid rr_ratio=1.5,2
+"""
+
+import argparse
+from typing import Dict, List
+
+import yaml
+
+from data.fetcher_router import DataFetcherRouter
+from core.market_config import MarketConfig
+from backtesting.sweep import ParameterSweep, SWEEPABLE_KEYS
+from backtesting.walk_forward import WalkForwardOptimizer
+# Import the builders from main.py to avoid redefining the whole application stack
+from main import build_pipeline, build_orchestrator
+
+
+def parse_grid(specs: List[str]) -> Dict[str, list]:
+    """
+    Parses CLI grid specs of the form 'key=v1,v2,v3'.
+    Values are parsed as YAML scalars, so '4' stays an int and '1.5' a float.
+
+    Args:
+        specs (List[str]): Raw '--grid' arguments.
+
+    Returns:
+        Dict[str, list]: Mapping of config key → candidate values.
+    """
+    grid = {}
+    for spec in specs:
+        if "=" not in spec:
+            raise ValueError(f"Fatal error: Invalid grid spec '{spec}'. Expected 'key=v1,v2,...'.")
+        key, raw_values = spec.split("=", 1)
+        grid[key.strip()] = [yaml.safe_load(v) for v in raw_values.split(",") if v.strip()]
+    return grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Agent-Monkey - Parallel Parameter Sweep")
+    parser.add_argument("--ticker", type=str, default="BTC-USD", help="Asset ticker symbol (default: BTC-USD)")
+    parser.add_argument("--period", type=str, default="6mo", help="Data period to fetch (default: 6mo)")
+    parser.add_argument("--interval", type=str, default="1d", help="Candle interval (default: 1d)")
+    parser.add_argument("--lookback", type=int, default=None, help="Only simulate the last N candles (default: all)")
+    parser.add_argument(
+        "--grid", action="append", default=[],
+        help=f"Parameter values as key=v1,v2 (repeatable). Keys: {', '.join(SWEEPABLE_KEYS)}"
+    )
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--sort-by", type=str, default="total_return", help="Ranking metric (default: total_return)")
+    parser.add_argument("--top", type=int, default=20, help="Number of rows to display (default: 20)")
+    parser.add_argument(
+        "--walk-forward", type=int, nargs=2, metavar=("TRAIN", "TEST"), default=None,
+        help="Walk-forward mode: optimize on TRAIN candles, validate on the next TEST candles"
+    )
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="Store OHLCV and features as float32 (half the memory, for long histories)"
+    )
+
+    args = parser.parse_args()
+    grid = parse_grid(args.grid)
+    if not grid:
+        parser.error("at least one --grid parameter is required")
+
+    config = MarketConfig.load(args.ticker)
+
+    # 1. Fetch and compute features once for every combination
+    raw_df = DataFetcherRouter(compact=args.compact).fetch(ticker=args.ticker, period=args.period, interval=args.interval)
+    processed_df = build_pipeline(config=config, compact=args.compact).generate(raw_df)
+    print(f"📊 {len(processed_df)} candles ready for {args.ticker} ({args.period}, {args.interval})")
+
+    orchestrator = build_orchestrator(config=config)
+
+    # 2a. Walk-forward: rolling out-of-sample validation, windows spread across the process pool
+    if args.walk_forward:
+        train_size, test_size = args.walk_forward
+        optimizer = WalkForwardOptimizer(
+            processed_df, orchestrator, args.ticker, train_size, test_size, base_config=config
+        )
+        result = optimizer.run(grid, processes=args.processes, sort_by=args.sort_by)
+
+        print(f"\n{'='*85}")
+        print(f"🚶 WALK-FORWARD: {args.ticker} — {len(result['windows'])} windows ({train_size} train / {test_size} test)")
+        print(f"{'='*85}")
+        print(result["windows"].to_string())
+        print(
+            f"\nOut-of-sample: return {result['total_return']*100:.2f}% | "
+            f"max DD {result['max_drawdown']*100:.2f}% | "
+            f"PF {result['profit_factor']:.2f} | trades {result['nb_trades']}"
+        )
+        return
+
+    # 2b. Fan the backtests out across the process pool
+    sweep = ParameterSweep(
+        processed_df,
+        orchestrator,
+        args.ticker,
+        base_config=config,
+        lookback=args.lookback,
+    )
+    table = sweep.run(grid, processes=args.processes, sort_by=args.sort_by)
+
+    print(f"\n{'='*85}")
+    print(f"🧪 SWEEP RESULT: {args.ticker} — {len(table)} combinations ranked by {args.sort_by}")
+    print(f"{'='*85}")
+    print(table.head(args.top).to_string())
+
+
+if __name__ == "__main__":
+    main()
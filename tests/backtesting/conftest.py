@@ -0,0 +1,28 @@
+import pytest
+import pandas as pd
+from core.orchestrator import MarketOrchestrator
+from core.monkeys.trend_monkey import TrendMonkey
+from core.monkeys.momentum_monkey import MomentumMonkey
+from features.pipeline import FeaturePipeline
+from features.technical import SMAFeature, RSIFeature, MACDFeature, ATRFeature
+from tests.conftest import random_ohlcv
+
+
+@pytest.fixture(scope="session")
+def make_processed_df():
+    """Builds random-walk hourly candles processed with the features the `orchestrator` Monkeys read."""
+    def build(n: int, seed: int) -> pd.DataFrame:
+        raw = random_ohlcv(n, seed)
+        pipeline = FeaturePipeline()
+        for feature in [SMAFeature(8), SMAFeature(21), RSIFeature(14), MACDFeature(), ATRFeature(14)]:
+            pipeline.add_feature(feature)
+        return pipeline.generate(raw)
+    return build
+
+
+@pytest.fixture
+def orchestrator():
+    return MarketOrchestrator([
+        TrendMonkey("TrendMonkey", fast_col="SMA_8", slow_col="SMA_21"),
+        MomentumMonkey("MomentumMonkey"),
+    ], activation_threshold=0.4)
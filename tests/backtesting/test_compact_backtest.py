@@ -0,0 +1,66 @@
+"""
+Tolerance test of the compact (float32) mode against the float64 reference.
+
+Compact storage rounds every price and feature to float32 (relative error ~6e-8).
+The agents and the engine read them back as float64, so the rounding can only
+matter when a decision lies within that distance of a threshold. On the data
+below it does not: the signals and trade outcomes must be identical, and the
+final capital, the equity curve and the metrics derived from them equal up to the
+float32 rounding of the entry / exit prices: relative 1e-5 (absolute 1e-6 for
+metrics close to zero).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.engine import BacktestEngine
+from data.compact import compact_frame
+from main import build_orchestrator, build_pipeline
+from tests.conftest import random_ohlcv
+
+CONFIG = {
+    "fast_ma": "SMA_20", "slow_ma": "SMA_50", "atr_sl_multiplier": 1.5, "rr_ratio": 2.0,
+    "min_confidence": 0.5, "activation_threshold": 0.4, "cooldown_candles": 6,
+    "cooldown_override_confidence": 0.7,
+}
+
+
+def backtest(raw: pd.DataFrame, compact: bool):
+    if compact:
+        raw = compact_frame(raw)
+    processed_df = build_pipeline(CONFIG, compact=compact).generate(raw)
+    orchestrator = build_orchestrator(CONFIG)
+    consensus = orchestrator.get_consensus_batch(orchestrator.analyze_batch(processed_df), index=processed_df.index)
+    engine = BacktestEngine(initial_capital=1000.0, risk_per_trade=0.02)
+    return processed_df, consensus, engine.run(processed_df, consensus, "BTC/USDT", CONFIG)
+
+
+@pytest.fixture(scope="module")
+def runs():
+    raw = random_ohlcv(3000, 21, price=30_000, volatility=120)
+    return backtest(raw, compact=False), backtest(raw, compact=True)
+
+
+def test_compact_frame_is_half_the_size(runs):
+    (reference, _, _), (compact, _, _) = runs
+    assert compact.memory_usage(deep=True).sum() < reference.memory_usage(deep=True).sum() / 2
+    assert compact.attrs["source"] == "binance"
+
+
+def test_compact_signals_are_unchanged(runs):
+    (_, reference, _), (_, compact, _) = runs
+    np.testing.assert_array_equal(compact.actions, reference.actions)
+    np.testing.assert_array_equal(compact.confidences, reference.confidences)
+    for left, right in zip(compact.monkey_batches, reference.monkey_batches):
+        np.testing.assert_array_equal(left.actions, right.actions)
+
+
+def test_compact_backtest_within_tolerance(runs):
+    (_, _, reference), (_, _, compact) = runs
+    assert reference["nb_trades"] > 20
+    assert compact["nb_trades"] == reference["nb_trades"]
+    assert compact["win_rate"] == reference["win_rate"]
+    assert [t["outcome"] for t in compact["trades"]] == [t["outcome"] for t in reference["trades"]]
+    for metric in ["capital_final", "total_return", "max_drawdown", "profit_factor", "sharpe"]:
+        assert compact[metric] == pytest.approx(reference[metric], rel=1e-5, abs=1e-6)
+    np.testing.assert_allclose(compact["equity_curve"], reference["equity_curve"], rtol=1e-5)
@@ -0,0 +1,188 @@
+import pytest
+import numpy as np
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from core.types import Action, ConsensusBatch
+from tests.conftest import random_ohlcv
+
+
+def make_market(n: int = 400, seed: int = 7) -> pd.DataFrame:
+    """Random-walk OHLC candles with a constant-ish ATR column."""
+    df = random_ohlcv(n, seed)
+    df["ATR_14"] = (df["high"] - df["low"]).rolling(14).mean()
+    return df
+
+
+def make_signals(df: pd.DataFrame, seed: int = 11) -> list:
+    """One consensus dict per candle, in the format produced by main.run_backtest."""
+    rng = np.random.default_rng(seed)
+    actions = rng.choice(["BUY", "SELL", "WAIT"], size=len(df))
+    confidences = np.round(rng.uniform(0, 1, len(df)), 2)
+    return [
+        {"Signal": a, "Confiance": float(c), "Date": str(ts.date()), "Datetime": str(ts)}
+        for ts, a, c in zip(df.index, actions, confidences)
+    ]
+
+
+def assert_same_result(left: dict, right: dict):
+    """Deep equality of two backtest results (metrics, trades, ledger and equity curve)."""
+    columnar = ("ledger", "equity_curve")
+    assert {k: v for k, v in left.items() if k not in columnar} == {k: v for k, v in right.items() if k not in columnar}
+    pd.testing.assert_frame_equal(left["ledger"].to_frame(), right["ledger"].to_frame())
+    pd.testing.assert_series_equal(left["equity_curve"], right["equity_curve"])
+
+
+@pytest.fixture
+def market():
+    return make_market()
+
+
+def test_nan_confidences_are_not_traded_in_both_modes(market):
+    signals = make_signals(market)[30:]
+    for signal in signals[::3]:
+        signal["Confiance"] = float("nan")
+
+    fast = BacktestEngine(mode="array").run(market, signals, "TEST")
+    reference = BacktestEngine(mode="rows").run(market, signals, "TEST")
+    assert_same_result(fast, reference)
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError, match="Unknown engine mode"):
+        BacktestEngine(mode="turbo")
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+@pytest.mark.parametrize("config", [
+    {},
+    {"atr_sl_multiplier": 1.0, "rr_ratio": 1.5, "min_confidence": 0.55, "cooldown_candles": 4},
+    {"min_confidence": 0.2, "cooldown_candles": 20, "cooldown_override_confidence": 0.9},
+])
+def test_array_mode_matches_rows_mode(seed, config):
+    df = make_market(seed=seed)
+    signals = make_signals(df, seed=seed + 100)[30:]
+
+    fast = BacktestEngine(mode="array").run(df, signals, "TEST", config)
+    reference = BacktestEngine(mode="rows").run(df, signals, "TEST", config)
+
+    assert fast["nb_trades"] > 0
+    assert_same_result(fast, reference)
+
+
+def test_pessimistic_both_hit(market):
+    df = market.iloc[20:30].copy()
+    df["ATR_14"] = 1.0
+    df["close"] = 100.0
+    df["high"] = 100.5
+    df["low"] = 99.5
+    # Candle after entry spans both SL (98.5) and TP (103.0)
+    df.iloc[2, df.columns.get_loc("high")] = 104.0
+    df.iloc[2, df.columns.get_loc("low")] = 98.0
+    signals = [{"Signal": "BUY", "Confiance": 0.9, "Date": "", "Datetime": str(df.index[1])}]
+
+    for mode in BacktestEngine.MODES:
+        res = BacktestEngine(mode=mode).run(df, signals, "TEST")
+        assert res["nb_trades"] == 1
+        assert res["trades"][0]["outcome"] == "LOSS"
+        assert res["trades"][0]["exit_price"] == pytest.approx(98.5)
+
+
+def test_open_position_closed_at_last_candle(market):
+    df = market.iloc[20:25].copy()
+    df["ATR_14"] = 10.0
+    signals = [{"Signal": "SELL", "Confiance": 0.9, "Date": "", "Datetime": str(df.index[0])}]
+
+    res = BacktestEngine().run(df, signals, "TEST")
+    assert res["nb_trades"] == 1
+    assert res["trades"][0]["outcome"] == "OPEN"
+    assert res["trades"][0]["exit_price"] == df["close"].iloc[-1]
+    assert res["trades"][0]["exit_date"] == str(df.index[-1])
+
+
+def test_missing_atr_column_never_trades(market):
+    df = market.drop(columns=["ATR_14"])
+    res = BacktestEngine().run(df, make_signals(df), "TEST")
+    assert res["nb_trades"] == 0
+    assert res["capital_final"] == res["initial_capital"]
+
+
+def test_empty_signals(market):
+    res = BacktestEngine().run(market, [], "TEST")
+    assert res["nb_trades"] == 0
+    assert res["trades"] == []
+
+
+def make_consensus_batch(df: pd.DataFrame, seed: int = 11) -> ConsensusBatch:
+    """Same content as make_signals(), in the columnar get_consensus_batch() format."""
+    records = make_signals(df, seed)
+    return ConsensusBatch(
+        index=df.index,
+        actions=np.array([Action[r["Signal"]].value for r in records], dtype=np.int8),
+        confidences=np.array([r["Confiance"] for r in records]),
+        raw_scores=np.zeros(len(records)),
+    )
+
+
+@pytest.mark.parametrize("mode", BacktestEngine.MODES)
+def test_consensus_batch_matches_records(market, mode):
+    batch = make_consensus_batch(market).tail(300)
+    records = make_signals(market)[-300:]
+
+    from_batch = BacktestEngine(mode=mode).run(market, batch, "TEST")
+    from_records = BacktestEngine(mode=mode).run(market, records, "TEST")
+
+    assert from_batch["nb_trades"] > 0
+    assert_same_result(from_batch, from_records)
+
+
+def test_consensus_batch_outside_data_returns_empty(market):
+    batch = make_consensus_batch(market)
+    res = BacktestEngine().run(market.iloc[:10], batch.tail(5), "TEST")
+    assert res["nb_trades"] == 0
+
+
+def test_records_align_on_timestamp_not_label_format(market):
+    signals = make_signals(market)[30:]
+    reference = BacktestEngine().run(market, signals, "TEST")
+
+    # Same candles, labels in another format: aligned on int64 timestamps, not strings
+    iso = [dict(s, Datetime=pd.Timestamp(s["Datetime"]).isoformat()) for s in signals]
+    keyed = [dict(s, Datetime="?", Timestamp=pd.Timestamp(s["Datetime"]).value) for s in signals]
+
+    assert reference["nb_trades"] > 0
+    assert_same_result(BacktestEngine().run(market, iso, "TEST"), reference)
+    assert_same_result(BacktestEngine().run(market, keyed, "TEST"), reference)
+
+
+def test_sparse_signals_and_missing_candles(market):
+    signals = make_signals(market)[30::3]
+    # A signal on a candle that is not in the data is ignored
+    signals.insert(1, {"Signal": "BUY", "Confiance": 1.0, "Date": "", "Datetime": "2030-01-01 00:00:00+00:00"})
+
+    fast = BacktestEngine(mode="array").run(market, signals, "TEST")
+    reference = BacktestEngine(mode="rows").run(market, signals, "TEST")
+    assert_same_result(fast, reference)
+
+
+def test_integer_index_falls_back_to_labels(market):
+    df = market.reset_index(drop=True)
+    signals = [dict(s, Datetime=str(i)) for i, s in enumerate(make_signals(df.set_index(market.index)))][30:]
+
+    fast = BacktestEngine(mode="array").run(df, signals, "TEST")
+    reference = BacktestEngine(mode="rows").run(df, signals, "TEST")
+    assert fast["nb_trades"] > 0
+    assert_same_result(fast, reference)
+
+
+@pytest.mark.parametrize("seed", [5, 6])
+def test_long_trades_match_rows_mode(seed):
+    # Wide stops keep positions open across many extrema blocks
+    df = make_market(n=3000, seed=seed)
+    df.iloc[500:520, df.columns.get_loc("high")] = np.nan
+    signals = make_signals(df, seed=seed)[20:]
+    config = {"atr_sl_multiplier": 5.0, "rr_ratio": 2.5, "cooldown_candles": 50}
+
+    fast = BacktestEngine(mode="array").run(df, signals, "TEST", config)
+    reference = BacktestEngine(mode="rows").run(df, signals, "TEST", config)
+    assert fast["nb_trades"] > 3
+    assert_same_result(fast, reference)
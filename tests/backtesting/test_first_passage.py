@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from backtesting.first_passage import FirstPassageIndex
+
+
+def brute_force(lows, highs, start, lower, upper):
+    for i in range(start, len(lows)):
+        if lows[i] <= lower or highs[i] >= upper:
+            return i
+    return len(lows)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64])
+def test_matches_bar_by_bar_scan(block_size):
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 3000))
+    lows = close - rng.uniform(0, 1, 3000)
+    highs = close + rng.uniform(0, 1, 3000)
+    lows[rng.integers(0, 3000, 50)] = np.nan
+    passage = FirstPassageIndex(lows, highs, block_size=block_size)
+
+    for _ in range(300):
+        start = int(rng.integers(0, 3000))
+        width = float(rng.uniform(0.5, 40))
+        lower, upper = close[start] - width, close[start] + width
+        assert passage.first_cross(start, lower, upper) == brute_force(lows, highs, start, lower, upper)
+
+
+def test_never_crossed_returns_length():
+    passage = FirstPassageIndex(np.full(500, 10.0), np.full(500, 11.0))
+    assert passage.first_cross(0, 5.0, 20.0) == 500
+    assert passage.first_cross(499, 5.0, 20.0) == 500
+    assert passage.first_cross(3, 10.0, 20.0) == 3
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="lengths differ"):
+        FirstPassageIndex(np.zeros(3), np.zeros(4))
+    with pytest.raises(ValueError, match="block_size"):
+        FirstPassageIndex(np.zeros(3), np.zeros(3), block_size=0)
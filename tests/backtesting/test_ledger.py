@@ -0,0 +1,117 @@
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from backtesting.ledger import TradeLedger, curve_metrics, infer_periods_per_year, summarize_trades
+from core.types import ConsensusBatch
+from tests.conftest import random_ohlcv
+
+
+def make_run(record_trades: bool = True, n: int = 600, seed: int = 4):
+    df = random_ohlcv(n, seed)
+    df["ATR_14"] = 1.5
+    rng = np.random.default_rng(seed)
+    batch = ConsensusBatch(
+        index=df.index,
+        actions=rng.integers(-1, 2, n).astype(np.int8),
+        confidences=np.round(rng.uniform(0, 1, n), 2),
+        raw_scores=np.zeros(n),
+    ).slice(50, n)
+    return df, BacktestEngine(record_trades=record_trades).run(df, batch, "TEST", {"rr_ratio": 3.0})
+
+
+def test_ledger_matches_trade_dicts():
+    _, result = make_run()
+    ledger = result["ledger"]
+    assert len(ledger) == result["nb_trades"] > 0
+    assert ledger.to_records() == result["trades"]
+    assert ledger["pnl"].flags.c_contiguous
+
+
+def test_record_trades_false_keeps_ledger_and_metrics():
+    _, full = make_run(record_trades=True)
+    _, light = make_run(record_trades=False)
+    assert light["trades"] == []
+    assert light["nb_trades"] == full["nb_trades"]
+    assert light["ledger"].to_records() == full["trades"]
+    for key in ("capital_final", "win_rate", "profit_factor", "sharpe", "sortino", "calmar", "exposure"):
+        assert light[key] == full[key]
+
+
+def test_equity_curve_is_marked_to_market():
+    df, result = make_run()
+    curve = result["equity_curve"]
+    assert curve.index[0] == df.index[50]
+    assert curve.iloc[-1] == pytest.approx(result["capital_final"])
+
+    # Bar-by-bar reference: realized capital + PnL of the open position at the close
+    expected = pd.Series(1000.0, index=df.index)
+    capital = 1000.0
+    for trade in result["trades"]:
+        side = 1 if trade["direction"] == "BUY" else -1
+        held = df.loc[trade["entry_date"]:trade["exit_date"]].index[1:-1]
+        open_pnl = (df.loc[held, "close"] - trade["entry"]) * trade["position_size"] * side
+        expected.loc[held] = capital + open_pnl
+        capital += trade["pnl"]
+        expected.loc[trade["exit_date"]:] = capital
+    pd.testing.assert_series_equal(curve, expected.iloc[50:], check_names=False)
+
+    assert 0.0 < result["exposure"] <= 1.0
+    assert result["max_drawdown_mtm"] >= result["max_drawdown"]
+
+
+def test_curve_metrics():
+    index = pd.date_range("2024-01-01", periods=5, freq="D")
+    flat = curve_metrics(pd.Series(100.0, index=index), exposure=0.0)
+    assert flat["sharpe"] == flat["sortino"] == flat["calmar"] == flat["max_drawdown_mtm"] == 0.0
+
+    rising = curve_metrics(pd.Series([100.0, 101, 102, 103, 104], index=index), exposure=1.0)
+    assert rising["sharpe"] > 0 and rising["calmar"] == float("inf") and rising["sortino"] == 0.0
+
+    dipping = curve_metrics(pd.Series([100.0, 90, 95, 99, 108], index=index), exposure=1.0)
+    assert dipping["max_drawdown_mtm"] == pytest.approx(0.1)
+    assert dipping["sortino"] > 0
+
+    assert infer_periods_per_year(pd.date_range("2024-01-01", periods=3, freq="h")) == pytest.approx(8766)
+    assert infer_periods_per_year(pd.RangeIndex(3)) == 252.0
+
+
+def test_ledger_validation():
+    index = pd.RangeIndex(3)
+    with pytest.raises(KeyError, match="Ledger columns missing"):
+        TradeLedger({"pnl": np.zeros(1)}, index, "TEST")
+    columns = {name: np.zeros(1) for name in TradeLedger.empty(index, "TEST").columns}
+    columns["pnl"] = np.zeros(2)
+    with pytest.raises(ValueError, match="lengths differ"):
+        TradeLedger(columns, index, "TEST")
+
+
+def test_arrow_export_requires_pyarrow(monkeypatch):
+    _, result = make_run()
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="pyarrow is required"):
+        result["ledger"].to_arrow()
+
+
+def test_parquet_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+    _, result = make_run()
+    path = tmp_path / "ledger.parquet"
+    result["ledger"].to_parquet(str(path))
+    frame = pd.read_parquet(path)
+    assert list(frame["pnl"]) == list(result["ledger"]["pnl"])
+    assert frame["entry_date"].iloc[0] == result["ledger"].to_frame()["entry_date"].iloc[0]
+
+
+def test_summarize_trades_matches_engine_result():
+    _, result = make_run()
+    summary = summarize_trades(
+        "TEST", result["trades"], result["initial_capital"], result["capital_final"], result["max_drawdown"]
+    )
+    from_ledger = summarize_trades(
+        "TEST", [], result["initial_capital"], result["capital_final"], result["max_drawdown"], result["ledger"]
+    )
+    for key in ("total_return", "win_rate", "profit_factor", "nb_trades"):
+        assert summary[key] == result[key]
+        assert from_ledger[key] == result[key]
@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from backtesting.monte_carlo import MonteCarloAnalyzer
+from core.types import ConsensusBatch
+
+
+def make_result(pnls, initial_capital=1000.0):
+    trades = [{"pnl": p, "outcome": "WIN" if p > 0 else "LOSS"} for p in pnls]
+    return {
+        "ticker": "TEST",
+        "initial_capital": initial_capital,
+        "capital_final": initial_capital + sum(pnls),
+        "trades": trades,
+    }
+
+
+@pytest.fixture
+def result():
+    rng = np.random.default_rng(3)
+    capital, pnls = 1000.0, []
+    for win in rng.uniform(size=60) < 0.45:
+        pnl = capital * (0.04 if win else -0.02)
+        pnls.append(pnl)
+        capital += pnl
+    return make_result(pnls)
+
+
+def test_shuffle_keeps_final_capital(result):
+    mc = MonteCarloAnalyzer(result).run(n_paths=500, method="shuffle", seed=1)
+    assert mc["final_capital"] == pytest.approx(np.full(500, result["capital_final"]))
+    assert mc["max_drawdown"].min() >= 0.0
+    assert mc["max_drawdown"].std() > 0.0
+
+
+def test_paths_match_loop_reference(result):
+    analyzer = MonteCarloAnalyzer(result)
+    mc = analyzer.run(n_paths=50, method="bootstrap", seed=7)
+
+    rng = np.random.default_rng(7)
+    order = rng.integers(0, len(analyzer.returns), size=(50, len(analyzer.returns)))
+    for path, draws in enumerate(order):
+        capital = peak = 1000.0
+        drawdown = 0.0
+        for r in analyzer.returns[draws]:
+            capital *= 1.0 + r
+            peak = max(peak, capital)
+            drawdown = max(drawdown, (peak - capital) / peak)
+        assert mc["final_capital"][path] == pytest.approx(capital)
+        assert mc["max_drawdown"][path] == pytest.approx(drawdown)
+
+
+def test_chunks_are_seamless(result, monkeypatch):
+    full = MonteCarloAnalyzer(result).run(n_paths=300, method="shuffle", seed=2)
+    monkeypatch.setattr("backtesting.monte_carlo._MAX_CELLS_PER_CHUNK", 60 * 7)
+    chunked = MonteCarloAnalyzer(result).run(n_paths=300, method="shuffle", seed=2)
+    # Chunks consume the random stream in the same order as a single block
+    assert chunked["max_drawdown"] == pytest.approx(full["max_drawdown"])
+    assert chunked["final_capital"] == pytest.approx(full["final_capital"])
+
+
+def test_risk_of_ruin():
+    # Every path loses 60% whatever the order
+    result = make_result([-300.0, -200.0, -100.0])
+    mc = MonteCarloAnalyzer(result, ruin_threshold=0.5).run(n_paths=100, method="shuffle", seed=0)
+    assert mc["risk_of_ruin"] == 1.0
+    assert mc["prob_loss"] == 1.0
+    assert list(mc["summary"].index) == ["p5", "p25", "p50", "p75", "p95"]
+
+
+def test_invalid_arguments(result):
+    with pytest.raises(ValueError, match="at least one trade"):
+        MonteCarloAnalyzer(make_result([]))
+    with pytest.raises(ValueError, match="ruin_threshold"):
+        MonteCarloAnalyzer(result, ruin_threshold=0.0)
+    with pytest.raises(ValueError, match="Unknown Monte Carlo method"):
+        MonteCarloAnalyzer(result).run(method="jitter")
+
+
+def test_reads_the_ledger_without_trade_dicts():
+    index = pd.date_range("2024-01-01", periods=600, freq="h", tz="UTC")
+    rng = np.random.default_rng(4)
+    close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+    df = pd.DataFrame({"high": close + 1.0, "low": close - 1.0, "close": close, "ATR_14": 1.5}, index=index)
+    batch = ConsensusBatch(
+        index=index,
+        actions=rng.integers(-1, 2, len(index)).astype(np.int8),
+        confidences=np.round(rng.uniform(0, 1, len(index)), 2),
+        raw_scores=np.zeros(len(index)),
+    ).slice(50, len(index))
+    full = BacktestEngine().run(df, batch, "TEST")
+    light = BacktestEngine(record_trades=False).run(df, batch, "TEST")
+    assert light["trades"] == [] and len(light["ledger"]) > 0
+
+    expected = MonteCarloAnalyzer(full).run(n_paths=200, method="bootstrap", seed=2)
+    mc = MonteCarloAnalyzer(light).run(n_paths=200, method="bootstrap", seed=2)
+    np.testing.assert_array_equal(mc["final_capital"], expected["final_capital"])
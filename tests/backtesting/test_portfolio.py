@@ -0,0 +1,105 @@
+import pytest
+import numpy as np
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from backtesting.portfolio import PortfolioBacktestEngine
+from core.types import ConsensusBatch
+from tests.conftest import random_ohlcv
+
+
+def make_market(n: int, seed: int, start: str = "2024-01-01") -> pd.DataFrame:
+    df = random_ohlcv(n, seed, start=start)
+    df["ATR_14"] = df["high"] - df["low"] + 0.5
+    return df
+
+
+def make_batch(df: pd.DataFrame, seed: int) -> ConsensusBatch:
+    rng = np.random.default_rng(seed)
+    return ConsensusBatch(
+        index=df.index,
+        actions=rng.integers(-1, 2, len(df)).astype(np.int8),
+        confidences=np.round(rng.uniform(0, 1, len(df)), 2),
+        raw_scores=np.zeros(len(df)),
+    )
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_single_ticker_matches_backtest_engine(seed):
+    df = make_market(500, seed)
+    batch = make_batch(df, seed + 10).slice(20, 500)
+    config = {"rr_ratio": 1.5, "cooldown_candles": 3}
+
+    portfolio = PortfolioBacktestEngine().run({"AAA": df}, {"AAA": batch}, {"AAA": config})
+    single = BacktestEngine().run(df, batch, "AAA", config)
+
+    assert portfolio["nb_trades"] == single["nb_trades"] > 0
+    assert portfolio["capital_final"] == pytest.approx(single["capital_final"], rel=1e-12)
+    for p_trade, s_trade in zip(portfolio["trades"], single["trades"]):
+        assert p_trade == pytest.approx(s_trade)
+
+
+def test_shared_capital_and_merged_timeline():
+    frames = {
+        "AAA": make_market(300, 1),
+        "BBB": make_market(200, 2, start="2024-01-10"),  # starts later, runs past AAA
+    }
+    signals = {t: make_batch(df, i) for i, (t, df) in enumerate(frames.items())}
+    result = PortfolioBacktestEngine().run(frames, signals)
+
+    assert result["tickers"] == ["AAA", "BBB"]
+    assert len(result["equity_curve"]) == len(frames["AAA"].index.union(frames["BBB"].index))
+    assert result["equity_curve"].index.is_monotonic_increasing
+    assert result["per_ticker"]["nb_trades"].sum() == result["nb_trades"]
+    assert result["capital_final"] == pytest.approx(1000.0 + sum(t["pnl"] for t in result["trades"]))
+    assert result["equity_curve"].iloc[-1] == pytest.approx(result["capital_final"])
+    assert 0.0 <= result["max_drawdown"] < 1.0
+
+
+def test_max_positions_caps_concurrent_trades():
+    frames = {f"T{i}": make_market(300, i) for i in range(5)}
+    signals = {t: make_batch(df, 100 + i) for i, (t, df) in enumerate(frames.items())}
+    result = PortfolioBacktestEngine(max_positions=2).run(frames, signals)
+
+    # Rebuild the number of simultaneously held positions from the trade log
+    timeline = result["equity_curve"].index.astype(str)
+    held = np.zeros(len(timeline), dtype=int)
+    for trade in result["trades"]:
+        entry = timeline.get_loc(trade["entry_date"]) + 1
+        exit_ = timeline.get_loc(trade["exit_date"])
+        held[entry:exit_ + 1] += 1
+    assert result["nb_trades"] > 0
+    assert held.max() <= 2
+
+
+def test_signal_on_last_candle_does_not_hold_a_slot():
+    """A BUY on A's last candle cannot execute: it must not block B's entry."""
+    frames = {"A": make_market(5, 1), "B": make_market(10, 2)}
+    for df in frames.values():
+        df.index = pd.date_range("2024-01-01", periods=len(df), freq="D", tz="UTC")
+    signals = {}
+    for ticker, buy_at in (("A", 4), ("B", 6)):
+        actions = np.zeros(len(frames[ticker]), dtype=np.int8)
+        actions[buy_at] = 1
+        signals[ticker] = ConsensusBatch(
+            index=frames[ticker].index,
+            actions=actions,
+            confidences=np.where(actions != 0, 0.9, 0.0),
+            raw_scores=np.zeros(len(actions)),
+        )
+
+    unlimited = PortfolioBacktestEngine().run(frames, signals)
+    capped = PortfolioBacktestEngine(max_positions=1).run(frames, signals)
+
+    assert [t["ticker"] for t in unlimited["trades"]] == ["B"]
+    assert capped["trades"] == unlimited["trades"]
+
+
+def test_invalid_max_positions():
+    with pytest.raises(ValueError, match="max_positions"):
+        PortfolioBacktestEngine(max_positions=0)
+
+
+def test_empty_frame_raises():
+    frames = {"AAA": make_market(50, 1), "BBB": make_market(0, 2)}
+    with pytest.raises(ValueError, match="BBB"):
+        PortfolioBacktestEngine().run(frames, {"AAA": make_batch(frames["AAA"], 3)})
@@ -0,0 +1,55 @@
+import pytest
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from backtesting.sweep import ParameterSweep, expand_grid
+
+
+@pytest.fixture(scope="module")
+def processed_df(make_processed_df):
+    return make_processed_df(n=800, seed=42)
+
+
+GRID = {"rr_ratio": [1.5, 2.0], "activation_threshold": [0.2, 0.4], "cooldown_candles": [0, 6]}
+
+
+def test_expand_grid():
+    combos = expand_grid({"rr_ratio": [1.5, 2.0], "cooldown_candles": [4]})
+    assert combos == [{"rr_ratio": 1.5, "cooldown_candles": 4}, {"rr_ratio": 2.0, "cooldown_candles": 4}]
+
+def test_expand_grid_rejects_unknown_keys():
+    with pytest.raises(ValueError, match="Unsupported sweep keys"):
+        expand_grid({"fast_ma": ["SMA_8"]})
+
+def test_expand_grid_rejects_empty_values():
+    with pytest.raises(ValueError, match="No candidate values"):
+        expand_grid({"rr_ratio": []})
+
+def test_sweep_matches_individual_runs(processed_df, orchestrator):
+    sweep = ParameterSweep(processed_df, orchestrator, "TEST", lookback=500)
+    table = sweep.run(GRID, processes=1)
+
+    assert len(table) == 8
+    assert list(table.index) == list(range(1, 9))
+    assert table["total_return"].is_monotonic_decreasing
+
+    batches = orchestrator.analyze_batch(processed_df)
+    for _, row in table.iterrows():
+        consensus = orchestrator.get_consensus_batch(
+            batches, index=processed_df.index, activation_threshold=row["activation_threshold"]
+        ).tail(500)
+        config = {"rr_ratio": row["rr_ratio"], "cooldown_candles": int(row["cooldown_candles"])}
+        expected = BacktestEngine().run(processed_df, consensus, "TEST", config)
+        assert row["total_return"] == expected["total_return"]
+        assert row["nb_trades"] == expected["nb_trades"]
+
+def test_sweep_process_pool_matches_in_process(processed_df, orchestrator):
+    sweep = ParameterSweep(processed_df, orchestrator, "TEST")
+    pd.testing.assert_frame_equal(sweep.run(GRID, processes=2), sweep.run(GRID, processes=1))
+
+def test_sweep_ranks_drawdown_ascending(processed_df, orchestrator):
+    table = ParameterSweep(processed_df, orchestrator, "TEST").run(GRID, processes=1, sort_by="max_drawdown")
+    assert table["max_drawdown"].is_monotonic_increasing
+
+def test_sweep_unknown_metric(processed_df, orchestrator):
+    with pytest.raises(ValueError, match="Unknown ranking metric"):
+        ParameterSweep(processed_df, orchestrator, "TEST").run(GRID, processes=1, sort_by="alpha")
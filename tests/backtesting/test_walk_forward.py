@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+from backtesting.engine import BacktestEngine
+from backtesting.walk_forward import WalkForwardOptimizer
+
+
+@pytest.fixture(scope="module")
+def processed_df(make_processed_df):
+    return make_processed_df(n=1200, seed=8)
+
+
+GRID = {"rr_ratio": [1.0, 2.0, 3.0], "activation_threshold": [0.2, 0.4]}
+
+
+def test_windows_rolling_and_anchored(processed_df, orchestrator):
+    n = len(processed_df)
+    rolling = WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=500, test_size=300)
+    assert rolling.windows() == [(0, 500, 800), (300, 800, 1100), (600, 1100, n)]
+
+    anchored = WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=500, test_size=300, anchored=True)
+    assert [w[0] for w in anchored.windows()] == [0, 0, 0]
+
+    spaced = WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=500, test_size=300, step=400)
+    assert spaced.windows() == [(0, 500, 800), (400, 900, n)]
+
+def test_overlapping_test_windows_raise(processed_df, orchestrator):
+    with pytest.raises(ValueError, match="must be at least test_size"):
+        WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=400, test_size=300, step=100)
+
+def test_invalid_window_sizes(processed_df, orchestrator):
+    with pytest.raises(ValueError, match="must be positive"):
+        WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=0, test_size=100)
+    with pytest.raises(ValueError, match="must be smaller than the data"):
+        WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=10_000, test_size=100)
+
+def test_stitched_equity_matches_sequential_replay(processed_df, orchestrator):
+    optimizer = WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=400, test_size=250)
+    result = optimizer.run(GRID, processes=1)
+    windows = result["windows"]
+    assert len(windows) == len(optimizer.windows())
+
+    # Replay each test window with the selected parameters, compounding the capital for real
+    batches = orchestrator.analyze_batch(processed_df)
+    capital = 1000.0
+    nb_trades = 0
+    for (_, test_start, test_end), (_, row) in zip(optimizer.windows(), windows.iterrows()):
+        consensus = orchestrator.get_consensus_batch(
+            batches, index=processed_df.index, activation_threshold=row["activation_threshold"]
+        ).slice(test_start, test_end)
+        res = BacktestEngine(initial_capital=capital).run(
+            processed_df.iloc[test_start:test_end], consensus, "TEST", {"rr_ratio": row["rr_ratio"]}
+        )
+        capital = res["capital_final"]
+        nb_trades += res["nb_trades"]
+
+    assert result["capital_final"] == pytest.approx(capital, rel=1e-9)
+    assert result["nb_trades"] == nb_trades
+    assert result["equity"].iloc[-1] == pytest.approx(result["capital_final"])
+    assert len(result["equity"]) == nb_trades + 1
+    assert result["equity_curve"].index.is_monotonic_increasing
+    assert result["equity_curve"].iloc[-1] == pytest.approx(result["capital_final"])
+
+def test_process_pool_matches_in_process(processed_df, orchestrator):
+    optimizer = WalkForwardOptimizer(processed_df, orchestrator, "TEST", train_size=400, test_size=250)
+    parallel = optimizer.run(GRID, processes=2)
+    serial = optimizer.run(GRID, processes=1)
+    pd.testing.assert_frame_equal(parallel["windows"], serial["windows"])
+    assert parallel["capital_final"] == serial["capital_final"]
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+
+def random_ohlcv(
+    n: int,
+    seed: int,
+    freq: str = "h",
+    start: str = "2024-01-01",
+    price: float = 100.0,
+    volatility: float = 1.0,
+) -> pd.DataFrame:
+    """
+    Random-walk OHLCV candles on a UTC index, with the 'source' column of the CCXT fetcher output.
+
+    The close moves by N(0, volatility) per candle from `price`; the high and low lie
+    0.1 to 2 volatilities away from it, and the open equals the close.
+    """
+    rng = np.random.default_rng(seed)
+    close = price + np.cumsum(rng.normal(0, volatility, n))
+    df = pd.DataFrame({
+        "open": close,
+        "high": close + volatility * rng.uniform(0.1, 2.0, n),
+        "low": close - volatility * rng.uniform(0.1, 2.0, n),
+        "close": close,
+        "volume": rng.uniform(10, 1000, n),
+    }, index=pd.date_range(start, periods=n, freq=freq, tz="UTC"))
+    df["source"] = "binance"
+    return df
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 from core.types import Action
 from core.monkeys.momentum_monkey import MomentumMonkey
@@ -98,3 +99,28 @@ def test_momentum_monkey_missing_column(monkey: MomentumMonkey) -> None:
     df = pd.DataFrame({"RSI_14": [50.0], "MACD_signal": [1.0], "close": [100.0]})
     with pytest.raises(KeyError, match="Missing columns"):
         monkey.analyze(df)
+
+def test_momentum_monkey_analyze_batch_matches_prefix_loop(monkey: MomentumMonkey) -> None:
+    """Row i of analyze_batch must equal analyze() on the prefix ending at row i."""
+    rng = np.random.default_rng(5)
+    n = 200
+    df = pd.DataFrame({
+        "RSI_14": rng.uniform(20, 80, n),
+        "MACD_line": rng.normal(0, 1, n),
+        "MACD_signal": rng.normal(0, 1, n),
+        "ATR_14": rng.uniform(0, 10, n),
+    })
+    df.loc[::17, "RSI_14"] = np.nan
+    df.loc[::11, "ATR_14"] = np.nan
+    df.loc[::13, "ATR_14"] = 0.0
+    batch = monkey.analyze_batch(df)
+
+    for i in range(n):
+        assert batch.signal_at(i) == monkey.analyze(df.iloc[:i + 1])
+
+def test_momentum_monkey_analyze_batch_without_atr_column(monkey: MomentumMonkey) -> None:
+    """A missing ATR column falls back to 0.5 MACD strength, like analyze()."""
+    df = pd.DataFrame({"RSI_14": [60.0], "MACD_line": [1.5], "MACD_signal": [1.0]})
+    batch = monkey.analyze_batch(df)
+    assert batch.signal_at(0) == monkey.analyze(df)
+    assert batch.confidences[0] == 0.35
@@ -25,6 +25,16 @@ def test_analyze_missing_column(base_risk_monkey):
     with pytest.raises(KeyError, match="Missing column"):
         base_risk_monkey.analyze(df)
 
+def test_analyze_batch_matches_analyze(base_risk_monkey):
+    df = pd.DataFrame({"close": [100.0, 101.0, 102.0], "ATR_14": [pd.NA, 2.0, 0.0]})
+    batch = base_risk_monkey.analyze_batch(df)
+    for i in range(len(df)):
+        assert batch.signal_at(i) == base_risk_monkey.analyze(df.iloc[:i + 1])
+
+def test_analyze_batch_missing_column(base_risk_monkey):
+    with pytest.raises(KeyError, match="Missing column"):
+        base_risk_monkey.analyze_batch(pd.DataFrame({"close": [100.0]}))
+
 def test_compute_trade_plan_buy(base_risk_monkey):
     df = pd.DataFrame({"close": [100.0], "ATR_14": [2.0]})
     consensus = {
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 from core.types import Action
 from core.monkeys.trend_monkey import TrendMonkey
@@ -78,3 +79,24 @@ def test_trend_monkey_missing_columns():
     df = pd.DataFrame({"close": [1, 2]})
     with pytest.raises(KeyError, match="Missing columns"):
         monkey.analyze(df)
+
+def test_trend_monkey_analyze_batch_matches_prefix_loop():
+    monkey = TrendMonkey("TestTrend", fast_col="Fast", slow_col="Slow")
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    df = pd.DataFrame({
+        "Fast": pd.Series(close).rolling(5).mean(),
+        "Slow": pd.Series(close).rolling(20).mean(),
+        "close": close,
+    })
+    batch = monkey.analyze_batch(df)
+
+    assert len(batch) == len(df)
+    for i in range(len(df)):
+        expected = monkey.analyze(df.iloc[:i + 1])
+        assert batch.signal_at(i) == expected
+
+def test_trend_monkey_analyze_batch_missing_columns():
+    monkey = TrendMonkey("TestTrend", fast_col="Fast", slow_col="Slow")
+    with pytest.raises(KeyError, match="Missing columns"):
+        monkey.analyze_batch(pd.DataFrame({"close": [1, 2]}))
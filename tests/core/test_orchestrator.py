@@ -1,8 +1,9 @@
 import pytest
+import numpy as np
 import pandas as pd
-from core.types import Action, MonkeySignal
+from core.types import Action, MonkeySignal, MonkeySignalBatch
 from core.base_monkey import BaseMonkey
-from core.orchestrator import MarketOrchestrator
+from core.orchestrator import MarketOrchestrator, _round_like_python
 
 class DummyMonkey(BaseMonkey):
     def __init__(self, name, action: Action, confidence: float, weight: float = 1.0, crash: bool = False):
@@ -60,3 +61,66 @@ def test_orchestrator_weighted_average(empty_df):
     res = orch.get_consensus(empty_df)
     assert res["Signal"] == "BUY"
     assert res["Confiance"] == 0.37
+
+
+def test_orchestrator_analyze_batch_uses_generic_fallback():
+    m1 = DummyMonkey("M1", Action.BUY, 0.8)
+    m2 = DummyMonkey("M2", Action.SELL, 0.2)
+    orch = MarketOrchestrator([m1, m2], activation_threshold=0.2)
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+
+    batches = orch.analyze_batch(df)
+    assert [b.monkey_name for b in batches] == ["M1", "M2"]
+    assert list(batches[0].actions) == [1, 1, 1]
+    assert list(batches[1].confidences) == [0.2, 0.2, 0.2]
+
+    for i in range(len(df)):
+        expected = orch.get_consensus(df.iloc[:i + 1])
+        assert orch.aggregate([b.signal_at(i) for b in batches]) == expected
+
+def test_orchestrator_analyze_batch_fail_fast():
+    m1 = DummyMonkey("CrashMonkey", Action.BUY, 0.5, crash=True)
+    orch = MarketOrchestrator([m1])
+    with pytest.raises(RuntimeError, match="Crash of agent 'CrashMonkey'"):
+        orch.analyze_batch(pd.DataFrame({"close": [1.0]}))
+
+def test_get_consensus_batch_matches_aggregate():
+    rng = np.random.default_rng(0)
+    n = 500
+    monkeys = [
+        DummyMonkey("M1", Action.BUY, 0.0, weight=2.0),
+        DummyMonkey("M2", Action.BUY, 0.0, weight=1.0),
+        DummyMonkey("M3", Action.BUY, 0.0, weight=0.5),
+    ]
+    batches = [
+        MonkeySignalBatch(m.name, rng.integers(-1, 2, n), np.round(rng.uniform(0, 1, n), 3))
+        for m in monkeys
+    ]
+    orch = MarketOrchestrator(monkeys, activation_threshold=0.3)
+    index = pd.date_range("2024-01-01", periods=n, freq="h")
+
+    consensus = orch.get_consensus_batch(batches, index=index)
+
+    assert len(consensus) == n
+    for i in range(n):
+        expected = orch.aggregate([b.signal_at(i) for b in batches])
+        record = consensus.record(i)
+        assert record["Datetime"] == str(index[i])
+        assert {k: record[k] for k in expected} == expected
+
+def test_get_consensus_batch_threshold_override():
+    m1 = DummyMonkey("M1", Action.BUY, 0.3)
+    orch = MarketOrchestrator([m1], activation_threshold=0.5)
+    batches = [MonkeySignalBatch("M1", [1], [0.3])]
+    assert orch.get_consensus_batch(batches).actions[0] == Action.WAIT.value
+    assert orch.get_consensus_batch(batches, activation_threshold=0.2).actions[0] == Action.BUY.value
+
+def test_get_consensus_batch_wrong_number_of_batches():
+    orch = MarketOrchestrator([DummyMonkey("M1", Action.BUY, 0.3)])
+    with pytest.raises(ValueError, match="one per Monkey"):
+        orch.get_consensus_batch([])
+
+def test_round_like_python_on_ties():
+    values = np.array([0.125, 0.375, 0.285, 1.005, -0.125, 2.675, 0.3666666])
+    rounded = _round_like_python(values, 2)
+    assert list(rounded) == [round(float(v), 2) for v in values]
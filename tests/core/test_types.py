@@ -1,5 +1,7 @@
 import pytest
-from core.types import Action, MonkeySignal
+import numpy as np
+import pandas as pd
+from core.types import Action, MonkeySignal, MonkeySignalBatch, ConsensusBatch
 
 def test_monkey_signal_valid():
     signal = MonkeySignal(monkey_name="Test", action=Action.BUY, confidence=0.5)
@@ -13,3 +15,36 @@ def test_monkey_signal_invalid_high_confidence():
 def test_monkey_signal_invalid_low_confidence():
     with pytest.raises(ValueError, match="Confidence should be between 0.0 and 1.0"):
         MonkeySignal(monkey_name="Test", action=Action.BUY, confidence=-0.1)
+
+def test_monkey_signal_batch_valid():
+    batch = MonkeySignalBatch("Test", [1, 0, -1], [0.5, 0.0, 1.0])
+    assert len(batch) == 3
+    assert batch.actions.dtype == np.int8
+    assert batch.signal_at(2) == MonkeySignal("Test", Action.SELL, 1.0)
+
+def test_monkey_signal_batch_invalid_confidence():
+    with pytest.raises(ValueError, match="Confidence should be between 0.0 and 1.0"):
+        MonkeySignalBatch("Test", [1, 0], [0.5, 1.5])
+
+def test_monkey_signal_batch_length_mismatch():
+    with pytest.raises(ValueError, match="lengths differ"):
+        MonkeySignalBatch("Test", [1, 0], [0.5])
+
+def test_consensus_batch_tail_and_records():
+    index = pd.date_range("2024-01-01", periods=3, freq="D")
+    batch = ConsensusBatch(
+        index=index,
+        actions=np.array([1, 0, -1], dtype=np.int8),
+        confidences=np.array([0.5, 0.1, 0.7]),
+        raw_scores=np.array([0.5, 0.1, -0.7]),
+        monkey_batches=[MonkeySignalBatch("M1", [1, 0, -1], [0.5, 0.0, 0.7])],
+    )
+    tail = batch.tail(2)
+    assert len(tail) == 2
+    assert tail.to_records() == [
+        {"Signal": "WAIT", "Confiance": 0.1, "Log_Agents": "[M1: WAIT (0%)]", "Raw_Score": 0.1,
+         "Date": "2024-01-02", "Datetime": str(index[1]), "Timestamp": index[1].value},
+        {"Signal": "SELL", "Confiance": 0.7, "Log_Agents": "[M1: SELL (70%)]", "Raw_Score": -0.7,
+         "Date": "2024-01-03", "Datetime": str(index[2]), "Timestamp": index[2].value},
+    ]
+    assert len(batch.tail(10)) == 3
@@ -0,0 +1,133 @@
+import asyncio
+
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from data.async_ccxt_fetcher import AsyncCCXTDataFetcher
+from data.candle_store import CandleStore
+from data.fetcher_router import DataFetcherRouter
+
+PAGES = [
+    [[1000, 1, 2, 0.5, 1.5, 10], [2000, 1.5, 2.5, 1, 2, 15]],
+    [[3000, 2, 3, 1.5, 2.5, 20]],
+    [],
+]
+
+
+@pytest.fixture
+def mock_async_exchange():
+    """Mock the async ccxt module and its exchange."""
+    with patch("data.async_ccxt_fetcher.ccxt_async") as mock_ccxt:
+        mock_exchange = MagicMock()
+        mock_exchange.fetch_ohlcv = AsyncMock(side_effect=PAGES)
+        mock_exchange.close = AsyncMock()
+        mock_ccxt.binance.return_value = mock_exchange
+        yield mock_exchange
+
+
+def test_fetch_async_paginates(mock_async_exchange):
+    fetcher = AsyncCCXTDataFetcher()
+    df = asyncio.run(fetcher.fetch_async("BTC-USD", period="1d"))
+
+    assert mock_async_exchange.fetch_ohlcv.await_count == 3
+    assert len(df) == 3
+    assert list(df.columns) == ["open", "high", "low", "close", "volume", "source"]
+    assert (df["source"] == "binance").all()
+
+
+def test_blocking_fetch_closes_the_session(mock_async_exchange):
+    df = AsyncCCXTDataFetcher().fetch("BTC-USD", period="1d")
+
+    assert len(df) == 3
+    mock_async_exchange.close.assert_awaited_once()
+
+
+def make_candles(ticker: str) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC", name="Date")
+    return pd.DataFrame({"close": [1.0, 2.0, 3.0], "source": ticker}, index=index)
+
+
+class SlowFetcher:
+    """Async fetcher recording how many requests are in flight at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+
+    async def fetch_async(self, ticker, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if ticker == "BAD/USDT":
+            raise ValueError("No data returned")
+        return make_candles(ticker)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_router_fetch_async_bounds_concurrency_per_exchange():
+    router = DataFetcherRouter(max_concurrency=2)
+    fetcher = SlowFetcher()
+
+    async def scan():
+        with patch("data.fetcher_router.AsyncCCXTDataFetcher", return_value=fetcher):
+            try:
+                return await asyncio.gather(
+                    *(router.fetch_async(f"T{i}/USDT") for i in range(6)),
+                    router.fetch_async("BAD/USDT"),
+                    return_exceptions=True,
+                )
+            finally:
+                await router.close_async()
+
+    results = asyncio.run(scan())
+
+    assert fetcher.peak == 2
+    assert fetcher.closed
+    assert [df["source"].iloc[0] for df in results[:6]] == [f"T{i}/USDT" for i in range(6)]
+    # A failing ticker does not affect the others
+    assert isinstance(results[6], RuntimeError)
+    assert "BAD/USDT" in str(results[6])
+
+
+def test_router_fetch_async_uses_the_candle_store(tmp_path):
+    store = CandleStore(str(tmp_path))
+    router = DataFetcherRouter(store=store)
+    fetcher = SlowFetcher()
+
+    async def fetch():
+        with patch("data.fetcher_router.AsyncCCXTDataFetcher", return_value=fetcher):
+            try:
+                return await router.fetch_async("BTC/USDT", start="2024-01-01", end="2024-01-03")
+            finally:
+                await router.close_async()
+
+    df = asyncio.run(fetch())
+
+    assert len(df) == 3
+    pd.testing.assert_frame_equal(store.load("binance", "BTC/USDT", "1d"), df, check_freq=False)
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        DataFetcherRouter(max_concurrency=0)
+
+
+def test_fetch_async_partitions_the_range_into_windows(mock_async_exchange):
+    start = int(pd.Timestamp("2024-01-01", tz="UTC").timestamp() * 1000)
+    timestamps = [start + i * 60_000 for i in range(2500)]
+
+    async def fetch_ohlcv(symbol, timeframe, since, limit):
+        return [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in timestamps if ts >= since][:limit]
+
+    mock_async_exchange.fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv)
+    fetcher = AsyncCCXTDataFetcher()
+    df = asyncio.run(fetcher.fetch_async("BTC/USDT", interval="1m", start="2024-01-01", end="2024-01-02 17:39:00"))
+
+    assert mock_async_exchange.fetch_ohlcv.await_count == 3
+    assert len(df) == 2500
+    assert df.index.is_unique and df.index.is_monotonic_increasing
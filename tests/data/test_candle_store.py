@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.candle_store import CandleStore
+from data.fetcher_router import DataFetcherRouter
+
+
+def make_candles(start: str, periods: int, offset: float = 0.0) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="h", tz="UTC", name="Date")
+    close = 100 + np.arange(periods, dtype=float) + offset
+    df = pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=index)
+    df["source"] = "binance"
+    return df
+
+
+class FakeFetcher:
+    """Exchange returning the candles of a fixed history from `start` on."""
+    def __init__(self, history: pd.DataFrame):
+        self.history = history
+        self.calls = []
+
+    def fetch(self, ticker, period="6mo", interval="1d", start=None, end=None):
+        self.calls.append(start)
+        since = pd.Timestamp(start, tz="UTC")
+        df = self.history[self.history.index >= since]
+        if end:
+            df = df[df.index <= pd.Timestamp(end, tz="UTC")]
+        return df.copy()
+
+
+def test_merge_deduplicates_on_timestamp(tmp_path):
+    store = CandleStore(str(tmp_path))
+    store.merge("binance", "BTC/USDT", "1h", make_candles("2024-01-01", 10))
+    # Overlapping fetch: the last stored candle was still forming and changed
+    merged = store.merge("binance", "BTC/USDT", "1h", make_candles("2024-01-01 09:00", 5, offset=0.5))
+
+    assert len(merged) == 14
+    assert merged.index.is_monotonic_increasing and merged.index.is_unique
+    assert merged["close"].iloc[9] == 100.5
+    pd.testing.assert_frame_equal(store.load("binance", "BTC/USDT", "1h"), merged, check_freq=False)
+    assert store.complete_from("binance", "BTC/USDT", "1h") == pd.Timestamp("2024-01-01", tz="UTC")
+    assert store.load("binance", "ETH/USDT", "1h") is None
+
+
+def test_router_only_downloads_new_candles(tmp_path):
+    history = make_candles("2024-01-01", 100)
+    fetcher = FakeFetcher(history.iloc[:60])
+    router = DataFetcherRouter(store=CandleStore(str(tmp_path)))
+    router._ccxt_fetchers["binance"] = fetcher
+
+    first = router.fetch("BTC/USDT", interval="1h", start="2024-01-01")
+    pd.testing.assert_frame_equal(first, history.iloc[:60], check_freq=False)
+
+    # An hour later: 40 new candles on the exchange
+    fetcher.history = history
+    second = router.fetch("BTC/USDT", interval="1h", start="2024-01-02")
+    pd.testing.assert_frame_equal(second, history.loc["2024-01-02":], check_freq=False)
+    assert pd.Timestamp(fetcher.calls[-1]) == history.index[59]
+
+    # Fully stored range: no download at all
+    calls = len(fetcher.calls)
+    router.fetch("BTC/USDT", interval="1h", start="2024-01-01", end="2024-01-02")
+    assert len(fetcher.calls) == calls
+
+
+def test_router_downloads_again_before_the_stored_range(tmp_path):
+    history = make_candles("2024-01-01", 100)
+    fetcher = FakeFetcher(history)
+    router = DataFetcherRouter(store=CandleStore(str(tmp_path)))
+    router._ccxt_fetchers["binance"] = fetcher
+
+    router.fetch("BTC/USDT", interval="1h", start="2024-01-03")
+    result = router.fetch("BTC/USDT", interval="1h", start="2024-01-01")
+
+    assert pd.Timestamp(fetcher.calls[-1]) == pd.Timestamp("2024-01-01", tz="UTC")
+    pd.testing.assert_frame_equal(result, history, check_freq=False)
+
+
+def test_router_reports_an_empty_stored_range(tmp_path):
+    router = DataFetcherRouter(store=CandleStore(str(tmp_path)))
+    router._ccxt_fetchers["binance"] = FakeFetcher(make_candles("2024-01-01", 10))
+    router.fetch("BTC/USDT", interval="1h", start="2024-01-01")
+
+    with pytest.raises(RuntimeError, match="No stored candles"):
+        router.fetch("BTC/USDT", interval="1h", start="2023-01-01", end="2023-02-01")
@@ -1,3 +1,4 @@
+import ccxt
 import pytest
 import pandas as pd
 from unittest.mock import patch, MagicMock
@@ -10,6 +11,7 @@ def mock_ccxt_exchange():
         mock_exchange = MagicMock()
         mock_ccxt.binance.return_value = mock_exchange
         mock_ccxt.BaseError = Exception
+        mock_ccxt.Exchange.parse_timeframe = ccxt.Exchange.parse_timeframe
         yield mock_exchange
 
 def test_ccxt_fetcher_init(mock_ccxt_exchange):
@@ -69,3 +71,72 @@ def test_fetch_with_end_date(mock_ccxt_exchange):
     # We will just see if it runs without crashing
     df = fetcher.fetch("BTC-USD", start="2023-01-01", end="2023-12-31")
     assert len(df) == 1 # Second one is filtered out
+
+def test_interval_seconds():
+    assert CCXTDataFetcher.interval_seconds("1h") == 3600
+    assert CCXTDataFetcher.interval_seconds("1d") == 86400
+    assert CCXTDataFetcher.interval_seconds("1wk") == 7 * 86400
+
+class FakeExchange:
+    """Serves minute candles from a fixed history, `limit` at a time, like fetch_ohlcv()."""
+
+    rateLimit = 0
+
+    def __init__(self, timestamps):
+        self.timestamps = timestamps
+        self.calls = []
+
+    def load_markets(self):
+        pass
+
+    def fetch_ohlcv(self, symbol, timeframe, since, limit):
+        self.calls.append(since)
+        return [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in self.timestamps if ts >= since][:limit]
+
+def make_partitioned_fetcher(timestamps, max_concurrency):
+    with patch("data.ccxt_fetcher.ccxt") as mock_ccxt:
+        mock_ccxt.binance.return_value = FakeExchange(timestamps)
+        mock_ccxt.Exchange.parse_timeframe = ccxt.Exchange.parse_timeframe
+        fetcher = CCXTDataFetcher(max_concurrency=max_concurrency)
+    return fetcher
+
+MINUTE = 60_000
+START = int(pd.Timestamp("2024-01-01", tz="UTC").timestamp() * 1000)
+
+def test_fetch_partitions_the_range_into_windows():
+    """A 2500-candle range is fetched as 3 independent windows, stitched in order."""
+    timestamps = [START + i * MINUTE for i in range(2500)]
+    end = "2024-01-02 17:39:00"  # candle 2499
+    concurrent = make_partitioned_fetcher(timestamps, max_concurrency=4)
+    sequential = make_partitioned_fetcher(timestamps, max_concurrency=1)
+
+    df = concurrent.fetch("BTC/USDT", interval="1m", start="2024-01-01", end=end)
+
+    assert sorted(concurrent.exchange.calls) == [START, START + 1000 * MINUTE, START + 2000 * MINUTE]
+    assert len(df) == 2500
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(df, sequential.fetch("BTC/USDT", interval="1m", start="2024-01-01", end=end))
+
+def test_fetch_windows_skip_exchange_downtime():
+    """Candles missing on the exchange side are not a fetch gap."""
+    timestamps = [START + i * MINUTE for i in range(2500) if not 900 <= i < 1100]
+    fetcher = make_partitioned_fetcher(timestamps, max_concurrency=4)
+
+    df = fetcher.fetch("BTC/USDT", interval="1m", start="2024-01-01", end="2024-01-02 17:39:00")
+
+    assert len(df) == 2300
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+
+def test_fetch_empty_window_before_later_candles_raises():
+    fetcher = make_partitioned_fetcher([START + i * MINUTE for i in range(2500)], max_concurrency=4)
+    serve = fetcher.exchange.fetch_ohlcv
+    fetcher.exchange.fetch_ohlcv = lambda symbol, timeframe, since, limit: (
+        [] if since == START + 1000 * MINUTE else serve(symbol, timeframe, since, limit)
+    )
+
+    with pytest.raises(ValueError, match="no candle"):
+        fetcher.fetch("BTC/USDT", interval="1m", start="2024-01-01", end="2024-01-02 17:39:00")
+
+def test_max_concurrency_must_be_positive(mock_ccxt_exchange):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        CCXTDataFetcher(max_concurrency=0)
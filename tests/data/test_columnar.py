@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+import pandas as pd
+from data.columnar import append_part, iter_chunks, iter_parts, read_frame, write_frame
+
+
+def test_roundtrip_datetime_index(tmp_path):
+    index = pd.date_range("2024-01-01", periods=50, freq="h", tz="UTC", name="Datetime")
+    df = pd.DataFrame({"close": np.linspace(1, 2, 50), "flag": np.arange(50, dtype=np.int8)}, index=index)
+    write_frame(df, str(tmp_path / "frame"))
+
+    loaded = read_frame(str(tmp_path / "frame"))
+    pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+    mapped = read_frame(str(tmp_path / "frame"), mmap=True)
+    assert mapped.index.equals(df.index)
+    assert all(np.array_equal(mapped[name].to_numpy(), df[name].to_numpy()) for name in df.columns)
+
+
+def test_roundtrip_plain_index_and_overwrite(tmp_path):
+    write_frame(pd.DataFrame({"a": [1.0, 2.0]}), str(tmp_path / "frame"))
+    df = pd.DataFrame({"BTC/USDT": [3.0, 4.0, 5.0]}, index=[10, 20, 30])
+    write_frame(df, str(tmp_path / "frame"))
+    pd.testing.assert_frame_equal(read_frame(str(tmp_path / "frame")), df)
+
+
+def test_text_columns(tmp_path):
+    df = pd.DataFrame({"close": [1.0, 2.0], "source": ["binance", "kraken"]})
+    write_frame(df, str(tmp_path / "frame"))
+    pd.testing.assert_frame_equal(read_frame(str(tmp_path / "frame")), df)
+
+    with pytest.raises(ValueError, match="object dtype"):
+        write_frame(pd.DataFrame({"source": ["binance", None]}), str(tmp_path / "missing_text"))
+
+
+def test_missing_frame_and_object_columns(tmp_path):
+    assert read_frame(str(tmp_path / "missing")) is None
+    with pytest.raises(ValueError, match="object dtype"):
+        write_frame(pd.DataFrame({"payload": [{"a": 1}, {"b": 2}]}), str(tmp_path / "frame"))
+
+
+def test_parts_and_chunks(tmp_path):
+    index = pd.date_range("2024-01-01", periods=25, freq="min", tz="UTC")
+    df = pd.DataFrame({"close": np.arange(25, dtype=np.float64)}, index=index)
+    directory = str(tmp_path / "parts")
+    for start in range(0, 25, 10):
+        append_part(df.iloc[start:start + 10], directory)
+
+    assert [len(part) for part in iter_parts(directory)] == [10, 10, 5]
+    pd.testing.assert_frame_equal(read_frame(directory), df, check_freq=False)
+
+    chunks = list(iter_chunks(directory, 4))
+    assert max(len(chunk) for chunk in chunks) == 4
+    pd.testing.assert_frame_equal(pd.concat(chunks), df, check_freq=False)
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(iter_chunks(directory, 0))
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from data.fetch_cache import FetchCache
+from data.fetcher_router import DataFetcherRouter
+
+
+def make_frame() -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC", name="Date")
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+    df.attrs["source"] = "binance"
+    return df
+
+
+def test_hit_returns_an_isolated_copy():
+    cache = FetchCache(ttl=60)
+    fetch = MagicMock(return_value=make_frame())
+
+    first = cache.get("k", fetch)
+    first["SMA_2"] = first["close"].rolling(2).mean()
+    first.loc[first.index[0], "close"] = -1.0
+    first.attrs["source"] = "mutated"
+    second = cache.get("k", fetch)
+
+    assert fetch.call_count == 1
+    pd.testing.assert_frame_equal(second, make_frame())
+    assert second.attrs["source"] == "binance"
+
+
+def test_entries_expire_after_the_ttl():
+    cache = FetchCache(ttl=60)
+    fetch = MagicMock(return_value=make_frame())
+    with patch("data.fetch_cache.time.monotonic", return_value=1000.0):
+        cache.get("k", fetch)
+        cache.get("k", fetch)
+    with patch("data.fetch_cache.time.monotonic", return_value=1061.0):
+        cache.get("k", fetch)
+    assert fetch.call_count == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FetchCache(ttl=60, max_entries=2)
+    fetch = MagicMock(side_effect=lambda: make_frame())
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    cache.get("a", fetch)  # "b" becomes the least recently used
+    cache.get("c", fetch)
+
+    cache.get("a", fetch)
+    assert fetch.call_count == 3
+    cache.get("b", fetch)
+    assert fetch.call_count == 4
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    cache = FetchCache(ttl=None)
+    calls = []
+
+    def fetch():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return make_frame()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        frames = list(executor.map(lambda _: cache.get("k", fetch), range(8)))
+
+    assert len(calls) == 1
+    for df in frames:
+        pd.testing.assert_frame_equal(df, make_frame())
+    # Without a ttl nothing is kept once the fetch is over
+    cache.get("k", fetch)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    cache = FetchCache(ttl=60)
+
+    def fail():
+        time.sleep(0.05)
+        raise RuntimeError("API Down")
+
+    fetch = MagicMock(side_effect=fail)
+
+    def request(_):
+        try:
+            return cache.get("k", fetch)
+        except RuntimeError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(request, range(4)))
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert fetch.call_count == 1
+    fetch.side_effect = None
+    fetch.return_value = make_frame()
+    pd.testing.assert_frame_equal(cache.get("k", fetch), make_frame())
+
+
+def test_concurrent_identical_coroutines_share_one_fetch():
+    cache = FetchCache(ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return make_frame()
+
+    async def scan():
+        return await asyncio.gather(*(cache.get_async("k", fetch) for _ in range(5)))
+
+    frames = asyncio.run(scan())
+    assert len(calls) == 1
+    assert len({id(df) for df in frames}) == 5
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError, match="ttl"):
+        FetchCache(ttl=-1)
+    with pytest.raises(ValueError, match="max_entries"):
+        FetchCache(max_entries=0)
+
+
+@patch("data.fetcher_router.CCXTDataFetcher")
+def test_router_serves_identical_requests_from_memory(mock_ccxt_class):
+    mock_ccxt = mock_ccxt_class.return_value
+    mock_ccxt.fetch.return_value = make_frame()
+    router = DataFetcherRouter(cache_ttl=60)
+
+    df = router.fetch("BTC/USDT", interval="1h")
+    df["SMA_2"] = df["close"].rolling(2).mean()
+    again = router.fetch("binance:BTC/USDT", interval="1h")
+    router.fetch("BTC/USDT", interval="1d")
+
+    assert mock_ccxt.fetch.call_count == 2
+    assert "SMA_2" not in again.columns
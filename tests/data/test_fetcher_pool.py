@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from data.fetcher_pool import FetcherPool
+from data.fetcher_router import DataFetcherRouter
+
+
+def test_checkout_reuses_released_fetchers():
+    pool = FetcherPool(object, size=2)
+    with pool.checkout() as first:
+        pass
+    with pool.checkout() as second:
+        assert second is first
+
+
+def test_checkout_never_exceeds_the_size():
+    created = []
+    pool = FetcherPool(lambda: created.append(object()) or created[-1], size=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work(_):
+        with pool.checkout():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(work, range(12)))
+
+    assert len(created) == 2
+    assert peak[0] == 2
+
+
+def test_failing_factory_frees_its_slot():
+    factory = MagicMock(side_effect=[RuntimeError("boom"), "fetcher"])
+    pool = FetcherPool(factory, size=1)
+    with pytest.raises(RuntimeError):
+        with pool.checkout():
+            pass
+    with pool.checkout() as fetcher:
+        assert fetcher == "fetcher"
+
+
+def test_non_positive_size_raises():
+    with pytest.raises(ValueError, match="pool size"):
+        FetcherPool(object, size=0)
+
+
+@patch("data.fetcher_router.CCXTDataFetcher")
+def test_router_threads_use_distinct_instances(mock_ccxt_class):
+    instances = []
+    lock = threading.Lock()
+
+    def new_fetcher(**kwargs):
+        fetcher = MagicMock()
+        def fetch(**request):
+            with lock:
+                assert not fetcher.busy
+                fetcher.busy = True
+            time.sleep(0.01)
+            fetcher.busy = False
+            return pd.DataFrame()
+        fetcher.busy = False
+        fetcher.fetch.side_effect = fetch
+        instances.append(fetcher)
+        return fetcher
+
+    mock_ccxt_class.side_effect = new_fetcher
+    router = DataFetcherRouter(pool_size=3)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda i: router.fetch(f"T{i}/USDT"), range(12)))
+
+    assert len(instances) == 3
+    assert router._ccxt_fetchers["binance"] is instances[0]
+    assert sum(fetcher.fetch.call_count for fetcher in instances) == 12
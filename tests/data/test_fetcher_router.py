@@ -5,7 +5,8 @@ from data.fetcher_router import DataFetcherRouter
 
 @pytest.fixture
 def test_router():
-    return DataFetcherRouter()
+    # Without the memory cache, fetch() returns the fetcher's frame itself
+    return DataFetcherRouter(cache_ttl=None)
 
 @patch("data.fetcher_router.CCXTDataFetcher")
 def test_fetch_auto_routes_to_default_ccxt(mock_ccxt_class, test_router):
@@ -36,3 +37,25 @@ def test_fetch_fails_fast_on_error(mock_ccxt_class, test_router):
     
     with pytest.raises(RuntimeError, match="Fatal Error: CCXT"):
         test_router.fetch("BTC/USDT")
+
+def test_resolve_splits_exchange_prefix(test_router):
+    assert test_router.resolve("BTC/USDT") == ("binance", "BTC/USDT")
+    assert test_router.resolve("Kraken:ETH/USD") == ("kraken", "ETH/USD")
+
+@patch("data.fetcher_router.CCXTDataFetcher")
+def test_fetch_recent_requests_just_enough_candles(mock_ccxt_class, test_router):
+    mock_ccxt_class.interval_seconds.return_value = 3600
+    mock_ccxt = mock_ccxt_class.return_value
+
+    before = pd.Timestamp.now(tz="UTC")
+    test_router.fetch_recent("BTC/USDT", bars=100, interval="1h")
+
+    kwargs = mock_ccxt.fetch.call_args.kwargs
+    assert kwargs["interval"] == "1h"
+    start = pd.Timestamp(kwargs["start"], tz="UTC")
+    expected = before - pd.Timedelta(hours=101)
+    assert abs(start - expected) < pd.Timedelta(minutes=1)
+
+def test_fetch_recent_rejects_non_positive_bars(test_router):
+    with pytest.raises(ValueError, match="bars must be positive"):
+        test_router.fetch_recent("BTC/USDT", bars=0)
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from data.rate_limiter import TokenBucket, exchange_limiter
+
+
+def test_acquire_spaces_requests_across_threads():
+    bucket = TokenBucket(rate=50)
+    stamps = []
+    lock = threading.Lock()
+
+    def request():
+        bucket.acquire()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Individual gaps include thread scheduling jitter: only the total span is reliable
+    stamps.sort()
+    assert stamps[-1] - stamps[0] >= 5 * 0.02 - 0.01
+
+
+def test_acquire_async_shares_the_budget_across_coroutines():
+    bucket = TokenBucket(rate=50)
+
+    async def scan():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+        return time.monotonic() - start
+
+    assert asyncio.run(scan()) >= 5 * 0.02 - 0.01
+
+
+def test_costly_request_delays_the_next_ones():
+    bucket = TokenBucket(rate=100)
+    assert bucket.reserve(5) == pytest.approx(0.04, abs=0.005)
+    assert bucket.reserve(1) == pytest.approx(0.05, abs=0.005)
+
+
+def test_capacity_allows_bursts():
+    bucket = TokenBucket(rate=10, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() > 0
+
+
+def test_install_routes_the_exchange_throttle():
+    bucket = TokenBucket(rate=100)
+    exchange = SimpleNamespace(throttle=None)
+    bucket.install(exchange)
+
+    start = time.monotonic()
+    exchange.throttle(5)  # CCXT passes the endpoint's cost
+    assert time.monotonic() - start >= 0.035
+
+
+def test_exchange_limiter_is_shared_per_exchange():
+    assert exchange_limiter("test-shared", 50) is exchange_limiter("test-shared", 50)
+    assert exchange_limiter("test-shared", 50).rate == 20
+    assert exchange_limiter("test-other", 50) is not exchange_limiter("test-shared", 50)
+
+
+def test_non_positive_rate_raises():
+    with pytest.raises(ValueError, match="rate"):
+        TokenBucket(rate=0)
@@ -0,0 +1,68 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from operator import methodcaller
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.shared_frame import SharedFrame
+
+
+def make_frame(n: int = 200) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC", name="Datetime")
+    df = pd.DataFrame({
+        "close": np.linspace(100, 120, n),
+        "volume": np.arange(n, dtype=np.int64),
+        "SMA_20": np.linspace(99, 119, n),
+    }, index=index)
+    df["source"] = "binance"
+    return df
+
+
+def test_frame_is_a_read_only_view():
+    df = make_frame()
+    with SharedFrame(df) as shared:
+        frame = shared.frame()
+        pd.testing.assert_frame_equal(frame, df, check_freq=False)
+        assert frame is shared.frame()
+        with pytest.raises(ValueError):
+            frame["close"].to_numpy()[0] = 0.0
+
+
+def test_pickle_only_carries_the_layout():
+    df = make_frame(100_000)
+    with SharedFrame(df) as shared:
+        payload = pickle.dumps(shared)
+        assert len(payload) < 2_000 < shared.nbytes
+        pd.testing.assert_frame_equal(pickle.loads(payload).frame(), df, check_freq=False)
+
+
+def test_close_unlinks_the_segment():
+    shared = SharedFrame(make_frame())
+    name = shared.name
+    shared.close()
+
+    if os.path.isdir("/dev/shm"):
+        assert not os.path.exists(os.path.join("/dev/shm", name))
+    with pytest.raises(RuntimeError):
+        shared.frame()
+    shared.close()
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_workers_attach_without_unlinking(method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} start method unavailable")
+    df = make_frame()
+    with SharedFrame(df) as shared:
+        context = multiprocessing.get_context(method)
+        # Worker processes exit in between: the segment must survive them
+        for _ in range(2):
+            with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+                frames = list(pool.map(methodcaller("frame"), [shared] * 3))
+            for frame in frames:
+                pd.testing.assert_frame_equal(frame, df, check_freq=False)
+        pd.testing.assert_frame_equal(shared.frame(), df, check_freq=False)
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+import pandas as pd
+from features.technical.bank import BankFeature, FeatureBank, parse_bank_name
+from features.technical import SMAFeature, EMAFeature, RSIFeature
+from features.pipeline import FeaturePipeline
+from core.monkeys.trend_monkey import TrendMonkey
+
+
+@pytest.fixture
+def market():
+    rng = np.random.default_rng(9)
+    close = 30000 + np.cumsum(rng.normal(0, 50, 3000))
+    close[700:705] = np.nan
+    close[1500:1560] = close[1499]  # flat market: constant windows and no loss
+    return pd.DataFrame({"close": close})
+
+
+@pytest.mark.parametrize("window", [2, 8, 21, 50, 200])
+def test_bank_matches_single_window_features(market, window):
+    bank = FeatureBank(market)
+    expected = market.copy()
+    for feature in [SMAFeature(window), EMAFeature(window), RSIFeature(window)]:
+        expected = feature.compute(expected)
+
+    for name in (f"SMA_{window}", f"EMA_{window}", f"RSI_{window}"):
+        pd.testing.assert_series_equal(bank[name], expected[name], rtol=1e-9)
+    # Exact values on constant windows, like the rolling kernel
+    assert (bank[f"SMA_{window}"].iloc[1560 - 1] == market["close"].iloc[1499]) == (window <= 60)
+    assert (bank[f"RSI_{window}"].iloc[1559] == 100.0) == (window <= 60)
+
+
+def test_columns_are_lazy_and_cached(market):
+    bank = FeatureBank(market)
+    first = bank.column_values("SMA_21")
+    assert bank.column_values("SMA_21") is first
+    assert "SMA_50" not in bank._columns
+
+    frame = bank.frame(["SMA_8", "SMA_21", "RSI_14"])
+    assert list(frame.columns) == ["SMA_8", "SMA_21", "RSI_14"]
+    np.testing.assert_array_equal(frame["SMA_21"].to_numpy(), first)
+
+
+def test_unknown_names_are_rejected(market):
+    assert "SMA_21" in FeatureBank(market)
+    assert "ATR_14" not in FeatureBank(market)
+    with pytest.raises(KeyError, match="not a feature bank column"):
+        parse_bank_name("SMA_0")
+    with pytest.raises(KeyError, match="not a feature bank column"):
+        BankFeature(["SMA_8", "MACD_12"])
+    with pytest.raises(KeyError, match="missing from DataFrame"):
+        FeatureBank(market, column="open")
+
+
+def test_trend_monkey_consumes_bank_columns(market):
+    df = market.dropna().reset_index(drop=True)
+    bank = FeatureBank(df)
+    view = bank.with_columns(df, ["SMA_8", "SMA_21"])
+    reference = SMAFeature(21).compute(SMAFeature(8).compute(df.copy()))
+
+    monkey = TrendMonkey("Trend", fast_col="SMA_8", slow_col="SMA_21")
+    assert monkey.analyze(view) == monkey.analyze(reference)
+    assert "SMA_8" not in df.columns
+
+
+def test_bank_feature_in_pipeline(market):
+    names = ["SMA_8", "SMA_21", "EMA_20", "EMA_50", "RSI_14"]
+    feature = BankFeature(names)
+    pipeline = FeaturePipeline().add_feature(feature)
+    df = market.iloc[1000:].reset_index(drop=True)
+    res = pipeline.generate(df)
+
+    assert feature.warmup == 20
+    assert feature.lookback == 200
+    assert list(res.columns) == ["close"] + names
+    assert res.index[0] == 20
+
+    # Streaming form: the single-window streams
+    stream = pipeline.stream(df.iloc[:1500])
+    rows = pd.DataFrame([stream.update({"close": c}) for c in df["close"].iloc[1500:]], index=df.index[1500:])
+    pd.testing.assert_frame_equal(rows, res[names].loc[rows.index], rtol=1e-9)
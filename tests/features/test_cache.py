@@ -0,0 +1,114 @@
+import pytest
+import pandas as pd
+from features.cache import FeatureCache
+from features.pipeline import FeaturePipeline
+from features.base_feature import BaseFeature
+from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+from tests.conftest import random_ohlcv
+
+
+def make_pipeline(sma_window: int = 20) -> FeaturePipeline:
+    pipeline = FeaturePipeline()
+    for feature in [SMAFeature(sma_window), EMAFeature(12), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14)]:
+        pipeline.add_feature(feature)
+    return pipeline
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FeatureCache(root=str(tmp_path))
+
+
+def test_first_run_equals_generate(cache):
+    df = random_ohlcv(600, 4)
+    pipeline = make_pipeline()
+    pd.testing.assert_frame_equal(cache.generate(pipeline, df, "BTC/USDT", "binance", "1h"), pipeline.generate(df))
+
+
+def test_incremental_run_only_computes_new_rows(cache, monkeypatch):
+    df = random_ohlcv(600, 4)
+    pipeline = make_pipeline()
+    cache.generate(pipeline, df.iloc[:500], "BTC/USDT", "binance", "1h")
+
+    # New candles are appended: the features must not be recomputed in batch
+    def fail(*args, **kwargs):
+        raise AssertionError("full recomputation")
+    monkeypatch.setattr(FeaturePipeline, "compute_features", fail)
+    updated = cache.generate(pipeline, df.iloc[:520], "BTC/USDT", "binance", "1h")
+    again = cache.generate(pipeline, df.iloc[:540], "BTC/USDT", "binance", "1h")
+    monkeypatch.undo()
+
+    for result, stop in ((updated, 520), (again, 540)):
+        pd.testing.assert_frame_equal(result, pipeline.generate(df.iloc[:stop]), check_exact=True)
+        assert result.index[-1] == df.index[stop - 1]
+
+
+def test_sliding_window_equals_generate(cache):
+    """A window moving forward changes the EMA seed: the cache must not reuse older history."""
+    daily = random_ohlcv(400, 4, freq="D")
+    pipeline = make_pipeline()
+    for start in range(0, 5):
+        raw = daily.iloc[start:start + 180]
+        result = cache.generate(pipeline, raw, "BTC/USDT", "binance", "1d")
+        pd.testing.assert_frame_equal(result, pipeline.generate(raw), check_exact=True)
+
+
+def test_forming_candle_is_not_stored(cache):
+    df = random_ohlcv(600, 4)
+    pipeline = make_pipeline()
+    cache.generate(pipeline, df.iloc[:500], "BTC/USDT", "binance", "1h")
+
+    # The last candle of the previous run was still forming: its final values differ
+    revised = df.iloc[:510].copy()
+    revised.iloc[499, revised.columns.get_loc("close")] += 5.0
+    result = cache.generate(pipeline, revised, "BTC/USDT", "binance", "1h")
+    pd.testing.assert_frame_equal(result, pipeline.generate(revised), rtol=1e-10)
+
+
+@pytest.mark.parametrize("change", ["params", "data", "earlier_start", "later_start", "version"])
+def test_invalidation_triggers_full_recomputation(cache, monkeypatch, change):
+    df = random_ohlcv(600, 4)
+    pipeline = make_pipeline()
+    cache.generate(pipeline, df.iloc[100:500], "BTC/USDT", "binance", "1h")
+
+    raw = df.iloc[100:510].copy()
+    if change == "params":
+        pipeline = make_pipeline(sma_window=30)
+    elif change == "data":
+        raw.iloc[50, raw.columns.get_loc("close")] += 1.0
+    elif change == "earlier_start":
+        raw = df.iloc[:510]
+    elif change == "later_start":
+        raw = df.iloc[110:510]
+    else:
+        monkeypatch.setattr(SMAFeature, "VERSION", SMAFeature.VERSION + 1)
+
+    calls = []
+    original = FeaturePipeline.compute_features
+    monkeypatch.setattr(FeaturePipeline, "compute_features", lambda self, d: calls.append(1) or original(self, d))
+    result = cache.generate(pipeline, raw, "BTC/USDT", "binance", "1h")
+    assert calls == [1]
+    pd.testing.assert_frame_equal(result, pipeline.generate(raw))
+
+
+def test_entries_are_per_ticker_and_interval(cache):
+    df = random_ohlcv(600, 4)
+    pipeline = make_pipeline()
+    btc = cache.generate(pipeline, df.iloc[:400], "BTC/USDT", "binance", "1h")
+    doubled = df.iloc[:400].copy()
+    doubled[["open", "high", "low", "close"]] *= 2
+    eth = cache.generate(pipeline, doubled, "ETH/USDT", "binance", "1h")
+    assert not btc.equals(eth)
+    pd.testing.assert_frame_equal(cache.generate(pipeline, doubled, "ETH/USDT", "binance", "1h"), eth)
+
+
+def test_feature_without_stream_is_not_cached(cache, tmp_path):
+    class Constant(BaseFeature):
+        def compute(self, df):
+            df[self.name] = 1.0
+            return df
+
+    pipeline = FeaturePipeline().add_feature(Constant("ONE"))
+    df = random_ohlcv(20, 4)
+    pd.testing.assert_frame_equal(cache.generate(pipeline, df, "X", "binance", "1h"), pipeline.generate(df))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+from features.context import FeatureContext, feature_signature
+from features.technical import EMAFeature, MACDFeature, SMAFeature, BollingerFeature, RSIFeature, ATRFeature
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    return pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+
+
+def test_node_is_computed_once(df):
+    context = FeatureContext(df)
+    calls = []
+    def compute():
+        calls.append(1)
+        return df["close"] * 2
+
+    first = context.node(("double", "close"), compute)
+    second = context.node(("double", "close"), compute)
+    assert first is second
+    assert len(calls) == 1
+    assert ("double", "close") in context
+
+
+def test_missing_column_raises(df):
+    with pytest.raises(KeyError, match="Column 'open' missing"):
+        FeatureContext(df).ema("open", 12)
+
+
+def test_features_share_intermediates(df):
+    context = FeatureContext(df)
+    EMAFeature(12).compute_from(df, context)
+    SMAFeature(20).compute_from(df, context)
+    ema = context.ema("close", 12)
+    middle = context.rolling_mean("close", 20)
+
+    # MACD reuses EMA_12, Bollinger reuses the SMA_20 rolling mean
+    MACDFeature().compute_from(df, context)
+    BollingerFeature(20).compute_from(df, context)
+    assert context.ema("close", 12) is ema
+    assert context.rolling_mean("close", 20) is middle
+
+    # RSI and ATR share the close diff / shift
+    RSIFeature(14).compute_from(df, context)
+    ATRFeature(14).compute_from(df, context)
+    assert ("diff", "close", 1) in context
+    assert ("shift", "close", 1) in context
+
+
+def test_feature_signature():
+    assert feature_signature(SMAFeature(20)) == feature_signature(SMAFeature(20))
+    assert feature_signature(SMAFeature(20)) != feature_signature(SMAFeature(50))
+    assert feature_signature(SMAFeature(20)) != feature_signature(EMAFeature(20))
+
+
+def test_node_is_computed_once_across_threads(df):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    context = FeatureContext(df)
+    calls = []
+    barrier = threading.Barrier(8)
+    def compute():
+        calls.append(1)
+        time.sleep(0.01)
+        return df["close"] * 2
+
+    def request(_):
+        barrier.wait()
+        return context.node(("double", "close"), compute)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(request, range(8)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
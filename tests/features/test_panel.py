@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from features.panel import Panel
+from features.pipeline import FeaturePipeline, generate_grouped
+from features.technical import (
+    ATRFeature, BankFeature, BollingerFeature, EMAFeature, MACDFeature, RSIFeature, SMAFeature,
+)
+from tests.conftest import random_ohlcv
+
+
+def make_pipeline(fast: int = 20, slow: int = 50) -> FeaturePipeline:
+    pipeline = FeaturePipeline()
+    for feature in [
+        SMAFeature(fast), SMAFeature(slow), EMAFeature(12), EMAFeature(26), RSIFeature(14),
+        MACDFeature(), BollingerFeature(20), ATRFeature(14),
+    ]:
+        pipeline.add_feature(feature)
+    return pipeline
+
+
+def test_panel_matches_generate_per_symbol():
+    frames = {
+        "BTC/USDT": random_ohlcv(300, 1, freq="D"),
+        # Listed later and delisted earlier: leading and trailing NaN in the panel
+        "ETH/USDT": random_ohlcv(200, 2, freq="D", start="2024-02-15"),
+        "SOL/USDT": random_ohlcv(120, 3, freq="D"),
+    }
+    frames["SOL/USDT"].iloc[40, frames["SOL/USDT"].columns.get_loc("close")] = np.nan
+    pipeline = make_pipeline()
+
+    results = pipeline.generate_panel(frames)
+
+    assert list(results) == list(frames)
+    for symbol, raw_df in frames.items():
+        pd.testing.assert_frame_equal(results[symbol], pipeline.generate(raw_df), check_exact=True)
+
+
+def test_panel_aligns_on_union_index():
+    panel = Panel.from_frames({"A": random_ohlcv(5, 1, freq="D"), "B": random_ohlcv(3, 2, freq="D", start="2024-01-03")})
+
+    assert len(panel.index) == 5
+    assert panel.spans == {"A": (0, 5), "B": (2, 5)}
+    assert panel["close"]["B"].isna().sum() == 2
+    assert "close" in panel and "source" in panel.columns
+
+
+def test_panel_rejects_gaps():
+    gapped = random_ohlcv(10, 2, freq="D").drop(index=random_ohlcv(10, 2, freq="D").index[4])
+
+    with pytest.raises(ValueError, match="gaps"):
+        Panel.from_frames({"A": random_ohlcv(10, 1, freq="D"), "B": gapped})
+
+
+def test_panel_falls_back_per_symbol():
+    frames = {"A": random_ohlcv(120, 1, freq="D"), "B": random_ohlcv(120, 2, freq="D")}
+    frames["B"] = frames["B"].drop(index=frames["B"].index[60])
+    pipeline = FeaturePipeline().add_feature(BankFeature(["SMA_5", "RSI_14"])).add_feature(SMAFeature(10))
+
+    results = pipeline.generate_panel(frames)
+
+    for symbol, raw_df in frames.items():
+        pd.testing.assert_frame_equal(results[symbol], pipeline.generate(raw_df), check_exact=True)
+
+
+def test_generate_grouped_runs_one_panel_per_config(monkeypatch):
+    frames = {symbol: random_ohlcv(150, seed, freq="D") for seed, symbol in enumerate(["A", "B", "C", "D"])}
+    pipelines = {"A": make_pipeline(), "B": make_pipeline(8, 21), "C": make_pipeline(), "D": make_pipeline(8, 21)}
+    calls = []
+    original = FeaturePipeline.generate_panel
+
+    def spy(self, group):
+        calls.append(list(group))
+        return original(self, group)
+
+    monkeypatch.setattr(FeaturePipeline, "generate_panel", spy)
+    results = generate_grouped(pipelines, frames)
+
+    assert calls == [["A", "C"], ["B", "D"]]
+    assert list(results) == ["A", "B", "C", "D"]
+    for symbol, raw_df in frames.items():
+        pd.testing.assert_frame_equal(results[symbol], pipelines[symbol].generate(raw_df))
+
+
+def test_generate_grouped_requires_a_pipeline_per_symbol():
+    with pytest.raises(KeyError):
+        generate_grouped({}, {"A": random_ohlcv(10, 1, freq="D")})
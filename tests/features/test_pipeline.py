@@ -36,3 +36,172 @@ def test_pipeline_drop_na():
     df = pd.DataFrame({"close": [1, 2, 3]})
     res = pipeline.generate(df)
     assert len(res) == 1 # Only row 1 (the second row) doesn't have NA
+
+def test_pipeline_stream_matches_generate():
+    import numpy as np
+    from features.technical import SMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+
+    rng = np.random.default_rng(2)
+    close = 100 + np.cumsum(rng.normal(0, 1, 400))
+    df = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close, "volume": 1.0})
+    pipeline = FeaturePipeline()
+    for feature in [SMAFeature(20), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14)]:
+        pipeline.add_feature(feature)
+
+    stream = pipeline.stream(df.iloc[:250])
+    assert stream.inputs == ["close", "high", "low"]
+    rows = [stream.update(bar) for _, bar in df.iloc[250:].iterrows()]
+    streamed = pd.DataFrame(rows, index=df.index[250:])
+
+    expected = pipeline.generate(df)[streamed.columns].iloc[-150:]
+    pd.testing.assert_frame_equal(streamed, expected, rtol=1e-10)
+
+def make_ohlc(n: int = 300, seed: int = 3) -> pd.DataFrame:
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({"high": close + 1, "low": close - 1, "close": close, "volume": 1.0})
+
+def test_pipeline_generate_matches_standalone_features():
+    from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+
+    features = [SMAFeature(20), EMAFeature(12), EMAFeature(26), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14)]
+    pipeline = FeaturePipeline()
+    for feature in features:
+        pipeline.add_feature(feature)
+
+    df = make_ohlc()
+    expected = df.copy()
+    for feature in features:
+        expected = feature.compute(expected)
+
+    # Shared intermediates must not change a single bit of the output
+    pd.testing.assert_frame_equal(pipeline.generate(df), expected.dropna(), check_exact=True)
+
+def test_pipeline_deduplicates_features(monkeypatch):
+    from features.technical import SMAFeature, MACDFeature
+
+    calls = []
+    original = MACDFeature.compute_from
+    def counting(self, df, context):
+        calls.append(self)
+        return original(self, df, context)
+    monkeypatch.setattr(MACDFeature, "compute_from", counting)
+
+    pipeline = FeaturePipeline()
+    pipeline.add_feature(SMAFeature(20)).add_feature(MACDFeature()).add_feature(SMAFeature(20)).add_feature(MACDFeature())
+    assert pipeline.get_feature_name() == ["SMA_20", "MACD_12_26_9"]
+
+    res = pipeline.generate(make_ohlc())
+    assert len(calls) == 1
+    assert list(pipeline.stream().columns) == ["SMA_20", "MACD_line", "MACD_signal", "MACD_histogram"]
+    assert "SMA_20" in res.columns
+
+def test_generate_chunked_equals_generate(tmp_path):
+    from data.columnar import iter_chunks, read_frame, write_frame
+    from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+
+    df = make_ohlc(n=1000)
+    df.index = pd.date_range("2024-01-01", periods=len(df), freq="min", tz="UTC")
+    df.iloc[400:405, df.columns.get_loc("close")] = float("nan")
+    df["source"] = "binance"
+    pipeline = FeaturePipeline()
+    for feature in [SMAFeature(20), EMAFeature(12), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14)]:
+        pipeline.add_feature(feature)
+
+    write_frame(df, str(tmp_path / "raw"))
+    rows = pipeline.generate_chunked(iter_chunks(str(tmp_path / "raw"), 64), str(tmp_path / "out"))
+
+    expected = pipeline.generate(df)
+    assert rows == len(expected)
+    pd.testing.assert_frame_equal(read_frame(str(tmp_path / "out")), expected, check_exact=True, check_freq=False)
+
+    with pytest.raises(ValueError, match="is not empty"):
+        pipeline.generate_chunked([df], str(tmp_path / "out"))
+
+def test_generate_chunked_rejects_features_without_streaming_form(tmp_path):
+    from features.technical import SMAFeature
+
+    pipeline = FeaturePipeline().add_feature(SMAFeature(5)).add_feature(DummyFeature("F1"))
+    assert not pipeline.streams
+    with pytest.raises(ValueError, match="F1"):
+        pipeline.generate_chunked([make_ohlc()], str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
+
+def test_declared_warmup_matches_leading_nans():
+    from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+
+    df = make_ohlc(n=200)
+    for feature in [SMAFeature(20), EMAFeature(12), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14)]:
+        out = feature.compute(df.copy())
+        columns = [c for c in out.columns if c not in df.columns]
+        leading = max(int(out[c].isna().cumprod().sum()) for c in columns)
+        assert feature.warmup == leading, feature.name
+        assert feature.lookback > feature.warmup
+
+def test_pipeline_lookback_and_warmup_trim():
+    from features.technical import SMAFeature, EMAFeature, MACDFeature
+
+    pipeline = FeaturePipeline().add_feature(SMAFeature(50)).add_feature(EMAFeature(12)).add_feature(MACDFeature())
+    assert pipeline.warmup == 49
+    # MACD: converged slow EMA (4 * 26) then converged signal EMA (4 * 9)
+    assert pipeline.lookback == 104 + 36
+
+    df = make_ohlc()
+    res = pipeline.generate(df)
+    pd.testing.assert_frame_equal(res, pipeline.compute_features(df).dropna())
+    assert res.index[0] == df.index[49]
+
+    # Gaps in the raw data fall back to dropping NaN rows
+    gappy = df.copy()
+    gappy.iloc[100, gappy.columns.get_loc("close")] = float("nan")
+    pd.testing.assert_frame_equal(pipeline.generate(gappy), pipeline.compute_features(gappy).dropna())
+
+def test_ema_convergence_is_configurable():
+    from features.technical import EMAFeature
+
+    feature = EMAFeature(20)
+    assert feature.lookback == 80
+    feature.EMA_CONVERGENCE = 6
+    assert feature.lookback == 120
+    # Undeclared features make the pipeline lookback unknown
+    assert FeaturePipeline().add_feature(feature).add_feature(DummyFeature("F1")).lookback is None
+
+class RatioFeature(BaseFeature):
+    """Compute-only feature reading a column produced by an earlier feature."""
+    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
+        df[self.name] = df["close"] / df["SMA_20"]
+        return df
+
+def test_threaded_generate_equals_sequential():
+    from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+
+    features = [
+        SMAFeature(20), RatioFeature("RATIO"), EMAFeature(12), RSIFeature(14),
+        MACDFeature(), BollingerFeature(20), ATRFeature(14), SMAFeature(50),
+    ]
+    sequential, threaded = FeaturePipeline(), FeaturePipeline(workers=4)
+    for feature in features:
+        sequential.add_feature(feature)
+        threaded.add_feature(feature)
+
+    df = make_ohlc(1000)
+    expected = sequential.generate(df)
+    result = threaded.generate(df)
+
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+    assert "RATIO" not in df.columns
+
+def test_produce_does_not_modify_the_frame():
+    from features.context import FeatureContext
+    from features.technical import MACDFeature, RSIFeature
+
+    df = make_ohlc()
+    context = FeatureContext(df)
+    assert list(MACDFeature().produce(df, context)) == ["MACD_line", "MACD_signal", "MACD_histogram"]
+    assert list(RSIFeature(14).produce(df, context)) == ["RSI_14"]
+    # Compute-only features fall back to compute() on a copy
+    assert not DummyFeature("F1").produces_columns
+    assert list(DummyFeature("F1").produce(df, context)) == ["F1"]
+    assert list(df.columns) == ["high", "low", "close", "volume"]
@@ -0,0 +1,105 @@
+import math
+import pytest
+import numpy as np
+import pandas as pd
+from features.streaming import ExponentialMean, RollingMean, RollingStd
+from features.technical import SMAFeature, EMAFeature, RSIFeature, MACDFeature, BollingerFeature, ATRFeature
+from features.base_feature import BaseFeature
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    values = 30000 + np.cumsum(rng.normal(0, 50, 3000))
+    values[[100, 101, 2500]] = np.nan
+    values[1000:1030] = values[999]  # flat stretch
+    return pd.Series(values)
+
+
+def test_rolling_mean_matches_pandas(prices):
+    mean = RollingMean(20)
+    streamed = [mean.update(v) for v in prices]
+    np.testing.assert_allclose(streamed, prices.rolling(20).mean(), rtol=1e-12, equal_nan=True)
+
+
+def test_rolling_std_matches_pandas(prices):
+    std = RollingStd(20)
+    streamed = [std.update(v) for v in prices]
+    np.testing.assert_allclose(streamed, prices.rolling(20).std(), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_exponential_mean_matches_pandas_exactly(prices):
+    ema = ExponentialMean(12)
+    streamed = [ema.update(v) for v in prices]
+    expected = prices.ewm(span=12, adjust=False).mean()
+    assert np.array_equal(streamed, expected.to_numpy(), equal_nan=True)
+
+
+def test_exponential_mean_leading_nan():
+    series = pd.Series([math.nan, math.nan, 1.0, 2.0, math.nan, 4.0])
+    ema = ExponentialMean(4)
+    np.testing.assert_allclose(
+        [ema.update(v) for v in series], series.ewm(span=4, adjust=False).mean(), rtol=1e-12, equal_nan=True
+    )
+
+
+def test_invalid_windows():
+    with pytest.raises(ValueError, match="window must be positive"):
+        RollingMean(0)
+    with pytest.raises(ValueError, match="span"):
+        ExponentialMean(0)
+
+
+@pytest.mark.parametrize("feature, columns", [
+    (SMAFeature(window=20), ["SMA_20"]),
+    (EMAFeature(window=12), ["EMA_12"]),
+    (RSIFeature(window=14), ["RSI_14"]),
+    (ATRFeature(window=14), ["ATR_14"]),
+    (BollingerFeature(window=20), ["BB_middle_20", "BB_upper_20", "BB_lower_20"]),
+    (MACDFeature(), ["MACD_line", "MACD_signal", "MACD_histogram"]),
+])
+def test_stream_matches_compute(feature, columns):
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 500))
+    df = pd.DataFrame({"high": close + rng.uniform(0, 2, 500), "low": close - rng.uniform(0, 2, 500), "close": close})
+    expected = feature.compute(df.copy())[columns]
+
+    # Warm up on the first 300 candles, then stream the rest one bar at a time
+    stream = feature.stream(df.iloc[:300])
+    streamed = pd.DataFrame([stream.update(bar) for _, bar in df.iloc[300:].iterrows()], index=df.index[300:])
+    pd.testing.assert_frame_equal(streamed, expected.iloc[300:], rtol=1e-10)
+
+
+@pytest.mark.parametrize("feature", [
+    SMAFeature(5), EMAFeature(8), RSIFeature(14), MACDFeature(), BollingerFeature(20), ATRFeature(14),
+])
+def test_update_and_update_frame_agree(feature):
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    df = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+
+    by_frame = feature.stream(df.iloc[:100]).update_frame(df.iloc[100:])
+    stream = feature.stream(df.iloc[:100])
+    by_bar = pd.DataFrame([stream.update(bar) for _, bar in df.iloc[100:].iterrows()], index=df.index[100:])
+
+    pd.testing.assert_frame_equal(by_frame, by_bar)
+    assert stream.last == by_bar.iloc[-1].to_dict()
+
+
+def test_missing_bar_field():
+    stream = ATRFeature(3).stream()
+    with pytest.raises(KeyError, match="'low' missing from bar"):
+        stream.update({"high": 1.0, "close": 1.0})
+    with pytest.raises(KeyError, match="missing from DataFrame"):
+        stream.update_frame(pd.DataFrame({"close": [1.0]}))
+
+
+def test_feature_without_streaming_form():
+    class StaticFeature(BaseFeature):
+        def compute(self, df):
+            return df
+
+    assert not StaticFeature("STATIC").streams
+    assert ATRFeature(3).streams
+    with pytest.raises(NotImplementedError, match="no streaming form"):
+        StaticFeature("STATIC").stream()